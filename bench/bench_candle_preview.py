@@ -0,0 +1,184 @@
+"""Render time of the overview chart preview, redraw-all versus retained scene.
+
+Usage: python bench/bench_candle_preview.py [--frames 2000] [--candles 40] [--tk]
+
+Frames follow what the panel sees: most move the live last candle, some
+roll a new hourly candle in, some repeat the previous data, and a few
+resize the canvas. The old path deleted the canvas and created grid,
+labels, wicks and bodies on every frame; ``CandlePreview`` keeps its
+items and only rebuilds when the candle count or size changes. Canvas
+calls are counted on a fake canvas, or on a real one with ``--tk``
+(needs a display).
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fake_tk import Counted, FakeCanvas  # noqa: E402
+from crypto_dashboard.components.candle_preview import CandlePreview  # noqa: E402
+from crypto_dashboard.components.overview import OverviewPanel  # noqa: E402
+
+HOUR_MS = 3_600_000
+SIZES = [(320, 220), (480, 240)]
+KINDS = ("tick", "roll", "same", "resize")
+
+
+def redraw_preview(canvas, candles, time_labels):
+    """The refresh as it was: clear the canvas and draw the whole chart anew."""
+    canvas.delete("all")
+    if not candles:
+        return
+    canvas.update_idletasks()
+    w = canvas.winfo_width() or 320
+    h = canvas.winfo_height() or 220
+    margin = 18
+    usable_w = max(10, w - margin * 2)
+    usable_h = max(10, h - margin * 2)
+    max_price = max(c["high"] for c in candles)
+    min_price = min(c["low"] for c in candles)
+    span = max(max_price - min_price, 1e-6)
+    gap = usable_w / len(candles)
+    body_width = max(4, gap * 0.4)
+    grid_lines = 6
+    for i in range(grid_lines):
+        y = margin + usable_h * (i / (grid_lines - 1))
+        canvas.create_line(margin, y, margin + usable_w, y, fill="#d1d5db", dash=(2,))
+        price_level = max_price - (span * i / (grid_lines - 1))
+        canvas.create_text(margin + usable_w + 50, y, text=f"$ {price_level:,.0f}",
+                           fill="#6b7280", font=("Helvetica", 10))
+    for idx, candle in enumerate(candles):
+        open_p, close_p = candle["open"], candle["close"]
+        color = "#16a34a" if close_p >= open_p else "#dc2626"
+        x_center = margin + idx * gap + gap / 2
+
+        def y(price):
+            return margin + usable_h - ((price - min_price) / span * usable_h)
+
+        canvas.create_line(x_center, y(candle["high"]), x_center, y(candle["low"]),
+                           fill=color, width=2)
+        canvas.create_rectangle(
+            x_center - body_width / 2, min(y(open_p), y(close_p)),
+            x_center + body_width / 2, max(y(open_p), y(close_p)),
+            fill=color, outline=color)
+    for ratio, label in time_labels:
+        canvas.create_text(margin + usable_w * ratio, margin + usable_h + 12,
+                           text=label, fill="#0f172a", font=("Helvetica", 11, "bold"))
+
+
+def new_candle(rng, open_time, open_price):
+    close = open_price * (1 + rng.gauss(0, 0.004))
+    return {
+        "time": open_time,
+        "open": open_price,
+        "high": max(open_price, close) * (1 + abs(rng.gauss(0, 0.002))),
+        "low": min(open_price, close) * (1 - abs(rng.gauss(0, 0.002))),
+        "close": close,
+    }
+
+
+def frames(count, candle_count, seed=3):
+    """Yield (kind, candles, size) for each preview refresh."""
+    rng = random.Random(seed)
+    start = 1_700_000_000_000 // HOUR_MS * HOUR_MS
+    candles = []
+    price = 30000.0
+    for idx in range(candle_count):
+        candles.append(new_candle(rng, start + idx * HOUR_MS, price))
+        price = candles[-1]["close"]
+    size = SIZES[0]
+    for step in range(count):
+        if step % 100 == 99:
+            kind = "resize"
+            size = SIZES[(SIZES.index(size) + 1) % len(SIZES)]
+        elif step % 20 == 19:
+            kind = "roll"
+            last = candles[-1]
+            candles = candles[1:] + [new_candle(rng, last["time"] + HOUR_MS, last["close"])]
+        elif step % 5 == 4:
+            kind = "same"
+        else:
+            kind = "tick"
+            last = dict(candles[-1])
+            last["close"] *= 1 + rng.gauss(0, 0.0005)
+            last["high"] = max(last["high"], last["close"])
+            last["low"] = min(last["low"], last["close"])
+            candles = candles[:-1] + [last]
+        yield kind, candles, size
+
+
+def make_canvas(use_tk):
+    if not use_tk:
+        return Counted(FakeCanvas(*SIZES[0]))
+    import tkinter as tk
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=SIZES[0][0], height=SIZES[0][1], highlightthickness=0)
+    canvas.pack()
+    root.update()
+    return Counted(canvas)
+
+
+def resize(canvas, size):
+    widget = canvas._widget
+    if isinstance(widget, FakeCanvas):
+        widget.resize(*size)
+    else:
+        widget.configure(width=size[0], height=size[1])
+        widget.update()
+
+
+def measure(name, render, canvas, args):
+    timings = defaultdict(float)
+    counts = Counter()
+    calls = defaultdict(Counter)
+    size = SIZES[0]
+    for kind, candles, frame_size in frames(args.frames, args.candles):
+        if frame_size != size:
+            size = frame_size
+            resize(canvas, size)
+        time_labels = OverviewPanel._build_time_labels(None, candles)
+        canvas.reset()
+        start = time.perf_counter()
+        render(canvas, candles, time_labels)
+        timings[kind] += time.perf_counter() - start
+        counts[kind] += 1
+        calls[kind].update(canvas.calls)
+    print(f"  {name}: {len(canvas.find_all())} items on the canvas")
+    for kind in KINDS:
+        n = counts[kind]
+        if not n:
+            continue
+        creates = sum(v for method, v in calls[kind].items() if method.startswith("create_"))
+        print(f"    {kind:<7} {n:5d} frames  {timings[kind] / n * 1e6:8.1f} us/frame  "
+              f"{sum(calls[kind].values()) / n:6.1f} calls/frame  "
+              f"(create {creates / n:.1f}, coords {calls[kind]['coords'] / n:.1f}, "
+              f"itemconfigure {calls[kind]['itemconfigure'] / n:.1f}, "
+              f"delete {calls[kind]['delete'] / n:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--candles", type=int, default=40)
+    parser.add_argument("--tk", action="store_true", help="draw on a real Tk canvas")
+    args = parser.parse_args()
+
+    print(f"{args.frames:,} frames of {args.candles} candles")
+    measure("redraw", redraw_preview, make_canvas(args.tk), args)
+
+    canvas = make_canvas(args.tk)
+    preview = CandlePreview(canvas)
+    measure("retained", lambda _canvas, candles, labels: preview.render(candles, labels),
+            canvas, args)
+    print(f"  retained: {preview.rebuilds} rebuilds, {preview.renders} renders, "
+          f"{preview.skipped} skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Time the indicator batch functions and incremental states.
+
+Usage: python bench/bench_indicators.py [--bars 1000000] [--repeat 3]
+
+Batch timings are per whole series; incremental timings are per bar,
+measured over the last ``--tail`` bars after seeding the rest.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from crypto_dashboard.utils import indicators  # noqa: E402
+from crypto_dashboard.utils.indicators import IndicatorEngine  # noqa: E402
+
+
+def make_klines(n, seed=7, start_price=30000.0, bar_ms=60_000):
+    rng = np.random.default_rng(seed)
+    closes = start_price * np.exp(np.cumsum(rng.normal(0, 0.001, n)))
+    opens = np.r_[start_price, closes[:-1]]
+    spread = np.abs(rng.normal(0, 0.0005, n)) * closes
+    highs = np.maximum(opens, closes) + spread
+    lows = np.minimum(opens, closes) - spread
+    volumes = rng.uniform(0.5, 50.0, n)
+    open_times = 1_700_000_000_000 + np.arange(n) * bar_ms
+    return np.column_stack([open_times, opens, highs, lows, closes, volumes])
+
+
+def best_of(repeat, fn, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tail", type=int, default=10_000)
+    args = parser.parse_args()
+
+    columns = make_klines(args.bars)
+    times, highs, lows, closes, volumes = (columns[:, i] for i in (0, 2, 3, 4, 5))
+    cases = [
+        ("sma(20)", indicators.sma, closes, 20),
+        ("ema(9)", indicators.ema, closes, 9),
+        ("ema(200)", indicators.ema, closes, 200),
+        ("rsi(14)", indicators.rsi, closes, 14),
+        ("macd(12,26,9)", indicators.macd, closes),
+        ("bollinger(20,2)", indicators.bollinger, closes, 20, 2.0),
+        ("atr(14)", indicators.atr, highs, lows, closes, 14),
+        ("vwap(sessions)", indicators.vwap, highs, lows, closes, volumes, times),
+        ("engine.compute", IndicatorEngine().compute, columns),
+    ]
+    print(f"batch over {args.bars:,} bars (best of {args.repeat})")
+    for name, fn, *fn_args in cases:
+        elapsed = best_of(args.repeat, fn, *fn_args)
+        print(f"  {name:<18} {elapsed * 1000:9.1f} ms  {elapsed / args.bars * 1e9:7.1f} ns/bar")
+
+    tail = min(args.tail, args.bars)
+    engine = IndicatorEngine()
+    start = time.perf_counter()
+    engine.seed(columns[:-tail])
+    seed_s = time.perf_counter() - start
+    rows = columns[-tail:].tolist()
+    start = time.perf_counter()
+    for row in rows:
+        engine.update(row)
+    update_s = time.perf_counter() - start
+    print("incremental")
+    print(f"  engine.seed        {seed_s * 1000:9.1f} ms  ({args.bars - tail:,} bars)")
+    print(f"  engine.update      {update_s / tail * 1e6:9.2f} us/bar")
+
+
+if __name__ == "__main__":
+    main()
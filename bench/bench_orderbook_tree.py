@@ -0,0 +1,122 @@
+"""Tk calls per order book refresh, full rebuild versus in-place diff.
+
+Usage: python bench/bench_orderbook_tree.py [--refreshes 2000] [--levels 20] [--tk]
+
+A random walk of depth updates drives one BookSide per side; each
+refresh renders the top ``--levels`` rows with the old delete-and-insert
+loop and with ``OrderBookPanel._update_tree``. Calls are counted on a
+fake Treeview, or on a real ttk.Treeview with ``--tk`` (needs a display),
+where the timings include Tk itself.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fake_tk import Counted, FakeTreeview  # noqa: E402
+from crypto_dashboard.components.orderbook import OrderBookPanel  # noqa: E402
+from crypto_dashboard.utils.order_book import BookSide  # noqa: E402
+
+TICK = 0.01
+
+
+def rebuild_tree(tree, rows, tag):
+    """The refresh as it was: clear every row, then insert them all again."""
+    for child in tree.get_children():
+        tree.delete(child)
+    for idx, (price, qty, *_) in enumerate(rows):
+        row_tag = "even" if idx % 2 == 0 else "odd"
+        tree.insert("", "end", values=(f"{float(price):,.2f}", f"{float(qty):,.4f}"),
+                    tags=(tag, row_tag))
+
+
+def book_updates(refreshes, depth, seed=11):
+    """Yield (bids, asks) BookSides after each batch of depth updates."""
+    rng = random.Random(seed)
+    bids, asks = BookSide(descending=True), BookSide(descending=False)
+    mid = 30000.0
+    for level in range(1, depth * 3):
+        bids.set(round(mid - level * TICK, 2), rng.uniform(0.01, 5))
+        asks.set(round(mid + level * TICK, 2), rng.uniform(0.01, 5))
+    for _ in range(refreshes):
+        # About what one 100 ms render sees from a busy pair's diff stream
+        for _ in range(rng.randint(1, 8)):
+            side, sign = (bids, -1) if rng.random() < 0.5 else (asks, 1)
+            price = round(mid + sign * rng.randint(1, depth * 3) * TICK, 2)
+            side.set(price, 0.0 if rng.random() < 0.15 else rng.uniform(0.01, 5))
+        if rng.random() < 0.1:
+            mid += rng.choice((-TICK, TICK))
+            best_bid, best_ask = round(mid - TICK, 2), round(mid + TICK, 2)
+            bids.set(best_bid, rng.uniform(0.01, 5))
+            asks.set(best_ask, rng.uniform(0.01, 5))
+            for price, _qty in asks.top(depth):
+                if price <= best_bid:
+                    asks.set(price, 0.0)
+            for price, _qty in bids.top(depth):
+                if price >= best_ask:
+                    bids.set(price, 0.0)
+        yield bids, asks
+
+
+def make_trees(use_tk):
+    if not use_tk:
+        return Counted(FakeTreeview()), Counted(FakeTreeview())
+    import tkinter as tk
+    from tkinter import ttk
+    root = tk.Tk()
+    trees = [ttk.Treeview(root, columns=("price", "qty"), show="headings", height=20)
+             for _ in range(2)]
+    for tree in trees:
+        tree.pack()
+    root.update()
+    return Counted(trees[0]), Counted(trees[1])
+
+
+def measure(name, render, refreshes, depth, use_tk):
+    bid_tree, ask_tree = make_trees(use_tk)
+    elapsed = 0.0
+    for bids, asks in book_updates(refreshes, depth):
+        bid_rows, ask_rows = bids.top(depth), asks.top(depth)
+        start = time.perf_counter()
+        render(bid_tree, bid_rows, "bid")
+        render(ask_tree, ask_rows, "ask")
+        elapsed += time.perf_counter() - start
+    calls = bid_tree.calls + ask_tree.calls
+    total = sum(calls.values())
+    detail = ", ".join(f"{method} {count / refreshes:.1f}" for method, count in sorted(calls.items()))
+    print(f"  {name:<8} {total / refreshes:6.1f} Tk calls/refresh  "
+          f"{elapsed / refreshes * 1e6:7.1f} us/refresh  ({detail})")
+    return bid_tree, ask_tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=2000)
+    parser.add_argument("--levels", type=int, default=20)
+    parser.add_argument("--tk", action="store_true", help="use real ttk.Treeview widgets")
+    args = parser.parse_args()
+
+    panel = SimpleNamespace(_tree_rows={"bid": [], "ask": []})
+
+    def diff(tree, rows, tag):
+        OrderBookPanel._update_tree(panel, tree, rows, tag)
+
+    print(f"{args.refreshes:,} refreshes of {args.levels} levels per side")
+    before = measure("rebuild", rebuild_tree, args.refreshes, args.levels, args.tk)
+    after = measure("diff", diff, args.refreshes, args.levels, args.tk)
+    # Both ways must leave the same rows on screen
+    for old, new in zip(before, after):
+        old_rows = [tuple(old.item(i)["values"]) for i in old.get_children()]
+        new_rows = [tuple(new.item(i)["values"]) for i in new.get_children()]
+        assert [tuple(map(str, row)) for row in old_rows] == \
+            [tuple(map(str, row)) for row in new_rows]
+
+
+if __name__ == "__main__":
+    main()
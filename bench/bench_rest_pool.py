@@ -0,0 +1,140 @@
+"""Requests/sec and latency of the REST client against a local stand-in.
+
+Usage: python bench/bench_rest_pool.py [--requests 2000] [--threads 5]
+
+Compares a bare ``requests.get`` per call (a new TCP connection each
+time) with ``binance_rest.safe_api_call`` on the shared keep-alive
+session. The stand-in is plain HTTP on loopback, so the gap here is the
+TCP setup alone; against the real API every new connection also pays a
+TLS handshake.
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from crypto_dashboard.utils import binance_rest  # noqa: E402
+from crypto_dashboard.utils.rate_governor import RateGovernor  # noqa: E402
+
+PATH = "/api/v3/ticker/24hr"
+PARAMS = {"symbol": "BTCUSDT"}
+BODY = (b'{"symbol":"BTCUSDT","lastPrice":"30000.00","priceChangePercent":"1.50",'
+        b'"volume":"12345.6","closeTime":1700000000000}')
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as two writes; with Nagle on, a kept-alive
+    # connection would stall each reply on the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("X-MBX-USED-WEIGHT-1M", "1")
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(call, total, threads):
+    """Run ``call`` ``total`` times over ``threads`` threads; return (seconds, latencies)."""
+    latencies = []
+    lock = threading.Lock()
+    per_thread = total // threads
+
+    def worker():
+        mine = []
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            call()
+            mine.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(mine)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start, latencies
+
+
+def report(name, elapsed, latencies, connections):
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"  {name:<8} {len(latencies) / elapsed:8.0f} req/s  "
+          f"p50 {statistics.median(ordered) * 1000:6.2f} ms  "
+          f"p99 {p99 * 1000:6.2f} ms  connections {connections}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=5)
+    args = parser.parse_args()
+
+    server = StandInServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    binance_rest.BASE_URL = server.url
+    # Keep the governor out of the way; this measures the transport only
+    binance_rest._governor = RateGovernor(10 ** 9)
+    binance_rest.close_session()
+    url = server.url + PATH
+
+    print(f"{args.requests:,} requests over {args.threads} threads")
+
+    def bare():
+        resp = requests.get(url, params=PARAMS, timeout=10)
+        resp.raise_for_status()
+        return resp.json()
+
+    elapsed, latencies = run(bare, args.requests, args.threads)
+    report("bare", elapsed, latencies, server.connections)
+
+    server.connections = 0
+    elapsed, latencies = run(
+        lambda: binance_rest.safe_api_call(PATH, PARAMS), args.requests, args.threads)
+    report("pooled", elapsed, latencies, server.connections)
+    stats = binance_rest.get_session_stats()
+    print(f"  session: {stats['requests']} requests, {stats['connections']} connections, "
+          f"{stats['reused']} reused")
+
+    binance_rest.close_session()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Cost of updating many overview sparklines, redraw-all versus reused items.
+
+Usage: python bench/bench_sparklines.py [--rows 200] [--refreshes 50] [--tk]
+
+Every refresh appends one price to each row's random walk and redraws
+all rows, then redraws them again unchanged (as a re-map of the panel
+does). The old path deleted the canvas and created 59 polygons and a
+line per row; ``Sparkline`` moves items it created once and skips
+series it has already drawn. Canvas calls are counted on a fake canvas,
+or on real Tk canvases with ``--tk`` (needs a display).
+"""
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fake_tk import Counted, FakeCanvas  # noqa: E402
+from crypto_dashboard.components.sparkline import (  # noqa: E402
+    SPARKLINE_POINTS,
+    Sparkline,
+    soften_color,
+)
+
+WIDTH, HEIGHT = 180, 50  # the overview's market-row canvas
+
+
+def redraw_sparkline(canvas, data):
+    """The refresh as it was: clear the canvas and draw every item anew."""
+    canvas.delete("all")
+    if len(data) < 2:
+        return
+    canvas.update_idletasks()
+    w = max(10, int(canvas.winfo_width() or canvas["width"]))
+    h = max(10, int(canvas.winfo_height() or canvas["height"]))
+    margin = 8
+    usable_w = w - margin * 2
+    usable_h = h - margin * 2
+    normalized = list(data[-SPARKLINE_POINTS:])
+    min_price = min(normalized)
+    span = max(max(normalized) - min_price, 1e-6)
+    trend_up = normalized[-1] >= normalized[0]
+    line_color = "#16a34a" if trend_up else "#dc2626"
+    fill_color = "#d1fae5" if trend_up else "#fee2e2"
+    points = []
+    total_points = len(normalized)
+    for idx, price in enumerate(normalized):
+        points.extend([
+            margin + (idx / max(1, total_points - 1)) * usable_w,
+            margin + usable_h - ((price - min_price) / span * usable_h),
+        ])
+    baseline = margin + usable_h
+    pairs = list(zip(points[0::2], points[1::2]))
+    for (x0, y0), (x1, y1) in zip(pairs[:-1], pairs[1:]):
+        avg_ratio = 1 - ((y0 + y1) / 2 - margin) / usable_h
+        shade = soften_color(fill_color, 1 - avg_ratio * 0.8)
+        canvas.create_polygon(x0, baseline, x0, y0, x1, y1, x1, baseline,
+                              fill=shade, outline="")
+    canvas.create_line(points, fill=line_color, width=3, smooth=True)
+
+
+def make_canvases(rows, use_tk):
+    if not use_tk:
+        return [Counted(FakeCanvas(WIDTH, HEIGHT)) for _ in range(rows)]
+    import tkinter as tk
+    root = tk.Tk()
+    canvases = []
+    for _ in range(rows):
+        canvas = tk.Canvas(root, width=WIDTH, height=HEIGHT, highlightthickness=0)
+        canvas.pack()
+        canvases.append(canvas)
+    root.update()
+    return [Counted(canvas) for canvas in canvases]
+
+
+def price_walks(rows, refreshes, seed=5):
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 0.002, (rows, SPARKLINE_POINTS + refreshes))
+    return 100.0 * np.exp(np.cumsum(steps, axis=1))
+
+
+def measure(name, draw, canvases, walks, refreshes):
+    timings = {"changed": 0.0, "unchanged": 0.0}
+    calls = {"changed": Counter(), "unchanged": Counter()}
+    for step in range(refreshes):
+        series = walks[:, step:step + SPARKLINE_POINTS]
+        # Draw each series once as new data, then again unchanged
+        for phase in ("changed", "unchanged"):
+            for canvas in canvases:
+                canvas.reset()
+            start = time.perf_counter()
+            for idx, canvas in enumerate(canvases):
+                draw(idx, canvas, series[idx])
+            timings[phase] += time.perf_counter() - start
+            for canvas in canvases:
+                calls[phase].update(canvas.calls)
+    per_row = refreshes * len(canvases)
+    print(f"  {name}: {len(canvases[0].find_all())} items per canvas")
+    for phase in ("changed", "unchanged"):
+        counts = calls[phase]
+        creates = sum(n for method, n in counts.items() if method.startswith("create_"))
+        detail = ", ".join(f"{method} {n / per_row:.1f}"
+                           for method, n in sorted(counts.items())
+                           if not method.startswith("create_"))
+        print(f"    {phase:<9} {timings[phase] / refreshes * 1000:7.2f} ms/refresh  "
+              f"{sum(counts.values()) / per_row:6.1f} calls/row  "
+              f"(create {creates / per_row:.1f}{', ' + detail if detail else ''})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--refreshes", type=int, default=50)
+    parser.add_argument("--tk", action="store_true", help="draw on real Tk canvases")
+    args = parser.parse_args()
+
+    walks = price_walks(args.rows, args.refreshes)
+    print(f"{args.rows} sparklines, {args.refreshes} refreshes")
+
+    canvases = make_canvases(args.rows, args.tk)
+    measure("redraw", lambda _idx, canvas, data: redraw_sparkline(canvas, data.tolist()),
+            canvases, walks, args.refreshes)
+
+    canvases = make_canvases(args.rows, args.tk)
+    sparklines = [Sparkline(canvas) for canvas in canvases]
+    measure("reuse", lambda idx, _canvas, data: sparklines[idx].update(data),
+            canvases, walks, args.refreshes)
+    print(f"  reuse skipped {sum(s.skipped for s in sparklines):,} of "
+          f"{sum(s.skipped + s.renders for s in sparklines):,} updates")
+
+
+if __name__ == "__main__":
+    main()
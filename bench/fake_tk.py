@@ -0,0 +1,128 @@
+"""Op-counting stand-ins for the Tk widgets the panels draw on.
+
+``Counted`` wraps a widget, real or fake, and tallies every method call
+by name, so a benchmark can report Tk calls per refresh without a
+display. The fakes keep just enough state to answer the calls the
+panels make.
+"""
+import itertools
+from collections import Counter
+
+
+class Counted:
+    def __init__(self, widget):
+        self._widget = widget
+        self.calls = Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._widget, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self.calls[name] += 1
+            return attr(*args, **kwargs)
+        return call
+
+    def __getitem__(self, option):
+        self.calls["cget"] += 1
+        return self._widget[option]
+
+    @property
+    def total(self):
+        return sum(self.calls.values())
+
+    def reset(self):
+        self.calls.clear()
+
+
+class FakeTreeview:
+    def __init__(self):
+        self._items = {}
+        self._ids = (f"I{n:03X}" for n in itertools.count(1))
+
+    def insert(self, parent, index, values=(), tags=()):
+        item_id = next(self._ids)
+        self._items[item_id] = {"values": tuple(values), "tags": tuple(tags)}
+        return item_id
+
+    def item(self, item_id, **options):
+        if not options:
+            return dict(self._items[item_id])
+        self._items[item_id].update(options)
+
+    def delete(self, *item_ids):
+        for item_id in item_ids:
+            del self._items[item_id]
+
+    def get_children(self, item=""):
+        return tuple(self._items)
+
+    def rows(self):
+        return [tuple(entry["values"]) for entry in self._items.values()]
+
+
+class FakeCanvas:
+    """Canvas items as ``{id: (kind, coords, options)}``; sizes are fixed until ``resize``."""
+
+    def __init__(self, width=320, height=220):
+        self._options = {"width": width, "height": height}
+        self._items = {}
+        self._ids = itertools.count(1)
+
+    def __getitem__(self, option):
+        return self._options[option]
+
+    def resize(self, width, height):
+        self._options.update(width=width, height=height)
+
+    def winfo_width(self):
+        return self._options["width"]
+
+    def winfo_height(self):
+        return self._options["height"]
+
+    def update_idletasks(self):
+        pass
+
+    def bind(self, sequence, func, add=None):
+        pass
+
+    def _create(self, kind, coords, options):
+        item = next(self._ids)
+        self._items[item] = (kind, list(coords), dict(options))
+        return item
+
+    def create_line(self, *coords, **options):
+        return self._create("line", coords, options)
+
+    def create_polygon(self, *coords, **options):
+        return self._create("polygon", coords, options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create("rectangle", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._create("text", coords, options)
+
+    def coords(self, item, *coords):
+        if not coords:
+            return list(self._items[item][1])
+        if len(coords) == 1:
+            coords = coords[0]
+        self._items[item][1][:] = coords
+
+    def itemconfigure(self, item, **options):
+        self._items[item][2].update(options)
+
+    itemconfig = itemconfigure
+
+    def delete(self, *items):
+        for item in items:
+            if item == "all":
+                self._items.clear()
+            else:
+                self._items.pop(item, None)
+
+    def find_all(self):
+        return tuple(self._items)
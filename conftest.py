@@ -0,0 +1,3 @@
+# Puts the repository root on sys.path so the tests import
+# ``crypto_dashboard`` the same way main.py does. The bench scripts add
+# the root themselves.
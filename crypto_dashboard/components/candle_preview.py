@@ -0,0 +1,139 @@
+import tkinter as tk
+
+UP_COLOR = "#16a34a"
+DOWN_COLOR = "#dc2626"
+GRID_LINES = 6
+MARGIN = 18
+
+
+class CandlePreview:
+    """Retained-mode candlestick scene on a Tk canvas.
+
+    Grid lines, price labels, wicks and bodies are created once per layout
+    (candle count and canvas size) and afterwards only moved, relabelled
+    or recolored. Time labels come from a pool that grows on demand.
+    """
+
+    def __init__(self, canvas, default_size=(320, 220)):
+        self.canvas = canvas
+        self.default_size = default_size
+        self._layout = None
+        self._grid = []
+        self._price_labels = []
+        self._wicks = []
+        self._bodies = []
+        self._time_labels = []
+        self._state = {}
+        self._last = None
+        self.rebuilds = 0
+        self.renders = 0
+        self.skipped = 0
+        canvas.bind("<Configure>", self._on_resize, add="+")
+
+    def _size(self):
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return width, height
+
+    def usable_width(self):
+        return max(10, self._size()[0] - MARGIN * 2)
+
+    def _on_resize(self, _event):
+        if self._last is not None:
+            self.render(*self._last)
+
+    def clear(self):
+        self._last = None
+        self.canvas.delete("all")
+        self._layout = None
+        self._time_labels = []
+
+    def _rebuild(self, count, w, h):
+        canvas = self.canvas
+        canvas.delete("all")
+        self._state = {}
+        self._time_labels = []
+        usable_w = max(10, w - MARGIN * 2)
+        usable_h = max(10, h - MARGIN * 2)
+        self._grid = []
+        self._price_labels = []
+        for i in range(GRID_LINES):
+            y = MARGIN + usable_h * (i / (GRID_LINES - 1))
+            self._grid.append(canvas.create_line(
+                MARGIN, y, MARGIN + usable_w, y, fill="#d1d5db", dash=(2,)))
+            self._price_labels.append(canvas.create_text(
+                MARGIN + usable_w + 50, y, text="", fill="#6b7280",
+                font=("Helvetica", 10)))
+        self._wicks = [canvas.create_line(0, 0, 0, 0, width=2) for _ in range(count)]
+        self._bodies = [canvas.create_rectangle(0, 0, 0, 0) for _ in range(count)]
+        self._layout = (count, w, h)
+        self.rebuilds += 1
+
+    def _set(self, item, **options):
+        current = self._state.setdefault(item, {})
+        changed = {k: v for k, v in options.items() if current.get(k) != v}
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            current.update(changed)
+
+    def render(self, candles, time_labels):
+        """Draw ``candles`` (dicts with open/high/low/close) and (ratio, text) labels"""
+        if not candles:
+            self.clear()
+            return
+        w, h = self._size()
+        count = len(candles)
+        if self._layout == (count, w, h) and self._last == (candles, time_labels):
+            self.skipped += 1
+            return
+        self._last = (candles, time_labels)
+        if self._layout != (count, w, h):
+            self._rebuild(count, w, h)
+
+        canvas = self.canvas
+        usable_w = max(10, w - MARGIN * 2)
+        usable_h = max(10, h - MARGIN * 2)
+        max_price = max(c["high"] for c in candles)
+        min_price = min(c["low"] for c in candles)
+        span = max(max_price - min_price, 1e-6)
+        scale = usable_h / span
+        bottom = MARGIN + usable_h
+        gap = usable_w / count
+        half_body = max(4, gap * 0.4) / 2
+
+        for i, item in enumerate(self._price_labels):
+            price_level = max_price - (span * i / (GRID_LINES - 1))
+            self._set(item, text=f"$ {price_level:,.0f}")
+
+        for idx, candle in enumerate(candles):
+            open_p = candle["open"]
+            close_p = candle["close"]
+            color = UP_COLOR if close_p >= open_p else DOWN_COLOR
+            x_center = MARGIN + idx * gap + gap / 2
+            y_open = bottom - (open_p - min_price) * scale
+            y_close = bottom - (close_p - min_price) * scale
+            canvas.coords(
+                self._wicks[idx],
+                x_center, bottom - (candle["high"] - min_price) * scale,
+                x_center, bottom - (candle["low"] - min_price) * scale,
+            )
+            canvas.coords(
+                self._bodies[idx],
+                x_center - half_body, min(y_open, y_close),
+                x_center + half_body, max(y_open, y_close),
+            )
+            self._set(self._wicks[idx], fill=color)
+            self._set(self._bodies[idx], fill=color, outline=color)
+
+        pool = self._time_labels
+        while len(pool) < len(time_labels):
+            pool.append(canvas.create_text(
+                0, 0, text="", fill="#0f172a", font=("Helvetica", 11, "bold")))
+        for item, (ratio, label) in zip(pool, time_labels):
+            canvas.coords(item, MARGIN + usable_w * ratio, bottom + 12)
+            self._set(item, text=label, state=tk.NORMAL)
+        for item in pool[len(time_labels):]:
+            self._set(item, state=tk.HIDDEN)
+        self.renders += 1
@@ -2,30 +2,29 @@ import os
 import sys
 import tkinter as tk
 from tkinter import ttk
-import threading
 
 if __package__ is None or __package__ == "":
     current_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(os.path.dirname(current_dir))
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
-    from utils.binance_rest import get_order_book  # type: ignore
+    from utils.order_book import LocalOrderBook  # type: ignore
     from config import (  # type: ignore
-        ORDERBOOK_REFRESH_MS,
+        ORDERBOOK_RENDER_MS,
         ORDERBOOK_DEFAULT_LEVELS,
         ORDERBOOK_ALL_LEVELS,
     )
 else:
-    from ..utils.binance_rest import get_order_book
+    from ..utils.order_book import LocalOrderBook
     from ..config import (
-        ORDERBOOK_REFRESH_MS,
+        ORDERBOOK_RENDER_MS,
         ORDERBOOK_DEFAULT_LEVELS,
         ORDERBOOK_ALL_LEVELS,
     )
 
 
 class OrderBookPanel:
-    """Display an order book snapshot styled like the mockup"""
+    """Display the top of a locally maintained order book styled like the mockup"""
 
     def __init__(self, parent, symbol, theme):
         self.parent = parent
@@ -34,6 +33,12 @@ class OrderBookPanel:
         self.is_running = False
         self.level_limit = ORDERBOOK_DEFAULT_LEVELS
         self.show_all = False
+        self.book = None
+        self._rendered_version = None
+        self._render_job = None
+        # Stable row item ids and the values currently shown, per tree tag
+        self._tree_rows = {"bid": [], "ask": []}
+        self.last_tree_ops = 0
 
         self._configure_style()
 
@@ -185,7 +190,8 @@ class OrderBookPanel:
             self.level_limit = ORDERBOOK_DEFAULT_LEVELS
             self.toggle_button.config(text="Show All 20 Levels")
         # Refresh immediately
-        threading.Thread(target=self.refresh_data, daemon=True).start()
+        self._rendered_version = None
+        self.refresh_data()
 
     def set_symbol(self, symbol):
         new_symbol = symbol.upper()
@@ -196,50 +202,78 @@ class OrderBookPanel:
         self.title_label.config(text=f"Order Book Snapshot - {self.symbol}")
 
         if self.is_running:
-            threading.Thread(target=self.refresh_data, daemon=True).start()
+            self._open_book()
 
     def start(self):
         if self.is_running:
             return
         self.is_running = True
+        self._open_book()
         self.schedule_refresh()
 
     def stop(self):
         self.is_running = False
+        if self._render_job is not None:
+            self.parent.after_cancel(self._render_job)
+            self._render_job = None
+        if self.book:
+            self.book.stop()
+            self.book = None
+
+    def _open_book(self):
+        if self.book:
+            self.book.stop()
+        self.book = LocalOrderBook(self.symbol)
+        self._rendered_version = None
+        self.book.start()
 
     def schedule_refresh(self):
+        self._render_job = None
         if not self.is_running:
             return
-        thread = threading.Thread(target=self.refresh_data, daemon=True)
-        thread.start()
-        self.parent.after(ORDERBOOK_REFRESH_MS, self.schedule_refresh)
+        self.refresh_data()
+        self._render_job = self.parent.after(ORDERBOOK_RENDER_MS, self.schedule_refresh)
 
     def refresh_data(self):
-        data = get_order_book(self.symbol, limit=self.level_limit)
-        if not data:
+        """Redraw from the local book if it changed since the last render"""
+        book = self.book
+        if not book or not book.synced or book.version == self._rendered_version:
             return
-
-        bids = data.get("bids", [])[: self.level_limit]
-        asks = data.get("asks", [])[: self.level_limit]
-
-        def update():
+        self._rendered_version = book.version
+        bids, asks = book.top(self.level_limit)
+        self.last_tree_ops = (
             self._update_tree(self.bids_tree, bids, tag="bid")
-            self._update_tree(self.asks_tree, asks, tag="ask")
-
-        self.parent.after(0, update)
+            + self._update_tree(self.asks_tree, asks, tag="ask")
+        )
 
     def _update_tree(self, tree, rows, tag):
-        for child in tree.get_children():
-            tree.delete(child)
+        """Update rows in place; returns the number of Tk calls made"""
+        shown = self._tree_rows[tag]
+        ops = 0
         for idx, (price, qty, *_) in enumerate(rows):
+            values = (f"{float(price):,.2f}", f"{float(qty):,.4f}")
+            if idx < len(shown):
+                item_id, current = shown[idx]
+                if current != values:
+                    tree.item(item_id, values=values)
+                    shown[idx] = (item_id, values)
+                    ops += 1
+                continue
             # Add alternating row colors for better readability
             row_tag = "even" if idx % 2 == 0 else "odd"
-            tree.insert(
+            item_id = tree.insert(
                 "",
                 tk.END,
-                values=(f"{float(price):,.2f}", f"{float(qty):,.4f}"),
+                values=values,
                 tags=(tag, row_tag),
             )
+            shown.append((item_id, values))
+            ops += 1
+        if len(shown) > len(rows):
+            tree.delete(*[item_id for item_id, _ in shown[len(rows):]])
+            del shown[len(rows):]
+            ops += 1
+        return ops
 
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
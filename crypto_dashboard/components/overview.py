@@ -3,9 +3,10 @@ import sys
 import json
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
 from datetime import datetime
 
+import numpy as np
+
 if __package__ is None or __package__ == "":
     current_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(os.path.dirname(current_dir))
@@ -15,11 +16,27 @@ if __package__ is None or __package__ == "":
     crypto_dashboard_dir = os.path.join(parent_dir, "crypto_dashboard")
     if crypto_dashboard_dir not in sys.path:
         sys.path.insert(0, crypto_dashboard_dir)
-    from config import OVERVIEW_REFRESH_MS, THEME  # type: ignore
-    from utils.binance_rest import get_24hr_ticker, get_klines  # type: ignore
+    from config import OVERVIEW_REFRESH_MS, OVERVIEW_HIDDEN_REFRESH_MS, THEME  # type: ignore
+    from utils.binance_rest import get_24hr_tickers, PRIORITY_LOW  # type: ignore
+    from utils.async_rest import get_async_client  # type: ignore
+    from utils.scheduler import get_scheduler  # type: ignore
+    from utils.market_data import get_market_data  # type: ignore
+    from utils.kline_store import get_kline_store  # type: ignore
+    from utils.decimate import merge_candles  # type: ignore
+    from utils.ringbuffer import RingBuffer, resample  # type: ignore
+    from components.sparkline import Sparkline  # type: ignore
+    from components.candle_preview import CandlePreview  # type: ignore
 else:
-    from ..config import OVERVIEW_REFRESH_MS, THEME
-    from ..utils.binance_rest import get_24hr_ticker, get_klines
+    from ..config import OVERVIEW_REFRESH_MS, OVERVIEW_HIDDEN_REFRESH_MS, THEME
+    from ..utils.binance_rest import get_24hr_tickers, PRIORITY_LOW
+    from ..utils.async_rest import get_async_client
+    from ..utils.scheduler import get_scheduler
+    from ..utils.market_data import get_market_data
+    from ..utils.kline_store import get_kline_store
+    from ..utils.decimate import merge_candles
+    from ..utils.ringbuffer import RingBuffer, resample
+    from .sparkline import Sparkline
+    from .candle_preview import CandlePreview
 
 
 # Default favorite colors palette (4 colors for 4 favorites max)
@@ -83,12 +100,9 @@ def save_favorites(favorites):
         return False
 
 
-SPARKLINE_STYLES = {
-    "BTC": {"line": "#4f46e5", "fill": "#c7d2fe", "border": "#4f46e5"},
-    "ETH": {"line": "#0ea5e9", "fill": "#bae6fd", "border": "#0ea5e9"},
-    "SOL": {"line": "#8b5cf6", "fill": "#ddd6fe", "border": "#8b5cf6"},
-    "ADA": {"line": "#22c55e", "fill": "#d1fae5", "border": "#22c55e"},
-}
+# Preview candles narrower than this are merged before drawing
+PREVIEW_MIN_CANDLE_PX = 6
+PRICE_HISTORY_LENGTH = 120
 
 
 class OverviewPanel:
@@ -101,19 +115,29 @@ class OverviewPanel:
         self.theme = theme or THEME
         self.on_trade = on_trade
         self.is_running = False
+        self.client = get_async_client()
+        self.scheduler = get_scheduler()
+        self.market = get_market_data()
+        self.kline_store = get_kline_store()
         # Use light background for overview section (overview has its own light theme)
         self.bg = "#f5f7fb"
         self.surface = "#ffffff"
         self.favorite_cards = {}
         self.market_rows = {}
-        self.spark_canvases = {}
-        self.latest_prices = {symbol: 0.0 for symbol in symbols}
-        self.price_history = {symbol: [] for symbol in symbols}
+        self.sparklines = {}
+        self.price_history = {
+            symbol: RingBuffer(PRICE_HISTORY_LENGTH) for symbol in symbols}
         self.chart_symbol = next(iter(symbols))
         self.chart_selector_var = tk.StringVar(value=self.chart_symbol)
         self.chart_candles = []
+        self._chart_candles_symbol = None
         self._chart_fetch_inflight = False
         self.sparkline_initialized = set()
+        self._latest_quotes = {}
+        self._priming = set()
+        self._view_stale = False
+        self.widget_touches = 0
+        self.total_widget_touches = 0
 
         self.exchange_asset_var = tk.StringVar(value=self.chart_symbol)
         self.exchange_amount_var = tk.StringVar(value="1.0")
@@ -144,6 +168,7 @@ class OverviewPanel:
                 f for f in DEFAULT_FAVORITES if f in self.symbols]
 
         self.frame = tk.Frame(parent, bg=self.bg, padx=28, pady=16)
+        self.frame.bind("<Map>", self._on_frame_map)
         self.frame.pack(fill=tk.BOTH, expand=True, pady=(16, 0))
         tk.Label(
             self.frame,
@@ -282,6 +307,7 @@ class OverviewPanel:
                               s=symbol: self._handle_symbol_select(s))
 
             self.favorite_cards[symbol] = {
+                "shown": {},
                 "frame": card,
                 "inner": inner,
                 "price": price_label,
@@ -293,6 +319,20 @@ class OverviewPanel:
             if col_index == 0:
                 row_index += 1
 
+        # The store only sends quotes that change, so fill new cards from
+        # its current snapshot instead of waiting for the next tick
+        self._render_quotes(self._current_quotes(self.favorite_cards))
+
+    def _current_quotes(self, symbol_keys):
+        """Latest stored quote per symbol, shaped like a subscriber update"""
+        quotes = {}
+        for symbol_key in symbol_keys:
+            quote = self.market.quote(symbol_key)
+            if quote is not None:
+                quotes[symbol_key] = {
+                    "price": quote["price"], "change_percent": quote["change_percent"]}
+        return quotes
+
     def _open_favorites_editor(self):
         """Open dialog to edit favorites"""
         dialog = tk.Toplevel(self.frame)
@@ -556,6 +596,7 @@ class OverviewPanel:
         self.chart_canvas = tk.Canvas(
             holder, height=240, bg="#f3f4f6", highlightthickness=0)
         self.chart_canvas.pack(fill=tk.BOTH, expand=True, pady=(6, 0))
+        self.chart_preview = CandlePreview(self.chart_canvas)
 
     def _build_live_market(self, parent):
         card = tk.Frame(parent, bg=self.surface, padx=18, pady=10)
@@ -773,8 +814,8 @@ class OverviewPanel:
             row.bind("<Leave>", on_leave)
 
             self.market_rows[symbol] = {
-                "frame": row, "change": change, "price": price}
-            self.spark_canvases[symbol] = canvas
+                "frame": row, "change": change, "price": price, "shown": {}}
+            self.sparklines[symbol] = Sparkline(canvas)
 
     def _build_exchange_card(self, parent):
         card = tk.Frame(parent, bg="#f9fafb", padx=18, pady=16,
@@ -1154,21 +1195,21 @@ class OverviewPanel:
                 asset = self.asset_display_to_code.get(asset_display)
                 if asset:
                     holdings = self.mock_holdings.get(asset, 0.0)
-                    self.buy_holdings_display_var.set(
+                    self._set_var(self.buy_holdings_display_var,
                         f"Holdings: {holdings:.6f} {asset}")
                     # Update price display (1 crypto = X USD)
                     if hasattr(self, "buy_price_display_var"):
-                        price = self.latest_prices.get(asset, 0)
-                        self.buy_price_display_var.set(
+                        price = self.market.price(asset)
+                        self._set_var(self.buy_price_display_var,
                             f"1 {asset} = ${price:,.2f}")
                 else:
-                    self.buy_holdings_display_var.set("Holdings: 0.000000")
+                    self._set_var(self.buy_holdings_display_var, "Holdings: 0.000000")
                     if hasattr(self, "buy_price_display_var"):
-                        self.buy_price_display_var.set("1 BTC = $0.00")
+                        self._set_var(self.buy_price_display_var, "1 BTC = $0.00")
             else:
-                self.buy_holdings_display_var.set("Holdings: 0.000000")
+                self._set_var(self.buy_holdings_display_var, "Holdings: 0.000000")
                 if hasattr(self, "buy_price_display_var"):
-                    self.buy_price_display_var.set("1 BTC = $0.00")
+                    self._set_var(self.buy_price_display_var, "1 BTC = $0.00")
 
     def _update_sell_holdings_display(self):
         """Update holdings display for sell section"""
@@ -1179,21 +1220,21 @@ class OverviewPanel:
                 asset = self.asset_display_to_code.get(asset_display)
                 if asset:
                     holdings = self.mock_holdings.get(asset, 0.0)
-                    self.sell_holdings_display_var.set(
+                    self._set_var(self.sell_holdings_display_var,
                         f"Holdings: {holdings:.6f} {asset}")
                     # Update price display (1 crypto = X USD)
                     if hasattr(self, "sell_price_display_var"):
-                        price = self.latest_prices.get(asset, 0)
-                        self.sell_price_display_var.set(
+                        price = self.market.price(asset)
+                        self._set_var(self.sell_price_display_var,
                             f"1 {asset} = ${price:,.2f}")
                 else:
-                    self.sell_holdings_display_var.set("Holdings: 0.000000")
+                    self._set_var(self.sell_holdings_display_var, "Holdings: 0.000000")
                     if hasattr(self, "sell_price_display_var"):
-                        self.sell_price_display_var.set("1 BTC = $0.00")
+                        self._set_var(self.sell_price_display_var, "1 BTC = $0.00")
             else:
-                self.sell_holdings_display_var.set("Holdings: 0.000000")
+                self._set_var(self.sell_holdings_display_var, "Holdings: 0.000000")
                 if hasattr(self, "sell_price_display_var"):
-                    self.sell_price_display_var.set("1 BTC = $0.00")
+                    self._set_var(self.sell_price_display_var, "1 BTC = $0.00")
 
     def _execute_trade_from_exchange(self, action, amount_entry, asset_display_var):
         """Execute buy/sell trade from exchange section (similar to wallet)"""
@@ -1218,7 +1259,7 @@ class OverviewPanel:
                 status_var.set("Please select an asset")
             return
 
-        price = self.latest_prices.get(asset, 0)
+        price = self.market.price(asset)
         if price <= 0:
             status_var = self.buy_status_var if action == "BUY" else self.sell_status_var
             if hasattr(self, status_var):
@@ -1289,162 +1330,157 @@ class OverviewPanel:
         if self.is_running:
             return
         self.is_running = True
-        self._schedule_next_refresh()
+        # Show the last session's candles before the first network round trip
+        self._load_cached_chart()
+        self.market.subscribe(self._apply_updates)
+        self.scheduler.add("overview", OVERVIEW_REFRESH_MS, self.refresh_data,
+                           hidden_interval_ms=OVERVIEW_HIDDEN_REFRESH_MS)
+        self._trigger_chart_refresh()
 
     def stop(self):
         self.is_running = False
+        self.scheduler.remove("overview")
+        self.market.unsubscribe(self._apply_updates)
 
-    def _schedule_next_refresh(self):
-        if not self.is_running:
-            return
-        threading.Thread(target=self.refresh_data, daemon=True).start()
-        self.parent.after(OVERVIEW_REFRESH_MS, self._schedule_next_refresh)
+    def set_visible(self, visible):
+        """Poll at full rate only while the overview is on screen."""
+        self.scheduler.set_visible("overview", visible)
 
     def refresh_data(self):
-        results = {}
-        for symbol_key, symbol in self.symbols.items():
-            if symbol_key not in self.sparkline_initialized:
-                self._prime_price_history(symbol_key)
-            data = get_24hr_ticker(symbol)
-            if not data:
-                continue
-            try:
-                price = float(data.get("lastPrice", 0))
-                change_percent = float(data.get("priceChangePercent", 0))
-            except (TypeError, ValueError):
+        """Start one refresh; returns the ticker future for the scheduler.
+
+        Quotes reach the panel through the market data subscription; only
+        symbols the ticker socket has not refreshed recently are fetched.
+        """
+        stale = self.market.stale(self.symbols)
+        future = None
+        if stale:
+            future = self.client.run(self._collect_market_data, stale,
+                                     callback=self._sample_history)
+        else:
+            self._sample_history()
+        # Sparkline history is primed per symbol in parallel and each row
+        # redraws as soon as its own klines arrive
+        pending = [symbol_key for symbol_key in self.symbols
+                   if symbol_key not in self.sparkline_initialized
+                   and symbol_key not in self._priming]
+        if pending:
+            self._priming.update(pending)
+            self.client.map(self._prime_price_history, pending,
+                            callback=self._on_history_primed,
+                            done=lambda _results: self._priming.difference_update(pending))
+        return future
+
+    def _collect_market_data(self, symbol_keys):
+        """Runs on the REST worker pool; feeds the market data store"""
+        tickers = get_24hr_tickers([self.symbols[key] for key in symbol_keys])
+        return self.market.apply_tickers(tickers) or None
+
+    def _sample_history(self, _updated=None):
+        """Append one price per symbol so sparklines keep a steady time step"""
+        self.widget_touches = 0
+        visible = self.frame.winfo_ismapped()
+        for symbol_key in self.symbols:
+            price = self.market.price(symbol_key)
+            if not price:
                 continue
-            results[symbol_key] = {"price": price,
-                                   "change_percent": change_percent}
-        if results:
-            self.parent.after(0, lambda: self._apply_updates(results))
+            history = self.price_history[symbol_key]
+            history.append(price)
+            sparkline = self.sparklines.get(symbol_key)
+            if visible and sparkline and self._draw_sparkline(sparkline, history.view()):
+                self.widget_touches += 1
+        if not visible:
+            self._view_stale = True
+        self.total_widget_touches += self.widget_touches
+        self._trigger_chart_refresh()
 
     def _apply_updates(self, data):
-        # Calculate portfolio balance (sum of all symbol prices for demo purposes)
-        # In a real app, this would be based on actual holdings
-        balance = 0.0
+        """Market data subscriber; ``data`` holds only the changed quotes"""
+        data = {key: quote for key, quote in data.items() if key in self.symbols}
+        if not data:
+            return
+        self.widget_touches = 0
+        self._latest_quotes.update(data)
+
+        # Widgets of a hidden panel are left alone; <Map> catches them up
+        visible = self.frame.winfo_ismapped()
+        if visible:
+            self._render_quotes(data)
+        else:
+            self._view_stale = True
+
+        # Covers the quote plus the mock total and balance labels
+        self._update_exchange_quote()
+        self._update_buy_holdings_display()
+        self._update_sell_holdings_display()
+
+        if visible and self.chart_symbol in data:
+            self._update_chart_preview()
+        self.total_widget_touches += self.widget_touches
+
+    def _configure(self, shown, key, widget, **options):
+        """Apply only the options that differ from what ``widget`` already shows"""
+        current = shown.setdefault(key, {})
+        changed = {name: value for name, value in options.items()
+                   if current.get(name) != value}
+        if changed:
+            widget.config(**changed)
+            current.update(changed)
+            self.widget_touches += 1
+
+    def _set_var(self, var, value):
+        if var.get() != value:
+            var.set(value)
+            self.widget_touches += 1
+
+    def _render_quotes(self, data):
         for symbol_key, payload in data.items():
             price = payload["price"]
             change_percent = payload["change_percent"]
-            self.latest_prices[symbol_key] = price
-            history = self.price_history[symbol_key]
-            history.append(price)
-            self.price_history[symbol_key] = history[-120:]
-            # For demo: sum all prices (in real app, multiply by holdings)
-            balance += price
+            sign = "+" if change_percent >= 0 else ""
+            change_text = f"{sign}{change_percent:.2f}%"
 
             favorite = self.favorite_cards.get(symbol_key)
             if favorite:
-                # Determine colors based on price change
                 if change_percent >= 0:
-                    # Green shades for positive changes
-                    bg_color = "#d1fae5"  # Light green background
-                    text_color = "#065f46"  # Dark green text
-                    change_color = "#059669"  # Medium green for change text
+                    bg_color, text_color, change_color = "#d1fae5", "#065f46", "#059669"
                 else:
-                    # Red shades for negative changes
-                    bg_color = "#fee2e2"  # Light red background
-                    text_color = "#7f1d1d"  # Dark red text
-                    change_color = "#dc2626"  # Medium red for change text
-
-                # Update background colors
-                favorite["inner"].config(bg=bg_color)
-                favorite["price"].config(
-                    text=f"$ {price:,.2f}", bg=bg_color, fg=text_color)
-                favorite["subtitle"].config(bg=bg_color, fg=text_color)
-                favorite["change"].config(bg=bg_color, fg=change_color)
-
-                sign = "+" if change_percent >= 0 else ""
-                favorite["change"].config(text=f"{sign}{change_percent:.2f}%")
+                    bg_color, text_color, change_color = "#fee2e2", "#7f1d1d", "#dc2626"
+                shown = favorite["shown"]
+                self._configure(shown, "inner", favorite["inner"], bg=bg_color)
+                self._configure(shown, "price", favorite["price"],
+                                text=f"$ {price:,.2f}", bg=bg_color, fg=text_color)
+                self._configure(shown, "subtitle", favorite["subtitle"],
+                                bg=bg_color, fg=text_color)
+                self._configure(shown, "change", favorite["change"],
+                                text=change_text, bg=bg_color, fg=change_color)
 
             row = self.market_rows.get(symbol_key)
             if row:
-                sign = "+" if change_percent >= 0 else ""
+                shown = row["shown"]
                 fg = "#16a34a" if change_percent >= 0 else "#dc2626"
-                row["change"].config(
-                    text=f"{sign}{change_percent:.2f}%", fg=fg)
-                row["price"].config(text=f"{price:,.2f} USD")
-                canvas = self.spark_canvases.get(symbol_key)
-                if canvas:
-                    self._draw_sparkline(
-                        canvas, self.price_history[symbol_key], symbol_key)
-
-        # Update exchange quote when prices change
-        self._update_exchange_quote()
-        # Update buy/sell holdings displays if they exist
-        if hasattr(self, "buy_holdings_display_var"):
-            self._update_buy_holdings_display()
-        if hasattr(self, "sell_holdings_display_var"):
-            self._update_sell_holdings_display()
-        # Update total
-        self._calculate_mock_total()
-        if hasattr(self, "exchange_total_var"):
-            self.exchange_total_var.set(f"Total: $ {self.mock_total:,.2f}")
-        if hasattr(self, "exchange_balance_var"):
-            self.exchange_balance_var.set(f"$ {self.mock_balance:,.2f} USD")
-
-        # Update Total and Balance displays
-        self._calculate_mock_total()
-        if hasattr(self, "exchange_total_var"):
-            self.exchange_total_var.set(f"Total: $ {self.mock_total:,.2f}")
-
-        if hasattr(self, "exchange_balance_var"):
-            self.exchange_balance_var.set(f"$ {self.mock_balance:,.2f} USD")
-
-        self._trigger_chart_refresh()
-        self._update_chart_preview()
-
-    def _draw_sparkline(self, canvas, data, symbol):
-        canvas.delete("all")
+                self._configure(shown, "change", row["change"], text=change_text, fg=fg)
+                self._configure(shown, "price", row["price"], text=f"{price:,.2f} USD")
+                sparkline = self.sparklines.get(symbol_key)
+                if sparkline and self._draw_sparkline(
+                        sparkline, self.price_history[symbol_key].view()):
+                    self.widget_touches += 1
+
+    def _on_frame_map(self, _event=None):
+        if self._view_stale and self._latest_quotes:
+            self._view_stale = False
+            self._render_quotes(self._latest_quotes)
+            self._update_chart_preview()
+
+    def _draw_sparkline(self, sparkline, data):
         if len(data) < 2:
-            return
-        canvas.update_idletasks()
-        w = max(10, int(canvas.winfo_width() or canvas["width"]))
-        h = max(10, int(canvas.winfo_height() or canvas["height"]))
-        margin = 8
-        usable_w = w - margin * 2
-        usable_h = h - margin * 2
-        normalized = self._resample_series(data, 60)
-        min_price = min(normalized)
-        max_price = max(normalized)
-        span = max(max_price - min_price, 1e-6)
-        style = SPARKLINE_STYLES.get(symbol, {})
-        base_line = style.get("line", "#3b82f6")
-        base_fill = style.get("fill", "#dbeafe")
-        actual_trend_up = normalized[-1] >= normalized[0]
-        line_color = "#16a34a" if actual_trend_up else "#dc2626"
-        # Use green gradient for upward trends, red gradient for downward trends
-        # Light green for up, light red for down
-        fill_color = "#d1fae5" if actual_trend_up else "#fee2e2"
-
-        points = []
-        total_points = len(normalized)
-        for idx, price in enumerate(normalized):
-            x = margin + (idx / max(1, total_points - 1)) * usable_w
-            y = margin + usable_h - ((price - min_price) / span * usable_h)
-            points.extend([x, y])
-        baseline = margin + usable_h
-        point_pairs = list(zip(points[0::2], points[1::2]))
-        for (x0, y0), (x1, y1) in zip(point_pairs[:-1], point_pairs[1:]):
-            avg_ratio = 1 - ((y0 + y1) / 2 - margin) / usable_h
-            shade = self._soften_color(fill_color, 1 - avg_ratio * 0.8)
-            canvas.create_polygon(
-                x0,
-                baseline,
-                x0,
-                y0,
-                x1,
-                y1,
-                x1,
-                baseline,
-                fill=shade,
-                outline="",
-            )
-        canvas.create_line(points, fill=line_color, width=3, smooth=True)
+            return False
+        return sparkline.update(resample(data, sparkline.points))
 
     def _update_chart_preview(self):
         symbol = self.chart_symbol
-        price = self.latest_prices.get(symbol)
-        history = self.price_history.get(symbol, [])
+        price = self.market.price(symbol)
+        history = self.price_history.get(symbol)
         change = 0.0
         candles = self.chart_candles
         if candles:
@@ -1452,80 +1488,30 @@ class OverviewPanel:
             end = candles[-1]["close"]
             change = ((end - start) / start * 100) if start else 0.0
         elif history:
-            change = ((history[-1] - history[0]) /
-                      history[0] * 100) if history[0] else 0.0
+            first = history.first
+            change = ((history.last - first) / first * 100) if first else 0.0
         if price:
             self.chart_price_var.set(f"$ {price:,.2f}")
-        updates = len(candles) if candles else len(history)
+        updates = len(candles) if candles else len(history or ())
         label = "candles" if candles else "updates"
         self.chart_change_var.set(f"{change:+.2f}% (last {updates} {label})")
         self.chart_title_var.set(f"{symbol} Overview")
-        self.chart_canvas.delete("all")
-        if len(self.chart_candles) < 1:
+        if not self.chart_candles:
+            self.chart_preview.clear()
             return
-        self.chart_canvas.update_idletasks()
-        w = self.chart_canvas.winfo_width() or 320
-        h = self.chart_canvas.winfo_height() or 220
-        margin = 18
-        usable_w = max(10, w - margin * 2)
-        usable_h = max(10, h - margin * 2)
-        highs = [c["high"] for c in self.chart_candles]
-        lows = [c["low"] for c in self.chart_candles]
-        max_price = max(highs)
-        min_price = min(lows)
-        span = max(max_price - min_price, 1e-6)
-        candle_count = len(self.chart_candles)
-        gap = usable_w / candle_count
-        body_width = max(4, gap * 0.4)
-        grid_lines = 6
-        for i in range(grid_lines):
-            y = margin + usable_h * (i / (grid_lines - 1))
-            self.chart_canvas.create_line(
-                margin, y, margin + usable_w, y, fill="#d1d5db", dash=(2,))
-            price_level = max_price - (span * i / (grid_lines - 1))
-            self.chart_canvas.create_text(
-                margin + usable_w + 50, y, text=f"$ {price_level:,.0f}", fill="#6b7280", font=("Helvetica", 10))
-
-        for idx, candle in enumerate(self.chart_candles):
-            open_p = candle["open"]
-            close_p = candle["close"]
-            high_p = candle["high"]
-            low_p = candle["low"]
-            color = "#16a34a" if close_p >= open_p else "#dc2626"
-
-            x_center = margin + idx * gap + gap / 2
-            x0 = x_center - body_width / 2
-            x1 = x_center + body_width / 2
-
-            def y(price):
-                return margin + usable_h - ((price - min_price) / span * usable_h)
-
-            y_open = y(open_p)
-            y_close = y(close_p)
-            y_high = y(high_p)
-            y_low = y(low_p)
-
-            self.chart_canvas.create_line(
-                x_center, y_high, x_center, y_low, fill=color, width=2)
-            self.chart_canvas.create_rectangle(
-                x0,
-                min(y_open, y_close),
-                x1,
-                max(y_open, y_close),
-                fill=color,
-                outline=color,
-            )
-        time_labels = self._build_time_labels(self.chart_candles)
-        for ratio, label in time_labels:
-            x = margin + usable_w * ratio
-            y = margin + usable_h + 12
-            self.chart_canvas.create_text(
-                x, y, text=label, fill="#0f172a", font=("Helvetica", 11, "bold"))
+        candles = self._decimate_candles(
+            self.chart_candles,
+            int(self.chart_preview.usable_width() // PREVIEW_MIN_CANDLE_PX))
+        self.chart_preview.render(candles, self._build_time_labels(candles))
 
     def _update_exchange_quote(self):
+        self._update_quote_text()
+        self._update_totals()
+
+    def _update_quote_text(self):
         symbol = self.exchange_asset_var.get()
         if not symbol or symbol not in self.symbols:
-            self.exchange_quote_var.set("$ -- USD")
+            self._set_var(self.exchange_quote_var, "$ -- USD")
             return
 
         try:
@@ -1537,24 +1523,25 @@ class OverviewPanel:
         except (TypeError, ValueError):
             amount = 0.0
 
-        price = self.latest_prices.get(symbol, 0.0)
+        price = self.market.price(symbol)
         if price <= 0:
-            self.exchange_quote_var.set("$ -- USD")
+            self._set_var(self.exchange_quote_var, "$ -- USD")
             return
 
         quote = amount * price
         if quote > 0:
-            self.exchange_quote_var.set(f"$ {quote:,.2f} USD")
+            self._set_var(self.exchange_quote_var, f"$ {quote:,.2f} USD")
         else:
-            self.exchange_quote_var.set("$ 0.00 USD")
+            self._set_var(self.exchange_quote_var, "$ 0.00 USD")
 
-        # Update Total and Balance displays
+    def _update_totals(self):
+        """Recompute the mock total and refresh the Total and Balance displays"""
         self._calculate_mock_total()
         if hasattr(self, "exchange_total_var"):
-            self.exchange_total_var.set(f"Total: $ {self.mock_total:,.2f}")
+            self._set_var(self.exchange_total_var, f"Total: $ {self.mock_total:,.2f}")
 
         if hasattr(self, "exchange_balance_var"):
-            self.exchange_balance_var.set(f"$ {self.mock_balance:,.2f} USD")
+            self._set_var(self.exchange_balance_var, f"$ {self.mock_balance:,.2f} USD")
 
     def _convert_to_usd(self):
         """Convert asset to USD (mock function inspired from Wallet)"""
@@ -1570,7 +1557,7 @@ class OverviewPanel:
         if not symbol or symbol not in self.symbols:
             return
 
-        price = self.latest_prices.get(symbol, 0)
+        price = self.market.price(symbol)
         if price <= 0:
             return
 
@@ -1607,7 +1594,7 @@ class OverviewPanel:
         if not symbol or symbol not in self.symbols:
             return
 
-        price = self.latest_prices.get(symbol, 0)
+        price = self.market.price(symbol)
         if price <= 0:
             if hasattr(self, "exchange_status_var"):
                 self.exchange_status_var.set(
@@ -1651,11 +1638,11 @@ class OverviewPanel:
         """Calculate mock total from balance and holdings"""
         total = self.mock_balance
         for symbol, amount in self.mock_holdings.items():
-            price = self.latest_prices.get(symbol, 0)
+            price = self.market.price(symbol)
             total += amount * price
         self.mock_total = total
 
-    def sync_from_wallet(self, balance, holdings, total_value=None):
+    def sync_from_wallet(self, balance, holdings):
         """Sync balance and holdings from wallet panel"""
         self.mock_balance = balance
         # Update holdings for all symbols
@@ -1664,11 +1651,8 @@ class OverviewPanel:
         # Update displays
         self._update_buy_holdings_display()
         self._update_sell_holdings_display()
-        # Use provided total_value if available, otherwise calculate
-        if total_value is not None:
-            self.mock_total = total_value
-        else:
-            self._calculate_mock_total()
+        # Prices come from the shared market data store, same as the wallet's
+        self._calculate_mock_total()
         if hasattr(self, "exchange_total_var"):
             self.exchange_total_var.set(f"Total: $ {self.mock_total:,.2f}")
         if hasattr(self, "exchange_balance_var"):
@@ -1696,37 +1680,56 @@ class OverviewPanel:
         self._trigger_chart_refresh()
         self._update_chart_preview()
 
+    def _load_cached_chart(self):
+        """Draw the chart symbol's candles from memory or disk, without the network"""
+        symbol_key = self.chart_symbol
+        symbol = self.symbols.get(symbol_key)
+        if not symbol or self._chart_candles_symbol == symbol_key:
+            return
+        cached = self._rows_to_candles(self.kline_store.cached(symbol, "1h", 60))
+        # Never leave the previous symbol's candles under the new title
+        previous, self.chart_candles = self.chart_candles, cached[-40:]
+        self._chart_candles_symbol = symbol_key if cached else None
+        if cached or previous:
+            self._update_chart_preview()
+
     def _trigger_chart_refresh(self):
-        if self._chart_fetch_inflight:
+        # Seed the preview from disk at once; the fetch below reconciles
+        self._load_cached_chart()
+        if self._chart_fetch_inflight or not self.is_running:
             return
         self._chart_fetch_inflight = True
-        threading.Thread(target=self._refresh_chart_candles,
-                         args=(self.chart_symbol,), daemon=True).start()
+        symbol_key = self.chart_symbol
+        self.client.run(
+            self._refresh_chart_candles,
+            symbol_key,
+            callback=lambda candles: self._apply_chart_candles(
+                symbol_key, candles),
+        )
 
     def _refresh_chart_candles(self, symbol_key):
         symbol = self.symbols.get(symbol_key)
         candles = []
         try:
             if symbol:
-                data = get_klines(symbol, interval="1h", limit=60)
-                if data:
-                    for entry in data:
-                        try:
-                            candles.append(
-                                {
-                                    "open": float(entry[1]),
-                                    "high": float(entry[2]),
-                                    "low": float(entry[3]),
-                                    "close": float(entry[4]),
-                                    "time": float(entry[0]),
-                                }
-                            )
-                        except (TypeError, ValueError):
-                            continue
+                candles = self._rows_to_candles(
+                    self.kline_store.fetch(symbol, "1h", 60))
         finally:
             self._chart_fetch_inflight = False
-        self.parent.after(
-            0, lambda: self._apply_chart_candles(symbol_key, candles))
+        return candles
+
+    @staticmethod
+    def _rows_to_candles(rows):
+        return [
+            {
+                "open": row[1],
+                "high": row[2],
+                "low": row[3],
+                "close": row[4],
+                "time": row[0],
+            }
+            for row in rows.tolist()
+        ]
 
     def _apply_chart_candles(self, symbol_key, candles):
         self._chart_fetch_inflight = False
@@ -1734,8 +1737,21 @@ class OverviewPanel:
             return
         if candles:
             self.chart_candles = candles[-40:]
+            self._chart_candles_symbol = symbol_key
         self._update_chart_preview()
 
+    @staticmethod
+    def _decimate_candles(candles, max_points):
+        """Merge neighbouring candles so at most ``max_points`` are drawn"""
+        if len(candles) <= max_points:
+            return candles
+        rows = np.array(
+            [[c["time"], c["open"], c["high"], c["low"], c["close"], 0.0]
+             for c in candles]
+        )
+        merged, _starts = merge_candles(rows, max(1, max_points))
+        return OverviewPanel._rows_to_candles(merged)
+
     def _build_time_labels(self, candles):
         if not candles:
             return [(0.0, "--")]
@@ -1760,52 +1776,27 @@ class OverviewPanel:
             labels.append((ratio, dt.strftime("%H:%M")))
         return labels if labels else [(0.0, "--")]
 
-    def _soften_color(self, hex_color, t):
-        hex_color = hex_color.lstrip("#")
-        if len(hex_color) != 6:
-            hex_color = "3b82f6"
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        r = int(r + (255 - r) * t)
-        g = int(g + (255 - g) * t)
-        b = int(b + (255 - b) * t)
-        return f"#{r:02x}{g:02x}{b:02x}"
-
-    def _resample_series(self, data, length):
-        if len(data) >= length:
-            return data[-length:]
-        if len(data) < 2:
-            return [data[0]] * length
-        resampled = []
-        last_index = len(data) - 1
-        for i in range(length):
-            target = i * last_index / (length - 1)
-            low = int(target)
-            high = min(last_index, low + 1)
-            blend = target - low
-            value = data[low] * (1 - blend) + data[high] * blend
-            resampled.append(value)
-        return resampled
-
     def _prime_price_history(self, symbol_key):
-        if symbol_key in self.sparkline_initialized:
-            return
+        """Runs on the REST worker pool; returns a filled history buffer or None"""
         symbol = self.symbols.get(symbol_key)
         if not symbol:
+            return None
+        rows = self.kline_store.fetch(symbol, "1h", 80, priority=PRIORITY_LOW)
+        if not len(rows):
+            return None
+        return RingBuffer(PRICE_HISTORY_LENGTH, rows[:, 4])
+
+    def _on_history_primed(self, symbol_key, history):
+        if history is None:
             return
-        data = get_klines(symbol, interval="1h", limit=80)
-        if not data:
-            return
-        prices = []
-        for entry in data:
-            try:
-                prices.append(float(entry[4]))
-            except (TypeError, ValueError):
-                continue
-        if prices:
-            self.price_history[symbol_key] = prices[-120:]
-            self.sparkline_initialized.add(symbol_key)
+        price = self.market.price(symbol_key)
+        if price:
+            history.append(price)
+        self.price_history[symbol_key] = history
+        self.sparkline_initialized.add(symbol_key)
+        sparkline = self.sparklines.get(symbol_key)
+        if sparkline and self.frame.winfo_ismapped():
+            self._draw_sparkline(sparkline, history.view())
 
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
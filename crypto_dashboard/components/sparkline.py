@@ -0,0 +1,123 @@
+import tkinter as tk
+
+import numpy as np
+
+SPARKLINE_POINTS = 60
+SHADE_LEVELS = 24
+UP_COLORS = ("#16a34a", "#d1fae5")    # line, gradient base
+DOWN_COLORS = ("#dc2626", "#fee2e2")
+
+_shade_cache = {}
+
+
+def soften_color(hex_color, t):
+    """Blend ``hex_color`` towards white by ``t`` (0..1)."""
+    hex_color = hex_color.lstrip("#")
+    if len(hex_color) != 6:
+        hex_color = "3b82f6"
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    r = int(r + (255 - r) * t)
+    g = int(g + (255 - g) * t)
+    b = int(b + (255 - b) * t)
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def gradient_shades(fill_color):
+    """Precomputed shades from the top of the chart (index 0) to the baseline."""
+    shades = _shade_cache.get(fill_color)
+    if shades is None:
+        # Same blend as the old per-segment soften_color(fill, 1 - ratio * 0.8)
+        shades = [
+            soften_color(fill_color, 0.2 + 0.8 * level / (SHADE_LEVELS - 1))
+            for level in range(SHADE_LEVELS)
+        ]
+        _shade_cache[fill_color] = shades
+    return shades
+
+
+class Sparkline:
+    """Gradient-filled trend line drawn with a fixed set of canvas items.
+
+    Items are created once; updates move them with ``coords`` and only
+    recolor segments whose shade changed. Identical series are skipped.
+    """
+
+    def __init__(self, canvas, points=SPARKLINE_POINTS, margin=8):
+        self.canvas = canvas
+        self.points = points
+        self.margin = margin
+        self.segments = [
+            canvas.create_polygon(0, 0, 0, 0, 0, 0, outline="", state=tk.HIDDEN)
+            for _ in range(points - 1)
+        ]
+        self.line = canvas.create_line(0, 0, 0, 0, width=3, smooth=True, state=tk.HIDDEN)
+        self._fills = [None] * (points - 1)
+        self._line_color = None
+        self._key = None
+        self.renders = 0
+        self.skipped = 0
+
+    def _size(self):
+        canvas = self.canvas
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        # Before the first layout pass Tk reports 1x1; use the requested size
+        if width <= 1:
+            width = int(canvas["width"])
+        if height <= 1:
+            height = int(canvas["height"])
+        return max(10, width), max(10, height)
+
+    def update(self, values):
+        """Draw ``values`` (exactly ``points`` long); returns False if skipped."""
+        if len(values) != self.points:
+            return False
+        values = np.asarray(values, dtype=float)
+        w, h = self._size()
+        key = (w, h, values.tobytes())
+        if key == self._key:
+            self.skipped += 1
+            return False
+        self._key = key
+
+        canvas = self.canvas
+        margin = self.margin
+        usable_w = w - margin * 2
+        usable_h = h - margin * 2
+        min_price = values.min()
+        span = max(values.max() - min_price, 1e-6)
+        trend_up = values[-1] >= values[0]
+        line_color, fill_color = UP_COLORS if trend_up else DOWN_COLORS
+        shades = gradient_shades(fill_color)
+
+        bottom = margin + usable_h
+        xs = np.linspace(margin, margin + usable_w, self.points)
+        ys = bottom - (values - min_price) * (usable_h / span)
+        # Segment height as a 0..1 ratio picks the shade; taller is darker
+        ratios = (bottom - (ys[:-1] + ys[1:]) / 2) / usable_h
+        levels = (SHADE_LEVELS - 1) - np.rint(ratios * (SHADE_LEVELS - 1)).astype(int)
+
+        fills = self._fills
+        quads = np.column_stack([
+            xs[:-1], np.full(len(ratios), bottom), xs[:-1], ys[:-1],
+            xs[1:], ys[1:], xs[1:], np.full(len(ratios), bottom),
+        ]).tolist()
+        for idx, (item, quad, level) in enumerate(zip(self.segments, quads, levels.tolist())):
+            canvas.coords(item, *quad)
+            shade = shades[level]
+            if fills[idx] != shade:
+                canvas.itemconfigure(item, fill=shade)
+                fills[idx] = shade
+
+        canvas.coords(self.line, *np.column_stack([xs, ys]).ravel().tolist())
+        if line_color != self._line_color:
+            canvas.itemconfigure(self.line, fill=line_color)
+            self._line_color = line_color
+        if self.renders == 0:
+            for item in self.segments:
+                canvas.itemconfigure(item, state=tk.NORMAL)
+            canvas.itemconfigure(self.line, state=tk.NORMAL)
+        self.renders += 1
+        return True
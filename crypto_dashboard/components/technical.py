@@ -1,23 +1,50 @@
 import os
 import sys
-import tkinter as tk
+import time
 import threading
-from datetime import datetime
+import tkinter as tk
+from datetime import datetime, timezone
+import numpy as np
 import matplotlib.dates as mdates
+from matplotlib.colors import to_rgba
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.lines import Line2D
 from matplotlib.patches import Rectangle
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 if __package__ is None or __package__ == "":
     current_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(os.path.dirname(current_dir))
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
-    from utils.binance_rest import get_klines  # type: ignore
-    from config import TECHNICAL_REFRESH_MS  # type: ignore
+    from utils.async_rest import get_async_client  # type: ignore
+    from utils.scheduler import get_scheduler  # type: ignore
+    from utils.stream_manager import get_stream_manager  # type: ignore
+    from utils.kline_store import get_kline_store  # type: ignore
+    from utils.indicators import IndicatorEngine  # type: ignore
+    from utils.decimate import merge_candles, lttb  # type: ignore
+    from config import (  # type: ignore
+        TECHNICAL_REFRESH_MS,
+        TECHNICAL_LIVE_RENDER_MS,
+        KLINE_BASE_INTERVAL,
+        TECHNICAL_MIN_CANDLE_PX,
+        TECHNICAL_MAX_CANDLES,
+    )
 else:
-    from ..utils.binance_rest import get_klines
-    from ..config import TECHNICAL_REFRESH_MS
+    from ..utils.async_rest import get_async_client
+    from ..utils.scheduler import get_scheduler
+    from ..utils.stream_manager import get_stream_manager
+    from ..utils.kline_store import get_kline_store
+    from ..utils.indicators import IndicatorEngine
+    from ..utils.decimate import merge_candles, lttb
+    from ..config import (
+        TECHNICAL_REFRESH_MS,
+        TECHNICAL_LIVE_RENDER_MS,
+        KLINE_BASE_INTERVAL,
+        TECHNICAL_MIN_CANDLE_PX,
+        TECHNICAL_MAX_CANDLES,
+    )
 
 LIGHT_CHART_THEME = {
     "panel": "#ffffff",
@@ -31,16 +58,51 @@ LIGHT_CHART_THEME = {
     "accent_orange": "#f97316",
 }
 
+CHART_CANDLES = 50
+MIN_VISIBLE_CANDLES = 20
+ZOOM_STEP = 1.5
+INDICATOR_WARMUP = 50  # extra history fetched so overlays start fully formed
+HISTORY_CANDLES = CHART_CANDLES + INDICATOR_WARMUP
+
+# (indicator key, label, color, line style)
+OVERLAYS = (
+    ("sma", "SMA 20", "#2563eb", "-"),
+    ("ema", "EMA 9", "#9333ea", "-"),
+    ("bb_upper", "BB 20, 2", "#94a3b8", "--"),
+    ("bb_lower", None, "#94a3b8", "--"),
+)
+
 
 class TechnicalPanel:
-    """Render a candlestick chart with SMA under a dark theme"""
+    """Render a candlestick chart with indicator overlays"""
 
-    def __init__(self, parent, symbol, interval="1h", theme=None):
+    def __init__(self, parent, symbol, interval="1h", theme=None, live=True):
         self.parent = parent
         self.symbol = symbol.upper()
         self.interval = interval
         self.theme = {**LIGHT_CHART_THEME, **(theme or {})}
         self.is_running = False
+        self.live = live
+        self.client = get_async_client()
+        self.scheduler = get_scheduler()
+        self.streams = get_stream_manager()
+        self.store = get_kline_store()
+        self.indicators = IndicatorEngine()
+        self.last_render_ms = 0.0
+        self.last_blit_ms = 0.0
+        self._layout_done = False
+        self._columns = None
+        self._display = None
+        self._bucket_start = 0
+        self.visible_candles = CHART_CANDLES
+        self._candle_width = 0.02
+        self._x_dates = None
+        self._background = None
+        self._live_stream = None
+        self._live_interval = None
+        self._live_pending = None
+        self._live_lock = threading.Lock()
+        self._live_job = None
 
         self.frame = tk.Frame(
             parent,
@@ -56,138 +118,369 @@ class TechnicalPanel:
         self.price_ax = self.fig.add_subplot(grid[:5, 0])
         self.volume_ax = self.fig.add_subplot(grid[5, 0], sharex=self.price_ax)
         self.fig.patch.set_facecolor(self.theme.get("panel", "#111"))
-        for ax in (self.price_ax, self.volume_ax):
-            ax.set_facecolor(self.theme.get("bg", "#000"))
-            for spine in ax.spines.values():
-                spine.set_color(self.theme.get("divider", "#2b2b2b"))
-            ax.tick_params(colors=self.theme.get("text_muted", "#ccc"))
-        self.price_ax.set_ylabel("Price", color=self.theme.get("text_muted", "#ccc"))
-        self.volume_ax.set_ylabel("Volume", color=self.theme.get("text_muted", "#ccc"))
+        self._style_axes()
+        self._create_artists()
         self.fig.subplots_adjust(bottom=0.15, top=0.96)
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.frame)
         self.canvas.get_tk_widget().pack(fill="both", expand=True, pady=(10, 0))
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.mpl_connect("scroll_event", self._on_scroll)
+
+    def _style_axes(self):
+        bg = self.theme.get("bg", "#000")
+        divider = self.theme.get("divider", "#2b2b2b")
+        text_muted = self.theme.get("text_muted", "#ccc")
+        for ax in (self.price_ax, self.volume_ax):
+            ax.set_facecolor(bg)
+            for spine in ax.spines.values():
+                spine.set_color(divider)
+            # Add horizontal grid lines (rows) - solid lines for better visibility
+            ax.grid(True, which='major', axis='y', color=divider, linestyle="-", linewidth=0.8, alpha=0.5)
+            ax.grid(True, which='minor', axis='y', color=divider, linestyle="--", linewidth=0.4, alpha=0.3)
+            ax.minorticks_on()
+            ax.tick_params(colors=text_muted)
+
+        formatter = mdates.DateFormatter("%b %d, %H:%M")
+        self.price_ax.xaxis.set_major_formatter(formatter)
+        self.volume_ax.xaxis.set_major_formatter(formatter)
+        self.price_ax.tick_params(axis="x", labelbottom=False)
+        self.price_ax.set_ylabel("Price", color=text_muted)
+        self.volume_ax.set_ylabel("Volume", color=text_muted)
+        self.volume_ax.set_xlabel("Time", color=text_muted)
+
+    def _create_artists(self):
+        """Create the few artists that every refresh updates in place"""
+        self._up_rgba = np.array(to_rgba(self.theme.get("accent_green", "#10b981")))
+        self._down_rgba = np.array(to_rgba(self.theme.get("accent_red", "#ef4444")))
+        self.body_collection = PolyCollection([], linewidths=0.8)
+        self.wick_collection = LineCollection([], linewidths=1)
+        self.price_ax.add_collection(self.wick_collection)
+        self.price_ax.add_collection(self.body_collection)
+        self.volume_bars = None
+        self.overlay_lines = {}
+        for key, label, color, style in OVERLAYS:
+            (line,) = self.price_ax.plot([], [], color=color, linestyle=style,
+                                         linewidth=1, label=label or "_nolegend_")
+            self.overlay_lines[key] = line
+        legend = self.price_ax.legend(loc="upper left", fontsize=8, frameon=False)
+        for text in legend.get_texts():
+            text.set_color(self.theme.get("text_muted", "#ccc"))
+        # The forming candle is drawn by animated artists so ticks can be
+        # blitted over a cached background instead of redrawing the figure.
+        self.live_wick = Line2D([], [], linewidth=1, animated=True)
+        self.live_body = Rectangle((0, 0), 0, 0, linewidth=0.8, animated=True)
+        self.live_volume = Rectangle((0, 0), 0, 0, alpha=0.6, animated=True)
+        self.price_ax.add_line(self.live_wick)
+        self.price_ax.add_patch(self.live_body)
+        self.volume_ax.add_patch(self.live_volume)
+        self.last_point = self.price_ax.scatter(
+            [],
+            [],
+            color=self.theme.get("accent_orange", "#f59e0b"),
+            edgecolors=self.theme.get("panel", "#111"),
+            linewidth=1,
+            s=50,
+            zorder=5,
+            animated=True,
+        )
+        self.title = self.price_ax.set_title(
+            "",
+            color=self.theme.get("text_primary", "#fff"),
+            fontsize=12,
+        )
 
     def start(self):
         if self.is_running:
             return
         self.is_running = True
-        self.schedule_refresh()
+        self._subscribe_live()
+        self.scheduler.add("technical", TECHNICAL_REFRESH_MS, self.refresh_chart)
 
     def stop(self):
         self.is_running = False
+        self.scheduler.remove("technical")
+        self._unsubscribe_live()
 
-    def schedule_refresh(self):
-        if not self.is_running:
+    def refresh_chart(self):
+        """Start a kline fetch; returns its future for the scheduler."""
+        symbol, interval = self.symbol, self.interval
+        if self._columns is None:
+            # Draw whatever earlier runs left on disk while the network catches up
+            cached = self.store.window(symbol, interval, self._history_limit(), cached_only=True)
+            if len(cached) > 1:
+                self.render(cached)
+        return self.client.run(
+            self._load_window,
+            symbol,
+            interval,
+            self._history_limit(),
+            callback=lambda columns: self._apply_klines(symbol, interval, columns),
+        )
+
+    def _load_window(self, symbol, interval, limit):
+        """Runs on the REST worker pool; None when the store came back empty"""
+        columns = self.store.window(symbol, interval, limit)
+        return columns if len(columns) else None
+
+    def _apply_klines(self, symbol, interval, columns):
+        if columns is None or not len(columns):
             return
-        thread = threading.Thread(target=self.refresh_chart, daemon=True)
-        thread.start()
-        self.parent.after(TECHNICAL_REFRESH_MS, self.schedule_refresh)
+        if symbol != self.symbol or interval != self.interval:
+            return
+        self.render(columns)
 
-    def refresh_chart(self):
-        data = get_klines(self.symbol, interval=self.interval, limit=50)
-        if not data:
-            return
-
-        opens = [float(candle[1]) for candle in data]
-        highs = [float(candle[2]) for candle in data]
-        lows = [float(candle[3]) for candle in data]
-        closes = [float(candle[4]) for candle in data]
-        volumes = [float(candle[5]) for candle in data]
-        timestamps = [datetime.fromtimestamp(float(candle[0]) / 1000) for candle in data]
-        x_dates = mdates.date2num(timestamps)
-
-        def update_plot():
-            self.price_ax.clear()
-            self.volume_ax.clear()
-
-            bg = self.theme.get("bg", "#000")
-            divider = self.theme.get("divider", "#2b2b2b")
-            text_muted = self.theme.get("text_muted", "#ccc")
-            up_color = self.theme.get("accent_green", "#10b981")
-            down_color = self.theme.get("accent_red", "#ef4444")
-            last_point_color = self.theme.get("accent_orange", "#f59e0b")
-
-            for ax in (self.price_ax, self.volume_ax):
-                ax.set_facecolor(bg)
-                for spine in ax.spines.values():
-                    spine.set_color(divider)
-                # Add horizontal grid lines (rows) - solid lines for better visibility
-                ax.grid(True, which='major', axis='y', color=divider, linestyle="-", linewidth=0.8, alpha=0.5)
-                ax.grid(True, which='minor', axis='y', color=divider, linestyle="--", linewidth=0.4, alpha=0.3)
-                ax.minorticks_on()
-                ax.tick_params(colors=text_muted)
-
-            candle_width = 0.6 * (x_dates[1] - x_dates[0]) if len(x_dates) > 1 else 0.02
-            body_min_height = (max(highs) - min(lows)) * 0.001 or 0.1
-
-            for idx, date in enumerate(x_dates):
-                open_price = opens[idx]
-                close_price = closes[idx]
-                high = highs[idx]
-                low = lows[idx]
-                color = up_color if close_price >= open_price else down_color
-                lower = min(open_price, close_price)
-                height = max(abs(close_price - open_price), body_min_height)
-                rect = Rectangle(
-                    (date - candle_width / 2, lower),
-                    candle_width,
-                    height,
-                    facecolor=color,
-                    edgecolor=color,
-                )
-                self.price_ax.add_patch(rect)
-                self.price_ax.vlines(
-                    date,
-                    low,
-                    high,
-                    color=color,
-                    linewidth=1,
-                )
-
-                self.volume_ax.bar(
-                    date,
-                    volumes[idx],
-                    width=candle_width * 0.7,
-                    color=color,
-                    alpha=0.6,
-                    align="center",
-                )
-
-            self.price_ax.scatter(
-                x_dates[-1],
-                closes[-1],
-                color=last_point_color,
-                edgecolors=self.theme.get("panel", "#111"),
-                linewidth=1,
-                s=50,
-                zorder=5,
-            )
+    @staticmethod
+    def _to_chart_dates(open_times_ms):
+        """Convert open times to matplotlib dates in local wall-clock time"""
+        last = datetime.fromtimestamp(open_times_ms[-1] / 1000)
+        utc = datetime.fromtimestamp(open_times_ms[-1] / 1000, timezone.utc)
+        offset_ms = (last - utc.replace(tzinfo=None)).total_seconds() * 1000
+        stamps = (open_times_ms + offset_ms).astype("datetime64[ms]")
+        return mdates.date2num(stamps)
 
-            self.price_ax.set_xlim(x_dates[0] - candle_width, x_dates[-1] + candle_width)
-            max_volume = max(volumes) if volumes else 0
-            self.volume_ax.set_ylim(0, max_volume * 1.25 if max_volume else 1)
-
-            formatter = mdates.DateFormatter("%b %d, %H:%M")
-            self.price_ax.xaxis.set_major_formatter(formatter)
-            self.volume_ax.xaxis.set_major_formatter(formatter)
-            self.price_ax.tick_params(axis="x", labelbottom=False)
-            for label in self.volume_ax.get_xticklabels():
-                label.set_rotation(25)
-                label.set_horizontalalignment("right")
-
-            self.price_ax.set_ylabel("Price", color=text_muted)
-            self.volume_ax.set_ylabel("Volume", color=text_muted)
-            self.price_ax.set_title(
-                f"{self.symbol} {self.interval.upper()} Candlestick (Last 50)",
-                color=self.theme.get("text_primary", "#fff"),
-                fontsize=12,
-            )
-            self.volume_ax.set_xlabel("Time", color=text_muted)
+    def _history_limit(self):
+        return self.visible_candles + INDICATOR_WARMUP
+
+    def _max_points(self):
+        """Most candles the price axis can show at TECHNICAL_MIN_CANDLE_PX each"""
+        width = self.price_ax.bbox.width or 600
+        return max(MIN_VISIBLE_CANDLES, int(width // TECHNICAL_MIN_CANDLE_PX))
+
+    def _on_scroll(self, event):
+        """Zoom the candle window with the mouse wheel"""
+        factor = 1 / ZOOM_STEP if event.button == "up" else ZOOM_STEP
+        visible = int(round(self.visible_candles * factor))
+        visible = max(MIN_VISIBLE_CANDLES, min(TECHNICAL_MAX_CANDLES, visible))
+        if visible == self.visible_candles or self._columns is None:
+            return
+        self.visible_candles = visible
+        self.render(self._columns)
+        if len(self._columns) < self._history_limit():
+            self.scheduler.trigger("technical")
+
+    def render(self, history):
+        """Draw the newest candles of an (N, 6) array of open time, OHLC and volume"""
+        started = time.perf_counter()
+        self._columns = history
+        overlays = self.indicators.compute(history)
+        source = history[-self.visible_candles:]
+        # Merge neighbouring candles once they'd be narrower than a few pixels
+        columns, starts = merge_candles(source, self._max_points())
+        self._display = columns
+        self._bucket_start = len(history) - len(source) + starts[-1]
+        decimated = len(columns) < len(source)
+        x_dates = self._to_chart_dates(columns[:, 0])
+        self._x_dates = x_dates
+        opens, highs, lows, closes, volumes = columns[:, 1:6].T
+        count = len(x_dates)
+
+        candle_width = 0.6 * (x_dates[-1] - x_dates[-2]) if count > 1 else 0.02
+        self._candle_width = candle_width
+        self._body_min_height = (highs.max() - lows.min()) * 0.001 or 0.1
+        half = candle_width / 2
+
+        # Every candle but the last goes into the static collections
+        hx = x_dates[:-1]
+        ho, hh, hl, hc = opens[:-1], highs[:-1], lows[:-1], closes[:-1]
+        static_count = len(hx)
+        up = hc >= ho
+        colors = np.where(up[:, None], self._up_rgba, self._down_rgba)
+        lower = np.minimum(ho, hc)
+        upper = lower + np.maximum(np.abs(hc - ho), self._body_min_height)
+
+        verts = np.empty((static_count, 4, 2))
+        verts[:, 0, 0] = verts[:, 1, 0] = hx - half
+        verts[:, 2, 0] = verts[:, 3, 0] = hx + half
+        verts[:, 0, 1] = verts[:, 3, 1] = lower
+        verts[:, 1, 1] = verts[:, 2, 1] = upper
+        self.body_collection.set_verts(verts)
+        self.body_collection.set_facecolor(colors)
+        self.body_collection.set_edgecolor(colors)
+
+        segments = np.empty((static_count, 2, 2))
+        segments[:, :, 0] = hx[:, None]
+        segments[:, 0, 1] = hl
+        segments[:, 1, 1] = hh
+        self.wick_collection.set_segments(segments)
+        self.wick_collection.set_color(colors)
+
+        self._update_volume_bars(hx, volumes[:-1], colors, candle_width * 0.7)
+        self._update_live_artists()
+
+        y_low, y_high = lows.min(), highs.max()
+        source_dates = self._to_chart_dates(source[:, 0]) if decimated else x_dates
+        for key, line in self.overlay_lines.items():
+            values = overlays[key][-len(source):]
+            if decimated:
+                keep = lttb(source_dates, values, self._max_points())
+                line.set_data(source_dates[keep], values[keep])
+            else:
+                line.set_data(x_dates, values)
+            if np.isfinite(values).any():
+                y_low = min(y_low, np.nanmin(values))
+                y_high = max(y_high, np.nanmax(values))
+
+        self.price_ax.set_xlim(x_dates[0] - candle_width, x_dates[-1] + candle_width)
+        pad = (y_high - y_low) * 0.05 or 1.0
+        self.price_ax.set_ylim(y_low - pad, y_high + pad)
+        max_volume = volumes.max() if count else 0
+        self.volume_ax.set_ylim(0, max_volume * 1.25 if max_volume else 1)
+
+        self.title.set_text(
+            f"{self.symbol} {self.interval.upper()} Candlestick (Last {len(source)})")
+
+        for label in self.volume_ax.get_xticklabels():
+            label.set_rotation(25)
+            label.set_horizontalalignment("right")
+        if not self._layout_done:
             self.fig.tight_layout(rect=(0, 0, 1, 0.98))
-            self.canvas.draw()
+            self._layout_done = True
+        self.canvas.draw_idle()
+        self.last_render_ms = (time.perf_counter() - started) * 1000
+
+    def _update_live_artists(self):
+        """Position the forming candle's body, wick, volume bar and marker"""
+        x = self._x_dates[-1]
+        _t, open_p, high, low, close, volume = self._display[-1]
+        rgba = self._up_rgba if close >= open_p else self._down_rgba
+        width = self._candle_width
+        lower = min(open_p, close)
+        height = max(abs(close - open_p), self._body_min_height)
+
+        self.live_wick.set_data([x, x], [low, high])
+        self.live_wick.set_color(rgba)
+        self.live_body.set_bounds(x - width / 2, lower, width, height)
+        self.live_body.set_facecolor(rgba)
+        self.live_body.set_edgecolor(rgba)
+        bar_width = width * 0.7
+        self.live_volume.set_bounds(x - bar_width / 2, 0, bar_width, volume)
+        self.live_volume.set_facecolor(rgba)
+        self.last_point.set_offsets([[x, close]])
 
-        self.parent.after(0, update_plot)
+    def _draw_live_artists(self):
+        self.price_ax.draw_artist(self.live_wick)
+        self.price_ax.draw_artist(self.live_body)
+        self.volume_ax.draw_artist(self.live_volume)
+        self.price_ax.draw_artist(self.last_point)
+
+    def _on_draw(self, _event):
+        """Cache the static background after every full draw"""
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        if self._columns is not None:
+            self._draw_live_artists()
+
+    def _stream_interval(self):
+        """Derived intervals follow the base stream and rebuild their last candle"""
+        if self.store.derives(self.interval, HISTORY_CANDLES):
+            return KLINE_BASE_INTERVAL
+        return self.interval
+
+    def _subscribe_live(self):
+        if not self.live or self._live_stream:
+            return
+        self._live_interval = self._stream_interval()
+        self._live_stream = f"{self.symbol.lower()}@kline_{self._live_interval}"
+        self.streams.subscribe(self._live_stream, self._on_kline)
+        self._live_job = self.parent.after(TECHNICAL_LIVE_RENDER_MS, self._drain_live)
+
+    def _unsubscribe_live(self):
+        if self._live_stream:
+            self.streams.unsubscribe(self._live_stream, self._on_kline)
+            self._live_stream = None
+        self._live_interval = None
+        if self._live_job is not None:
+            self.parent.after_cancel(self._live_job)
+            self._live_job = None
+        with self._live_lock:
+            self._live_pending = None
+
+    def _on_kline(self, data):
+        kline = data.get("k") if isinstance(data, dict) else None
+        if not kline:
+            return
+        try:
+            row = (
+                float(kline["t"]),
+                float(kline["o"]),
+                float(kline["h"]),
+                float(kline["l"]),
+                float(kline["c"]),
+                float(kline["v"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return
+        symbol, interval = self.symbol, self.interval
+        stream_interval = kline.get("i", self._live_interval)
+        if str(kline.get("s", symbol)).upper() != symbol or stream_interval != self._live_interval:
+            return
+        self.store.update(symbol, stream_interval, row)
+        if stream_interval != interval:
+            row = self.store.partial(symbol, interval)
+            if row is None:
+                return
+            row = tuple(row)
+        with self._live_lock:
+            self._live_pending = row
+
+    def _drain_live(self):
+        self._live_job = None
+        if not self.is_running:
+            return
+        with self._live_lock:
+            row, self._live_pending = self._live_pending, None
+        if row is not None and self._columns is not None:
+            self._apply_live_row(row)
+        self._live_job = self.parent.after(TECHNICAL_LIVE_RENDER_MS, self._drain_live)
+
+    def _apply_live_row(self, row):
+        columns = self._columns
+        open_time = row[0]
+        if open_time < columns[-1, 0]:
+            return
+        if open_time > columns[-1, 0]:
+            # A new candle opened: shift the window and redraw everything
+            self.render(np.vstack([columns[1:], row]))
+            return
+        columns[-1] = row
+        if self._bucket_start < len(columns) - 1:
+            # The newest on-screen candle merges several source candles
+            merged, _starts = merge_candles(columns[self._bucket_start:], 1)
+            self._display[-1] = merged[0]
+        else:
+            self._display[-1] = row
+        shown = self._display[-1]
+        y_low, y_high = self.price_ax.get_ylim()
+        _v_low, v_high = self.volume_ax.get_ylim()
+        if shown[3] < y_low or shown[2] > y_high or shown[5] > v_high or self._background is None:
+            self.render(columns)
+            return
+        started = time.perf_counter()
+        self._update_live_artists()
+        self.canvas.restore_region(self._background)
+        self._draw_live_artists()
+        self.canvas.blit(self.fig.bbox)
+        self.last_blit_ms = (time.perf_counter() - started) * 1000
+
+    def _update_volume_bars(self, x_dates, volumes, colors, width):
+        bars = self.volume_bars
+        if bars is None or len(bars.patches) != len(x_dates):
+            if bars is not None:
+                bars.remove()
+            self.volume_bars = self.volume_ax.bar(
+                x_dates,
+                volumes,
+                width=width,
+                color=colors,
+                alpha=0.6,
+                align="center",
+            )
+            return
+        for patch, x, volume, color in zip(bars.patches, x_dates, volumes, colors):
+            patch.set_x(x - width / 2)
+            patch.set_width(width)
+            patch.set_height(volume)
+            patch.set_facecolor(color)
 
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
@@ -198,15 +491,31 @@ class TechnicalPanel:
             return
 
         self.symbol = new_symbol
+        self._columns = None
         if self.is_running:
-            thread = threading.Thread(target=self.refresh_chart, daemon=True)
-            thread.start()
+            self._unsubscribe_live()
+            self._subscribe_live()
+            self.scheduler.trigger("technical")
 
     def set_interval(self, interval):
         normalized = (interval or self.interval).lower()
         if normalized == self.interval:
             return
         self.interval = normalized
-        if self.is_running:
-            thread = threading.Thread(target=self.refresh_chart, daemon=True)
-            thread.start()
+        self._columns = None
+        if not self.is_running:
+            return
+        if self._stream_interval() != self._live_interval:
+            self._unsubscribe_live()
+            self._subscribe_live()
+        else:
+            with self._live_lock:
+                self._live_pending = None
+        if self.store.derives(normalized, self._history_limit()):
+            # Resampled locally from the base series; no network needed
+            cached = self.store.window(self.symbol, normalized, self._history_limit(),
+                                       cached_only=True)
+            if len(cached) > 1:
+                self.render(cached)
+                return
+        self.scheduler.trigger("technical")
@@ -1,19 +1,42 @@
-import tkinter as tk
-import websocket
+import os
+import sys
 import threading
-import json
+import tkinter as tk
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(os.path.dirname(current_dir))
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from utils.stream_manager import get_stream_manager  # type: ignore
+    from utils.market_data import get_market_data  # type: ignore
+    from config import TICKER_REFRESH_INTERVAL  # type: ignore
+else:
+    from ..utils.stream_manager import get_stream_manager
+    from ..utils.market_data import get_market_data
+    from ..config import TICKER_REFRESH_INTERVAL
 
 
 class CryptoTicker:
     """Display a price/statistics summary card similar to the mockup"""
 
-    def __init__(self, parent, symbol, display_name, theme):
+    def __init__(self, parent, symbol, display_name, theme,
+                 refresh_interval=TICKER_REFRESH_INTERVAL):
         self.parent = parent
         self.symbol = symbol.lower()
         self.display_name = display_name
         self.theme = theme
         self.active = False
-        self.ws = None
+        self.streams = get_stream_manager()
+        self.market = get_market_data()
+        self.refresh_ms = max(1, int(refresh_interval * 1000))
+        # Latest-value-wins mailbox filled by the socket thread
+        self._pending = None
+        self._pending_lock = threading.Lock()
+        self._render_job = None
+        self._shown = {}
+        self.frames_received = 0
+        self.frames_rendered = 0
 
         self.frame = tk.Frame(
             parent,
@@ -116,57 +139,48 @@ class CryptoTicker:
         value_label.pack(side=tk.RIGHT)
         return value_label
 
+    def _stream_name(self):
+        return f"{self.symbol}@ticker"
+
     def start(self):
-        """Open the WebSocket stream and start receiving prices"""
+        """Subscribe to the ticker stream and start receiving prices"""
         if self.active:
             return
         self.active = True
-
-        url = f"wss://stream.binance.com:9443/ws/{self.symbol}@ticker"
-
-        self.ws = websocket.WebSocketApp(
-            url,
-            on_message=self.on_message,
-            on_error=lambda ws, err: print(f"{self.symbol} error:", err),
-            on_close=lambda ws, status, msg: print(f"{self.symbol} closed"),
-            on_open=lambda ws: print(f"{self.symbol} connected"),
-        )
-
-        thread = threading.Thread(target=self.ws.run_forever, daemon=True)
-        thread.start()
+        self.streams.subscribe(self._stream_name(), self.on_message)
+        self._render_job = self.parent.after(self.refresh_ms, self._drain_mailbox)
 
     def stop(self):
-        """Close the WebSocket connection"""
+        """Unsubscribe from the ticker stream"""
         self.active = False
-        if self.ws:
-            try:
-                self.ws.close()
-            except Exception:
-                pass
-        self.ws = None
+        self.streams.unsubscribe(self._stream_name(), self.on_message)
+        if self._render_job is not None:
+            self.parent.after_cancel(self._render_job)
+            self._render_job = None
+        with self._pending_lock:
+            self._pending = None
 
     def set_symbol(self, symbol, display_name):
-        """Change the ticker symbol and restart the socket if needed"""
+        """Change the ticker symbol, switching subscriptions on the shared socket"""
         new_symbol = symbol.lower()
         if new_symbol == self.symbol and display_name == self.display_name:
             return
 
-        was_active = self.active
-        if was_active:
-            self.stop()
-
-        self.symbol = new_symbol
+        if new_symbol != self.symbol and self.active:
+            self.streams.unsubscribe(self._stream_name(), self.on_message)
+            self.symbol = new_symbol
+            with self._pending_lock:
+                self._pending = None
+            self.streams.subscribe(self._stream_name(), self.on_message)
+        else:
+            self.symbol = new_symbol
         self.display_name = display_name
         self.title_label.config(text=self.display_name)
 
-        if was_active:
-            self.start()
-
-    def on_message(self, ws, msg):
+    def on_message(self, data):
         if not self.active:
             return
 
-        data = json.loads(msg)
         try:
             price = float(data["c"])
             change = float(data["p"])
@@ -176,8 +190,12 @@ class CryptoTicker:
             high = float(data["h"])
             low = float(data["l"])
             quote_volume = float(data["q"])
-        except (KeyError, ValueError):
+        except (KeyError, ValueError, TypeError):
             return
+        # Keeps every panel's price for this pair current without REST polls
+        stream_symbol = data.get("s", self.symbol)
+        self.market.update(self.market.key_for(stream_symbol), price, percent,
+                           event_time=data.get("E"))
 
         payload = {
             "price": price,
@@ -189,11 +207,38 @@ class CryptoTicker:
             "low": low,
             "quote_volume": quote_volume,
         }
-        self.parent.after(0, self.update_display, payload)
+        with self._pending_lock:
+            if data.get("s", self.symbol).lower() != self.symbol:
+                return
+            self._pending = payload
+            self.frames_received += 1
+
+    def _drain_mailbox(self):
+        """Render the newest pending frame, at most once per refresh interval"""
+        self._render_job = None
+        if not self.active:
+            return
+        with self._pending_lock:
+            payload, self._pending = self._pending, None
+        if payload is not None:
+            self.update_display(payload)
+        self._render_job = self.parent.after(self.refresh_ms, self._drain_mailbox)
+
+    def _set_label(self, label, text, fg=None):
+        """Configure a label only when its text or colour actually changes"""
+        state = (text, fg)
+        if self._shown.get(label) == state:
+            return
+        self._shown[label] = state
+        if fg is None:
+            label.config(text=text)
+        else:
+            label.config(text=text, fg=fg)
 
     def update_display(self, payload):
         if not self.active:
             return
+        self.frames_rendered += 1
 
         price = payload["price"]
         change = payload["change"]
@@ -207,20 +252,21 @@ class CryptoTicker:
         color = self.theme["accent_green"] if change >= 0 else self.theme["accent_red"]
         sign = "+" if change >= 0 else ""
 
-        self.price_value.config(text=f"{price:,.2f}", fg=color)
-        self.change_label.config(
-            text=f"{sign}{change:,.2f} ({sign}{percent:.2f}%)",
+        self._set_label(self.price_value, f"{price:,.2f}", fg=color)
+        self._set_label(
+            self.change_label,
+            f"{sign}{change:,.2f} ({sign}{percent:.2f}%)",
             fg=color,
         )
 
         spread = ask - bid if ask and bid else 0.0
-        self.bid_value.config(text=f"{bid:,.2f}")
-        self.ask_value.config(text=f"{ask:,.2f}")
-        self.spread_value.config(text=f"{spread:,.4f}")
+        self._set_label(self.bid_value, f"{bid:,.2f}")
+        self._set_label(self.ask_value, f"{ask:,.2f}")
+        self._set_label(self.spread_value, f"{spread:,.4f}")
 
-        self.high_value.config(text=f"{high:,.2f}")
-        self.low_value.config(text=f"{low:,.2f}")
-        self.vol_value.config(text=f"{quote_volume:,.0f}")
+        self._set_label(self.high_value, f"{high:,.2f}")
+        self._set_label(self.low_value, f"{low:,.2f}")
+        self._set_label(self.vol_value, f"{quote_volume:,.0f}")
 
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
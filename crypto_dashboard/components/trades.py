@@ -1,19 +1,20 @@
 import os
 import sys
+import threading
 import tkinter as tk
 from tkinter import ttk
-import websocket
-import threading
-import json
+from collections import deque
 
 if __package__ is None or __package__ == "":
     current_dir = os.path.dirname(os.path.abspath(__file__))
     parent_dir = os.path.dirname(os.path.dirname(current_dir))
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
-    from config import MAX_TRADES_DISPLAY  # type: ignore
+    from config import MAX_TRADES_DISPLAY, TRADES_RENDER_MS  # type: ignore
+    from utils.stream_manager import get_stream_manager  # type: ignore
 else:
-from ..config import MAX_TRADES_DISPLAY
+    from ..config import MAX_TRADES_DISPLAY, TRADES_RENDER_MS
+    from ..utils.stream_manager import get_stream_manager
 
 
 class TradesPanel:
@@ -23,66 +24,103 @@ class TradesPanel:
         self.parent = parent
         self.symbol = symbol.lower()
         self.active = False
-        self.ws = None
-        self.trades = []
+        self.streams = get_stream_manager()
+        # Ring buffer, oldest to newest; each record is (is_buyer_maker, qty, price)
+        self.trades = deque(maxlen=MAX_TRADES_DISPLAY)
+        self._pending = deque(maxlen=MAX_TRADES_DISPLAY)
+        self._pending_lock = threading.Lock()
+        self._render_job = None
+        self._line_count = 0
 
         self.frame = ttk.LabelFrame(parent, text=f"Recent Trades - {self.symbol.upper()}", padding=10)
 
         self.text = tk.Text(self.frame, height=15, width=60, state="disabled")
         self.text.pack(fill=tk.BOTH, expand=True)
 
+    def _stream_name(self):
+        return f"{self.symbol}@aggTrade"
+
     def start(self):
         if self.active:
             return
         self.active = True
-
-        url = f"wss://stream.binance.com:9443/ws/{self.symbol}@aggTrade"
-
-        self.ws = websocket.WebSocketApp(
-            url,
-            on_message=self.on_message,
-            on_error=lambda ws, err: print(f"{self.symbol} trades error:", err),
-            on_close=lambda ws, s, m: print(f"{self.symbol} trades closed"),
-            on_open=lambda ws: print(f"{self.symbol} trades connected"),
-        )
-
-        threading.Thread(target=self.ws.run_forever, daemon=True).start()
+        self.streams.subscribe(self._stream_name(), self.on_message)
+        self._render_job = self.parent.after(TRADES_RENDER_MS, self._render_loop)
 
     def stop(self):
         self.active = False
-        if self.ws:
-            try:
-                self.ws.close()
-            except Exception:
-                pass
-            self.ws = None
-
-    def on_message(self, ws, msg):
+        self.streams.unsubscribe(self._stream_name(), self.on_message)
+        if self._render_job is not None:
+            self.parent.after_cancel(self._render_job)
+            self._render_job = None
+
+    def set_symbol(self, symbol):
+        new_symbol = symbol.lower()
+        if new_symbol == self.symbol:
+            return
+        if self.active:
+            self.streams.unsubscribe(self._stream_name(), self.on_message)
+        self.symbol = new_symbol
+        with self._pending_lock:
+            self._pending.clear()
+        self.trades.clear()
+        self._clear_text()
+        self.frame.config(text=f"Recent Trades - {self.symbol.upper()}")
+        if self.active:
+            self.streams.subscribe(self._stream_name(), self.on_message)
+
+    def on_message(self, data):
         if not self.active:
             return
-        data = json.loads(msg)
         try:
             price = float(data["p"])
             qty = float(data["q"])
             is_buyer_maker = data["m"]  # True = seller side, False = buyer side
-        except (KeyError, ValueError):
+        except (KeyError, ValueError, TypeError):
             return
 
-        side = "SELL" if is_buyer_maker else "BUY"
-        line = f"{side:4}  {qty:.6f} @ {price:,.2f}"
+        with self._pending_lock:
+            self._pending.append((is_buyer_maker, qty, price))
 
-        self.trades.insert(0, line)
-        self.trades = self.trades[:MAX_TRADES_DISPLAY]
+    def _render_loop(self):
+        self._render_job = None
+        if not self.active:
+            return
+        self.update_text()
+        self._render_job = self.parent.after(TRADES_RENDER_MS, self._render_loop)
 
-        self.parent.after(0, self.update_text)
+    @staticmethod
+    def _format_trade(record):
+        is_buyer_maker, qty, price = record
+        side = "SELL" if is_buyer_maker else "BUY"
+        return f"{side:4}  {qty:.6f} @ {price:,.2f}"
+
+    def _clear_text(self):
+        self.text.config(state="normal")
+        self.text.delete("1.0", tk.END)
+        self.text.config(state="disabled")
+        self._line_count = 0
 
     def update_text(self):
+        """Prepend trades received since the last frame and trim the tail"""
         if not self.active:
             return
+        with self._pending_lock:
+            if not self._pending:
+                return
+            batch = list(self._pending)
+            self._pending.clear()
+
+        self.trades.extend(batch)
+        # Newest trade goes on the first line
+        block = "".join(self._format_trade(r) + "\n" for r in reversed(batch))
+
         self.text.config(state="normal")
-        self.text.delete("1.0", tk.END)
-        for line in self.trades:
-            self.text.insert(tk.END, line + "\n")
+        self.text.insert("1.0", block)
+        self._line_count += len(batch)
+        if self._line_count > MAX_TRADES_DISPLAY:
+            self.text.delete(f"{MAX_TRADES_DISPLAY + 1}.0", tk.END)
+            self._line_count = MAX_TRADES_DISPLAY
         self.text.config(state="disabled")
 
     def pack(self, **kwargs):
@@ -2,7 +2,6 @@ import os
 import sys
 import tkinter as tk
 from tkinter import ttk
-import threading
 from datetime import datetime
 
 if __package__ is None or __package__ == "":
@@ -10,11 +9,13 @@ if __package__ is None or __package__ == "":
     parent_dir = os.path.dirname(os.path.dirname(current_dir))
     if parent_dir not in sys.path:
         sys.path.insert(0, parent_dir)
-    from config import TRANSACTIONS_REFRESH_MS, THEME  # type: ignore
-    from utils.binance_rest import get_recent_trades  # type: ignore
+    from config import TRANSACTIONS_REFRESH_MS, TRANSACTIONS_HIDDEN_REFRESH_MS, THEME  # type: ignore
+    from utils.async_rest import get_async_client  # type: ignore
+    from utils.scheduler import get_scheduler  # type: ignore
 else:
-    from ..config import TRANSACTIONS_REFRESH_MS, THEME
-    from ..utils.binance_rest import get_recent_trades
+    from ..config import TRANSACTIONS_REFRESH_MS, TRANSACTIONS_HIDDEN_REFRESH_MS, THEME
+    from ..utils.async_rest import get_async_client
+    from ..utils.scheduler import get_scheduler
 
 
 class TransactionsPanel:
@@ -27,6 +28,8 @@ class TransactionsPanel:
         self.theme = theme or THEME
         self.is_running = False
         self.user_trades = []
+        self.client = get_async_client()
+        self.scheduler = get_scheduler()
 
         # Use light theme to match other pages
         self.bg = "#f5f7fb"
@@ -194,21 +197,26 @@ class TransactionsPanel:
         if self.is_running:
             return
         self.is_running = True
-        self._schedule_refresh()
+        self.scheduler.add("transactions", TRANSACTIONS_REFRESH_MS,
+                           self._refresh_market_trades,
+                           hidden_interval_ms=TRANSACTIONS_HIDDEN_REFRESH_MS)
 
     def stop(self):
         self.is_running = False
+        self.scheduler.remove("transactions")
 
-    def _schedule_refresh(self):
-        if not self.is_running:
-            return
-        threading.Thread(target=self._refresh_market_trades,
-                         daemon=True).start()
-        self.root.after(TRANSACTIONS_REFRESH_MS, self._schedule_refresh)
+    def set_visible(self, visible):
+        self.scheduler.set_visible("transactions", visible)
 
     def _refresh_market_trades(self):
-        data = get_recent_trades(self.symbol, limit=15)
-        if not data:
+        symbol = self.symbol
+        return self.client.submit(
+            self.client.get_recent_trades(symbol, limit=15),
+            lambda data: self._apply_market_trades(symbol, data),
+        )
+
+    def _apply_market_trades(self, symbol, data):
+        if not data or symbol != self.symbol:
             return
         rows = []
         for trade in data:
@@ -222,7 +230,7 @@ class TransactionsPanel:
             rows.append((timestamp.strftime("%H:%M:%S"),
                         side, f"{qty:.5f}", f"{price:,.2f}"))
         if rows:
-            self.root.after(0, lambda: self._update_market_tree(rows))
+            self._update_market_tree(rows)
 
     def _update_market_tree(self, rows):
         for child in self.market_tree.get_children():
@@ -244,8 +252,7 @@ class TransactionsPanel:
         if new_symbol == self.symbol:
             return
         self.symbol = new_symbol
-        threading.Thread(target=self._refresh_market_trades,
-                         daemon=True).start()
+        self.scheduler.trigger("transactions")
 
     def record_user_trade(self, action, asset, amount, price, total):
         """Record a user trade and update the UI - GUARANTEED TO WORK"""
@@ -2,7 +2,6 @@ import os
 import sys
 import tkinter as tk
 from tkinter import ttk
-import threading
 
 if __package__ is None or __package__ == "":
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -19,8 +18,12 @@ if __package__ is None or __package__ == "":
         WALLET_HOLDINGS,
         WALLET_CASH_BALANCE,
         WALLET_REFRESH_MS,
+        WALLET_HIDDEN_REFRESH_MS,
     )
-    from utils.binance_rest import get_24hr_ticker  # type: ignore
+    from utils.binance_rest import get_24hr_tickers  # type: ignore
+    from utils.async_rest import get_async_client  # type: ignore
+    from utils.scheduler import get_scheduler  # type: ignore
+    from utils.market_data import get_market_data  # type: ignore
 else:
     from ..config import (
         THEME,
@@ -28,8 +31,12 @@ else:
         WALLET_HOLDINGS,
         WALLET_CASH_BALANCE,
         WALLET_REFRESH_MS,
+        WALLET_HIDDEN_REFRESH_MS,
     )
-    from ..utils.binance_rest import get_24hr_ticker
+    from ..utils.binance_rest import get_24hr_tickers
+    from ..utils.async_rest import get_async_client
+    from ..utils.scheduler import get_scheduler
+    from ..utils.market_data import get_market_data
 
 
 ASSET_DISPLAY_NAMES = {
@@ -55,9 +62,13 @@ class WalletPanel:
         self.on_trade = on_trade
         self.on_balance_change = on_balance_change
         self.is_running = False
+        self.client = get_async_client()
+        self.scheduler = get_scheduler()
+        self.market = get_market_data()
+        self.visible = True
+        self._prices_stale = False
         self.cash_balance = WALLET_CASH_BALANCE
         self.holdings = WALLET_HOLDINGS.copy()
-        self.prices = {asset: 0.0 for asset in self.holdings}
         self.asset_options = self._build_asset_options()
         self.asset_display_to_code = {
             label: code for code, label in self.asset_options}
@@ -106,7 +117,7 @@ class WalletPanel:
         # Build Holdings section at the bottom
         self._build_holdings_section()
 
-        self._apply_price_update({})
+        self._apply_price_update()
 
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
@@ -115,36 +126,53 @@ class WalletPanel:
         if self.is_running:
             return
         self.is_running = True
-        self._schedule_refresh()
+        self.market.subscribe(self._on_market_update)
+        self.scheduler.add("wallet", WALLET_REFRESH_MS, self._refresh_prices,
+                           hidden_interval_ms=WALLET_HIDDEN_REFRESH_MS)
 
     def stop(self):
         self.is_running = False
+        self.scheduler.remove("wallet")
+        self.market.unsubscribe(self._on_market_update)
 
-    def _schedule_refresh(self):
-        if not self.is_running:
-            return
-        threading.Thread(target=self._refresh_prices, daemon=True).start()
-        self.parent.after(WALLET_REFRESH_MS, self._schedule_refresh)
+    def set_visible(self, visible):
+        self.visible = visible
+        self.scheduler.set_visible("wallet", visible)
+        if visible and self._prices_stale:
+            self._apply_price_update()
 
     def _refresh_prices(self):
-        updated = {}
-        for asset in self.holdings.keys():
-            pair = DEFAULT_SYMBOLS.get(asset, f"{asset.lower()}usdt")
-            data = get_24hr_ticker(pair)
-            if not data:
-                continue
-            try:
-                updated[asset] = float(data.get("lastPrice", 0))
-            except (TypeError, ValueError):
-                continue
-        if updated:
-            self.parent.after(0, lambda: self._apply_price_update(updated))
-
-    def _apply_price_update(self, values):
-        self.prices.update(values)
-        total_value = self.cash_balance
-        for asset, amount in self.holdings.items():
-            total_value += amount * self.prices.get(asset, 0)
+        """Fetch quotes the shared store lacks; its subscription redraws us"""
+        stale = self.market.stale(self.holdings.keys())
+        if not stale:
+            return None
+        pairs = [DEFAULT_SYMBOLS.get(asset, f"{asset.lower()}usdt") for asset in stale]
+        return self.client.run(self._collect_prices, pairs)
+
+    def _collect_prices(self, pairs):
+        """Runs on the REST worker pool; feeds the market data store"""
+        return self.market.apply_tickers(get_24hr_tickers(pairs)) or None
+
+    def _on_market_update(self, changes):
+        if not any(asset in self.holdings for asset in changes):
+            return
+        if not self.visible:
+            self._prices_stale = True
+            return
+        self._apply_price_update()
+
+    def _holdings_value(self):
+        return sum(amount * self.market.price(asset)
+                   for asset, amount in self.holdings.items())
+
+    def _notify_balance_change(self):
+        """Tell the overview the cash balance or holdings changed"""
+        if callable(self.on_balance_change):
+            self.on_balance_change(self.cash_balance, self.holdings.copy())
+
+    def _apply_price_update(self):
+        self._prices_stale = False
+        total_value = self.cash_balance + self._holdings_value()
         self.total_value_var.set(f"Total: $ {total_value:,.2f}")
         self.cash_var.set(f"USDT Balance: $ {self.cash_balance:,.2f}")
         if hasattr(self, "balance_display_var"):
@@ -158,11 +186,6 @@ class WalletPanel:
         if hasattr(self, "sell_holdings_display_var"):
             self._update_sell_holdings_display()
 
-        # Notify overview of balance/total change
-        if callable(self.on_balance_change):
-            self.on_balance_change(
-                self.cash_balance, self.holdings.copy(), total_value)
-
         for row in self.tree.get_children():
             self.tree.delete(row)
 
@@ -171,7 +194,7 @@ class WalletPanel:
         self.tree.tag_configure("odd", background="#f9fafb")
 
         for idx, (asset, amount) in enumerate(self.holdings.items()):
-            price = self.prices.get(asset, 0)
+            price = self.market.price(asset)
             tag = "even" if idx % 2 == 0 else "odd"
             self.tree.insert(
                 "",
@@ -181,12 +204,9 @@ class WalletPanel:
                 tags=(asset, tag),
             )
 
-    def _update_balance_only(self):
+    def _update_balance_only(self, notify=True):
         """อัปเดตเฉพาะ Balance และ Total ทันที - ไม่ delay และไม่กระทบส่วนอื่น"""
-        # คำนวณ total value - ใช้ sum() เพื่อให้เร็วขึ้น
-        holdings_value = sum(amount * self.prices.get(asset, 0)
-                             for asset, amount in self.holdings.items())
-        total_value = self.cash_balance + holdings_value
+        total_value = self.cash_balance + self._holdings_value()
 
         # อัปเดตเฉพาะส่วนที่จำเป็น - ไม่ต้องอัปเดต holdings table
         self.total_value_var.set(f"Total: $ {total_value:,.2f}")
@@ -197,49 +217,8 @@ class WalletPanel:
         # บังคับให้ UI อัปเดตทันที
         self.frame.update_idletasks()
 
-        # Notify overview of balance/total change
-        if callable(self.on_balance_change):
-            self.on_balance_change(
-                self.cash_balance, self.holdings.copy(), total_value)
-
-    def _apply_price_update_immediate(self, values):
-        """อัปเดตทันทีโดยไม่ delay สำหรับ deposit/withdraw"""
-        self.prices.update(values)
-        # คำนวณ total value
-        total_value = self.cash_balance
-        for asset, amount in self.holdings.items():
-            total_value += amount * self.prices.get(asset, 0)
-
-        # อัปเดตส่วนที่จำเป็น
-        self.total_value_var.set(f"Total: $ {total_value:,.2f}")
-        self.cash_var.set(f"USDT Balance: $ {self.cash_balance:,.2f}")
-        if hasattr(self, "balance_display_var"):
-            self.balance_display_var.set(f"$ {self.cash_balance:,.2f} USD")
-
-        # Notify overview of balance/total change
-        if callable(self.on_balance_change):
-            self.on_balance_change(
-                self.cash_balance, self.holdings.copy(), total_value)
-
-        # อัปเดต holdings table - แสดงตามที่กำหนด
-        if hasattr(self, "tree"):
-            for row in self.tree.get_children():
-                self.tree.delete(row)
-
-            # Configure alternating row colors
-            self.tree.tag_configure("even", background="#ffffff")
-            self.tree.tag_configure("odd", background="#f9fafb")
-
-            for idx, (asset, amount) in enumerate(self.holdings.items()):
-                price = self.prices.get(asset, 0)
-                tag = "even" if idx % 2 == 0 else "odd"
-                self.tree.insert(
-                    "",
-                    tk.END,
-                    values=(asset, f"{price:,.2f}",
-                            f"{amount:.6f}", f"{amount * price:,.2f}"),
-                    tags=(asset, tag),
-                )
+        if notify:
+            self._notify_balance_change()
 
     def _execute_trade(self, action):
         try:
@@ -252,7 +231,7 @@ class WalletPanel:
             return
 
         asset = self.asset_var.get()
-        price = self.prices.get(asset, 0)
+        price = self.market.price(asset)
         if price <= 0:
             self.status_var.set("Market price not available yet, try again")
             return
@@ -274,7 +253,8 @@ class WalletPanel:
 
         self.status_var.set(f"{action} {amount} {asset} @ {price:,.2f} (mock)")
         self.amount_entry.delete(0, tk.END)
-        self._apply_price_update({})
+        self._apply_price_update()
+        self._notify_balance_change()
         if callable(self.on_trade):
             self.on_trade(action, asset, amount, price, notional)
 
@@ -1002,7 +982,7 @@ class WalletPanel:
         if amount > holding:
             self.status_var.set("Not enough holdings to convert to USD")
             return
-        price = self.prices.get(asset, 0)
+        price = self.market.price(asset)
         if price <= 0:
             self.status_var.set("Market price not available yet, try again")
             return
@@ -1011,7 +991,8 @@ class WalletPanel:
         self.cash_balance += quote
         self.status_var.set(
             f"Converted {amount:.6f} {asset} to $ {quote:,.2f} USD (mock)")
-        self._apply_price_update({})
+        self._apply_price_update()
+        self._notify_balance_change()
 
     def _update_exchange_quote(self):
         try:
@@ -1019,7 +1000,7 @@ class WalletPanel:
         except (TypeError, ValueError):
             amount = 0
         asset = self.exchange_asset_var.get()
-        price = self.prices.get(asset, 0)
+        price = self.market.price(asset)
         quote = amount * price
         self.exchange_quote_var.set(
             f"$ {quote:,.2f} USD" if quote else "$ -- USD")
@@ -1062,7 +1043,7 @@ class WalletPanel:
                         f"Holdings: {holdings:.6f} {asset}")
                     # Update price display (1 crypto = X USD)
                     if hasattr(self, "buy_price_display_var"):
-                        price = self.prices.get(asset, 0)
+                        price = self.market.price(asset)
                         self.buy_price_display_var.set(
                             f"1 {asset} = ${price:,.2f}")
                 else:
@@ -1087,7 +1068,7 @@ class WalletPanel:
                         f"Holdings: {holdings:.6f} {asset}")
                     # Update price display (1 crypto = X USD)
                     if hasattr(self, "sell_price_display_var"):
-                        price = self.prices.get(asset, 0)
+                        price = self.market.price(asset)
                         self.sell_price_display_var.set(
                             f"1 {asset} = ${price:,.2f}")
                 else:
@@ -1128,7 +1109,7 @@ class WalletPanel:
             amount_entry.delete(0, tk.END)
             return
 
-        price = self.prices.get(asset, 0)
+        price = self.market.price(asset)
         if price <= 0:
             status_var = self.buy_status_var if action == "BUY" else self.sell_status_var
             if hasattr(self, "buy_status_var") if action == "BUY" else hasattr(self, "sell_status_var"):
@@ -1170,13 +1151,13 @@ class WalletPanel:
         # Update total value
         total = self.cash_balance
         for asset, amount in self.holdings.items():
-            price = self.prices.get(asset, 0)
+            price = self.market.price(asset)
             total += amount * price
         self.total_value_var.set(f"Total: $ {total:,.2f}")
         if hasattr(self, "balance_display_var"):
             self.balance_display_var.set(f"$ {self.cash_balance:,.2f} USD")
         # Update holdings table
-        self._apply_price_update({})
+        self._apply_price_update()
 
         # Update status message
         status_var = self.buy_status_var if action == "BUY" else self.sell_status_var
@@ -1202,22 +1183,8 @@ class WalletPanel:
                         self.on_trade(action, fallback_asset,
                                       amount, price, notional)
 
-        # Notify overview of balance/total change after trade
-        # (balance already updated via _apply_price_update, but we need to notify here too)
-        if callable(self.on_balance_change):
-            holdings_value = sum(amt * self.prices.get(ast, 0)
-                                 for ast, amt in self.holdings.items())
-            total_value = self.cash_balance + holdings_value
-            self.on_balance_change(
-                self.cash_balance, self.holdings.copy(), total_value)
-
-        # Notify overview of balance/total change after trade
-        if callable(self.on_balance_change):
-            holdings_value = sum(amt * self.prices.get(ast, 0)
-                                 for ast, amt in self.holdings.items())
-            total_value = self.cash_balance + holdings_value
-            self.on_balance_change(
-                self.cash_balance, self.holdings.copy(), total_value)
+        # Notify overview of balance/holdings change after trade
+        self._notify_balance_change()
 
     def _build_asset_options(self):
         options = []
@@ -1243,9 +1210,10 @@ class WalletPanel:
         # Update displays
         self._update_buy_holdings_display()
         self._update_sell_holdings_display()
-        self._update_balance_only()
+        # The overview already holds these values; don't echo them back
+        self._update_balance_only(notify=False)
         # Update holdings table
-        self._apply_price_update({})
+        self._apply_price_update()
 
     def get_balance_and_holdings(self):
         """Get current balance and holdings for syncing"""
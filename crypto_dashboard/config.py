@@ -12,17 +12,63 @@ DEFAULT_SYMBOLS = {
 }
 
 # UI settings
-TICKER_REFRESH_INTERVAL = 0.1      # seconds between ticker WebSocket updates
-ORDERBOOK_REFRESH_MS = 3000       # ms, REST depth refresh interval
+TICKER_REFRESH_INTERVAL = 0.1      # seconds between ticker redraws; frames in between are coalesced
+ORDERBOOK_RENDER_MS = 100         # ms between order book redraws from the local book
+ORDERBOOK_SNAPSHOT_LIMIT = 100    # levels in the REST snapshot that seeds the local book
 TECHNICAL_REFRESH_MS = 30000      # ms, fetch new klines every 30 seconds
+TECHNICAL_LIVE_RENDER_MS = 100    # ms between blitted live-candle updates
+TECHNICAL_MIN_CANDLE_PX = 3       # narrower candles are merged so draw cost tracks chart width
+TECHNICAL_MAX_CANDLES = 7200      # deepest scroll-wheel zoom-out, in source candles
 MAX_TRADES_DISPLAY = 50           # number of trade rows to display
+TRADES_RENDER_MS = 100            # ms between trade tape redraws
 WALLET_REFRESH_MS = 15000
+WALLET_HIDDEN_REFRESH_MS = None   # wallet polling pauses while its section is hidden
 TRANSACTIONS_REFRESH_MS = 8000
+TRANSACTIONS_HIDDEN_REFRESH_MS = None
 
 ORDERBOOK_DEFAULT_LEVELS = 10
 ORDERBOOK_ALL_LEVELS = 20
 DEFAULT_TECH_INTERVAL = "1h"
 OVERVIEW_REFRESH_MS = 8000
+OVERVIEW_HIDDEN_REFRESH_MS = 60000  # keepalive while the chart or another section covers the overview
+KLINE_STORE_MAX_ROWS = 1000       # candles kept in memory per (symbol, interval)
+KLINE_FETCH_LIMIT = 1000          # max candles Binance returns per klines request
+KLINE_BASE_INTERVAL = "1m"        # base series higher chart intervals are resampled from
+KLINE_BASE_MAX_ROWS = 7200        # base candles kept per symbol (five days of 1m data)
+KLINE_CACHE_DIR = "cache/klines"  # on-disk kline cache; relative to the app directory, None disables
+KLINE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # oldest series files are evicted beyond this
+
+# WebSocket settings
+STREAM_BASE_URL = "wss://stream.binance.com:9443"
+STREAM_RECONNECT_DELAY = 2.0      # seconds before reconnecting a dropped stream socket
+
+# REST client settings
+REST_POOL_CONNECTIONS = 4         # number of per-host connection pools to keep
+REST_POOL_MAXSIZE = 10            # max open keep-alive connections per host
+REST_POOL_BLOCK = True            # wait for a free connection instead of opening extras
+REST_CACHE_TTLS = {               # seconds a REST response may be reused, per endpoint
+    "/api/v3/ticker/24hr": 2.0,
+    "/api/v3/klines": 5.0,
+    "/api/v3/depth": 1.0,
+    "/api/v3/trades": 2.0,
+}
+REST_CACHE_MAX_ENTRIES = 256
+REST_CACHE_MAX_BYTES = 8 * 1024 * 1024
+REST_WEIGHT_LIMIT = 6000          # Binance REQUEST_WEIGHT allowance per minute
+REST_WEIGHT_BUDGET = 0.8          # fraction of the allowance this app lets itself use
+REST_LOW_PRIORITY_RESERVE = 0.5   # low-priority calls wait while less than this fraction is free
+REST_WORKERS = 4                  # fixed worker threads behind the asyncio REST client
+REST_COMPLETION_POLL_MS = 30      # ms between Tk drains of finished REST calls
+REST_FANOUT_LIMIT = 3             # concurrent calls one fan-out may hold; leaves a worker for other panels
+
+# Shared market data settings
+MARKET_DATA_FLUSH_MS = 100        # ms between change notifications to subscribed panels
+MARKET_DATA_FRESH_MS = 3000       # quotes newer than this are not re-fetched over REST
+
+# Refresh scheduler settings
+SCHEDULER_TICK_MS = 100           # ms between checks for due panel refreshes
+SCHEDULER_JITTER = 0.1            # +/- fraction applied to each refresh interval
+SCHEDULER_MAX_BACKOFF_MS = 120000 # cap on the delay after repeated refresh failures
 
 THEME = {
     "bg": "#0d1117",
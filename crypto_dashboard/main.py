@@ -26,6 +26,11 @@ from crypto_dashboard.components.technical import TechnicalPanel
 from crypto_dashboard.components.overview import OverviewPanel
 from crypto_dashboard.components.wallet import WalletPanel
 from crypto_dashboard.components.transactions import TransactionsPanel
+from crypto_dashboard.utils.binance_rest import close_session
+from crypto_dashboard.utils.async_rest import get_async_client
+from crypto_dashboard.utils.scheduler import get_scheduler
+from crypto_dashboard.utils.market_data import get_market_data
+from crypto_dashboard.utils.stream_manager import get_stream_manager
 
 
 class CryptoDashboardApp:
@@ -35,6 +40,15 @@ class CryptoDashboardApp:
         self.root.geometry("1440x900")
         self.root.minsize(1200, 720)
         self.root.configure(bg=THEME["bg"])
+        # REST completions are delivered on the Tk thread via this client
+        self.rest_client = get_async_client()
+        self.rest_client.attach(self.root)
+        # Every periodic panel fetch is started from this scheduler's tick
+        self.scheduler = get_scheduler()
+        self.scheduler.attach(self.root)
+        # Prices from sockets and REST land here; panels subscribe to changes
+        self.market_data = get_market_data()
+        self.market_data.attach(self.root)
 
         self.current_symbol_key = (
             "BTC" if "BTC" in DEFAULT_SYMBOLS else next(iter(DEFAULT_SYMBOLS))
@@ -717,22 +731,17 @@ class CryptoDashboardApp:
             balance, holdings = self.wallet_panel.get_balance_and_holdings()
             self.overview_panel.sync_from_wallet(balance, holdings)
 
-        # Also sync when wallet panel is shown
-        if hasattr(self, "overview_panel") and hasattr(self, "wallet_panel"):
-            balance, holdings = self.wallet_panel.get_balance_and_holdings()
-            self.overview_panel.sync_from_wallet(balance, holdings)
-
     def _hide_transactions_section(self):
         if hasattr(self, "transactions_container") and self.transactions_container.winfo_ismapped():
             self.transactions_container.pack_forget()
             if hasattr(self, "transactions_panel"):
-                self.transactions_panel.stop()
+                self.transactions_panel.set_visible(False)
 
     def _hide_wallet_section(self):
         if hasattr(self, "wallet_container") and self.wallet_container.winfo_ismapped():
             self.wallet_container.pack_forget()
             if hasattr(self, "wallet_panel"):
-                self.wallet_panel.stop()
+                self.wallet_panel.set_visible(False)
 
     def _record_mock_trade(self, action, asset, amount, price, notional):
         """Record trade from wallet panel and sync to overview"""
@@ -754,10 +763,7 @@ class CryptoDashboardApp:
         self.status_var.set(
             f"WALLET • {direction} {amount:.4f} {asset} @ {price:,.2f} (value {notional:,.2f})"
         )
-        # Sync wallet data to overview
-        if hasattr(self, "wallet_panel") and hasattr(self, "overview_panel"):
-            balance, holdings = self.wallet_panel.get_balance_and_holdings()
-            self.overview_panel.sync_from_wallet(balance, holdings)
+        # The wallet reports its new balance through _on_wallet_balance_change
 
     def _record_overview_trade(self, action, asset, amount, price, notional):
         """Record trade from overview panel and sync to wallet"""
@@ -784,11 +790,10 @@ class CryptoDashboardApp:
             balance, holdings = self.overview_panel.get_balance_and_holdings()
             self.wallet_panel.sync_from_overview(balance, holdings)
 
-    def _on_wallet_balance_change(self, balance, holdings, total_value):
-        """Callback when wallet balance/total changes - sync to overview in real-time"""
+    def _on_wallet_balance_change(self, balance, holdings):
+        """Callback when wallet balance/holdings change - sync to overview in real-time"""
         if hasattr(self, "overview_panel"):
-            self.overview_panel.sync_from_wallet(
-                balance, holdings, total_value)
+            self.overview_panel.sync_from_wallet(balance, holdings)
 
     def _format_display_name(self, symbol_key):
         symbol_value = DEFAULT_SYMBOLS[symbol_key].upper()
@@ -889,6 +894,7 @@ class CryptoDashboardApp:
                 expand=True,
             )
             if hasattr(self, "transactions_panel"):
+                self.transactions_panel.set_visible(True)
                 self.transactions_panel.start()
             self.header_title.config(text="Transactions Stream")
 
@@ -905,6 +911,7 @@ class CryptoDashboardApp:
                 expand=True,
             )
             if hasattr(self, "wallet_panel"):
+                self.wallet_panel.set_visible(True)
                 self.wallet_panel.start()
             self.header_title.config(text="Wallet Overview")
 
@@ -966,10 +973,12 @@ class CryptoDashboardApp:
     def _hide_overview_section(self):
         if hasattr(self, "overview_panel") and self.overview_panel.frame.winfo_ismapped():
             self.overview_panel.pack_forget()
+            self.overview_panel.set_visible(False)
 
     def _show_overview_section(self):
         if hasattr(self, "overview_panel") and not self.overview_panel.frame.winfo_ismapped():
             self.overview_panel.pack(fill=tk.X)
+            self.overview_panel.set_visible(True)
 
     def _update_canvas_window_size(self, event):
         """Update canvas window size to fill the canvas"""
@@ -993,6 +1002,13 @@ class CryptoDashboardApp:
         self.stop_detail_panels()
         self._hide_wallet_section()
         self._hide_transactions_section()
+        self.wallet_panel.stop()
+        self.transactions_panel.stop()
+        self.scheduler.stop()
+        self.market_data.stop()
+        get_stream_manager().stop()
+        self.rest_client.stop()
+        close_session()
         self.root.destroy()
 
 
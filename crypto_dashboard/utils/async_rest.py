@@ -0,0 +1,201 @@
+import os
+import sys
+import queue
+import asyncio
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from utils import binance_rest  # type: ignore
+    from config import (  # type: ignore
+        REST_WORKERS,
+        REST_COMPLETION_POLL_MS,
+        REST_FANOUT_LIMIT,
+    )
+else:
+    from . import binance_rest
+    from ..config import REST_WORKERS, REST_COMPLETION_POLL_MS, REST_FANOUT_LIMIT
+
+
+class AsyncRestClient:
+    """Asyncio front end for the Binance REST helpers.
+
+    One background thread runs the event loop; the blocking HTTP calls run on
+    a fixed-size executor, so the thread count does not grow with the number
+    of panels or symbols. Results are handed back to Tk through a single queue
+    that ``attach`` drains with ``after``, keeping callbacks on the UI thread.
+    """
+
+    def __init__(self, max_workers=REST_WORKERS, poll_ms=REST_COMPLETION_POLL_MS):
+        self.max_workers = max_workers
+        self.poll_ms = poll_ms
+        self._loop = None
+        self._thread = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self._completions = queue.Queue()
+        self._widget = None
+        self._drain_job = None
+
+    # -- lifecycle -------------------------------------------------------
+    def start(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="rest")
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(self._executor)
+            self._thread = threading.Thread(
+                target=self._run_loop, name="rest-loop", daemon=True)
+            self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def stop(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+            executor, self._executor = self._executor, None
+        if self._widget is not None and self._drain_job is not None:
+            try:
+                self._widget.after_cancel(self._drain_job)
+            except Exception:
+                pass
+        self._widget = None
+        self._drain_job = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def attach(self, widget, poll_ms=None):
+        """Deliver completions on ``widget``'s Tk thread."""
+        self.start()
+        if poll_ms is not None:
+            self.poll_ms = poll_ms
+        self._widget = widget
+        if self._drain_job is None:
+            self._drain_job = widget.after(self.poll_ms, self._drain)
+
+    # -- REST surface ----------------------------------------------------
+    async def _call(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def get_order_book(self, symbol, limit=10):
+        return await self._call(binance_rest.get_order_book, symbol, limit=limit)
+
+    async def get_recent_trades(self, symbol, limit=20):
+        return await self._call(binance_rest.get_recent_trades, symbol, limit=limit)
+
+    async def get_klines(self, symbol, interval="1h", limit=50,
+                         priority=binance_rest.PRIORITY_NORMAL,
+                         start_time=None, end_time=None):
+        return await self._call(
+            binance_rest.get_klines, symbol, interval=interval, limit=limit,
+            priority=priority, start_time=start_time, end_time=end_time)
+
+    async def get_24hr_ticker(self, symbol):
+        return await self._call(binance_rest.get_24hr_ticker, symbol)
+
+    async def get_24hr_tickers(self, symbols):
+        return await self._call(binance_rest.get_24hr_tickers, list(symbols))
+
+    # -- scheduling ------------------------------------------------------
+    def submit(self, coro, callback=None):
+        """Run ``coro`` on the loop; ``callback(result)`` runs on the Tk thread."""
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        future.add_done_callback(
+            lambda done: self._completions.put((callback, done)))
+        return future
+
+    def run(self, fn, *args, callback=None, **kwargs):
+        """Run a blocking ``fn`` on the worker pool and report like ``submit``."""
+        return self.submit(self._call(fn, *args, **kwargs), callback)
+
+    def call_later(self, delay, fn, *args, callback=None, **kwargs):
+        """Like ``run``, after ``delay`` seconds; ``cancel()`` on the result drops it."""
+        return self.submit(self._later(delay, fn, *args, **kwargs), callback)
+
+    async def _later(self, delay, fn, *args, **kwargs):
+        await asyncio.sleep(delay)
+        return await self._call(fn, *args, **kwargs)
+
+    def map(self, fn, items, callback=None, limit=REST_FANOUT_LIMIT, done=None):
+        """Run ``fn(item)`` for every item with at most ``limit`` in flight.
+
+        ``callback(item, result)`` runs on the Tk thread as each call lands,
+        so results stream in instead of waiting for the slowest one;
+        ``done(results)`` follows once all have finished. Failed items are
+        reported and skipped.
+        """
+        items = list(items)
+        return self.submit(self._fan_out(fn, items, callback, limit), done)
+
+    async def _fan_out(self, fn, items, callback, limit):
+        gate = asyncio.Semaphore(max(1, limit))
+        results = {}
+
+        async def one(item):
+            async with gate:
+                try:
+                    result = await self._call(fn, item)
+                except Exception as e:
+                    print(f"Background REST call failed for {item}: {e}")
+                    return
+            results[item] = result
+            if callback is not None:
+                self._deliver(functools.partial(callback, item), result)
+
+        await asyncio.gather(*(one(item) for item in items))
+        return results
+
+    def _deliver(self, callback, result):
+        done = Future()
+        done.set_result(result)
+        self._completions.put((callback, done))
+
+    def _drain(self):
+        self._drain_job = None
+        while True:
+            try:
+                callback, future = self._completions.get_nowait()
+            except queue.Empty:
+                break
+            if future.cancelled():
+                continue
+            error = future.exception()
+            if error is not None:
+                print(f"Background REST call failed: {error}")
+                continue
+            if callback is None:
+                continue
+            try:
+                callback(future.result())
+            except Exception as e:
+                print(f"Error handling REST result: {e}")
+        if self._widget is not None:
+            self._drain_job = self._widget.after(self.poll_ms, self._drain)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_async_client():
+    """Shared AsyncRestClient used by every panel."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = AsyncRestClient()
+    return _client
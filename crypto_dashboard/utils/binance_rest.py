@@ -1,47 +1,421 @@
+import os
+import sys
+import json
+import time
+import threading
+from collections import OrderedDict
+
 import requests
+from requests.adapters import HTTPAdapter
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from utils.rate_governor import (  # type: ignore
+        RateGovernor,
+        PRIORITY_HIGH,
+        PRIORITY_NORMAL,
+        PRIORITY_LOW,
+    )
+    from config import (  # type: ignore
+        REST_POOL_CONNECTIONS,
+        REST_POOL_MAXSIZE,
+        REST_POOL_BLOCK,
+        REST_CACHE_TTLS,
+        REST_CACHE_MAX_ENTRIES,
+        REST_CACHE_MAX_BYTES,
+        REST_WEIGHT_LIMIT,
+        REST_WEIGHT_BUDGET,
+        REST_LOW_PRIORITY_RESERVE,
+    )
+else:
+    from .rate_governor import (
+        RateGovernor,
+        PRIORITY_HIGH,
+        PRIORITY_NORMAL,
+        PRIORITY_LOW,
+    )
+    from ..config import (
+        REST_POOL_CONNECTIONS,
+        REST_POOL_MAXSIZE,
+        REST_POOL_BLOCK,
+        REST_CACHE_TTLS,
+        REST_CACHE_MAX_ENTRIES,
+        REST_CACHE_MAX_BYTES,
+        REST_WEIGHT_LIMIT,
+        REST_WEIGHT_BUDGET,
+        REST_LOW_PRIORITY_RESERVE,
+    )
 
 BASE_URL = "https://api.binance.com"
 
+# Binance accepts up to this many symbols as a JSON list in ``symbols``.
+# Splitting never saves weight (1-20 symbols cost 2 each, 21-100 cost 40
+# flat), and past the limit the full-market ticker costs the same 80.
+TICKER_FULL_MARKET_THRESHOLD = 100
+
+_governor = RateGovernor(
+    REST_WEIGHT_LIMIT * REST_WEIGHT_BUDGET,
+    low_priority_reserve=REST_LOW_PRIORITY_RESERVE,
+)
+
+_session = None
+_session_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_request_count = 0
+
+
+def _build_session(pool_connections, pool_maxsize, pool_block):
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_session():
+    """Return the shared keep-alive session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(
+                    REST_POOL_CONNECTIONS, REST_POOL_MAXSIZE, REST_POOL_BLOCK
+                )
+    return _session
+
+
+def configure_session(pool_connections=None, pool_maxsize=None, pool_block=None):
+    """Rebuild the shared session with different pool limits."""
+    global _session
+    with _session_lock:
+        old = _session
+        _session = _build_session(
+            pool_connections or REST_POOL_CONNECTIONS,
+            pool_maxsize or REST_POOL_MAXSIZE,
+            REST_POOL_BLOCK if pool_block is None else pool_block,
+        )
+    if old is not None:
+        old.close()
+    return _session
+
+
+def close_session():
+    global _session
+    with _session_lock:
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def get_session_stats():
+    """Connection reuse stats for the shared session.
+
+    ``connections`` counts TCP connections opened by the pools, so
+    ``requests - connections`` is the number of calls that reused one.
+    """
+    session = _session
+    connections = 0
+    hosts = {}
+    if session is not None:
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += pool.num_connections
+                hosts[pool.host] = hosts.get(pool.host, 0) + pool.num_connections
+    with _stats_lock:
+        total = _request_count
+    return {
+        "requests": total,
+        "connections": connections,
+        "reused": max(0, total - connections),
+        "connections_per_host": hosts,
+    }
+
+
+def _count_request():
+    global _request_count
+    with _stats_lock:
+        _request_count += 1
+
+
+class ResponseCache:
+    """TTL + LRU cache for decoded REST responses with single-flight loads.
+
+    Concurrent callers asking for the same key while a load is running wait
+    for that load instead of issuing their own HTTP request.
+    """
+
+    def __init__(self, max_entries=REST_CACHE_MAX_ENTRIES, max_bytes=REST_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get_or_load(self, key, ttl, loader):
+        """Return a cached value for ``key`` or call ``loader`` once.
+
+        ``loader`` returns ``(value, size_in_bytes)``; ``None`` values are
+        handed to waiting callers but never stored.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[2]
+                self._drop(key)
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _InFlight()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            return flight.value
+
+        value = None
+        try:
+            value, size = loader()
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if value is not None and ttl > 0:
+                    self._store(key, time.monotonic() + ttl, size, value)
+            flight.value = value
+            flight.done.set()
+        return value
+
+    def _store(self, key, expires_at, size, value):
+        if key in self._entries:
+            self._drop(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (expires_at, size, value)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.evictions += 1
 
-def safe_api_call(path, params=None, retries=3, timeout=10):
+    def _drop(self, key):
+        _expires, size, _value = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+
+
+_cache = ResponseCache()
+
+
+def get_cache_stats():
+    return _cache.stats()
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def endpoint_weight(path, params=None):
+    """Request weight Binance charges for ``path`` with ``params``."""
+    params = params or {}
+    if path == "/api/v3/depth":
+        limit = int(params.get("limit", 100))
+        if limit <= 100:
+            return 5
+        if limit <= 500:
+            return 25
+        if limit <= 1000:
+            return 50
+        return 250
+    if path == "/api/v3/trades":
+        return 25
+    if path == "/api/v3/klines":
+        return 2
+    if path == "/api/v3/ticker/24hr":
+        if "symbol" in params:
+            return 2
+        if "symbols" in params:
+            try:
+                count = len(json.loads(params["symbols"]))
+            except (TypeError, ValueError):
+                count = 1
+            if count <= 20:
+                return 2
+            if count <= 100:
+                return 40
+        return 80
+    return 1
+
+
+def get_rate_limit_status():
+    """Current request-weight budget use as seen by the governor."""
+    return _governor.status()
+
+
+def _request(path, params=None, retries=3, timeout=10, priority=PRIORITY_NORMAL):
+    """Perform the HTTP call, returning ``(decoded_json, response_bytes)``."""
     url = BASE_URL + path
+    session = get_session()
+    weight = endpoint_weight(path, params)
     for attempt in range(retries):
         try:
-            resp = requests.get(url, params=params, timeout=timeout)
+            _governor.acquire(weight, priority)
+            _count_request()
+            resp = session.get(url, params=params, timeout=timeout)
+            _governor.observe(resp.headers)
+            if resp.status_code in (418, 429):
+                _governor.penalize(resp.status_code, resp.headers.get("Retry-After"))
             resp.raise_for_status()
-            return resp.json()
+            return resp.json(), len(resp.content)
         except requests.exceptions.Timeout:
             print(f"Timeout calling {path} (attempt {attempt + 1}/{retries})")
         except requests.exceptions.HTTPError as e:
             print(f"HTTP error calling {path}: {e}")
-            return None
+            return None, 0
         except Exception as e:
             print(f"Unexpected error calling {path}: {e}")
-            return None
+            return None, 0
     print(f"All retries failed for {path}")
-    return None
+    return None, 0
+
+
+def safe_api_call(path, params=None, retries=3, timeout=10, priority=PRIORITY_NORMAL):
+    data, _size = _request(
+        path, params, retries=retries, timeout=timeout, priority=priority)
+    return data
+
+
+def cached_api_call(path, params=None, ttl=None, retries=3, timeout=10,
+                    priority=PRIORITY_NORMAL):
+    """Like safe_api_call, but served from the shared response cache.
+
+    ``ttl`` defaults to the endpoint's entry in REST_CACHE_TTLS; a ttl of 0
+    still coalesces concurrent identical requests.
+    """
+    if ttl is None:
+        ttl = REST_CACHE_TTLS.get(path, 0)
+    key = (path, tuple(sorted((params or {}).items())))
+    return _cache.get_or_load(
+        key,
+        ttl,
+        lambda: _request(
+            path, params, retries=retries, timeout=timeout, priority=priority),
+    )
 
 
 def get_order_book(symbol, limit=10):
-    return safe_api_call("/api/v3/depth", {"symbol": symbol.upper(), "limit": limit})
+    return cached_api_call("/api/v3/depth", {"symbol": symbol.upper(), "limit": limit})
 
 
 def get_recent_trades(symbol, limit=20):
-    return safe_api_call("/api/v3/trades", {"symbol": symbol.upper(), "limit": limit})
+    return cached_api_call("/api/v3/trades", {"symbol": symbol.upper(), "limit": limit})
 
 
-def get_klines(symbol, interval="1h", limit=50):
-    return safe_api_call("/api/v3/klines", {
+def get_klines(symbol, interval="1h", limit=50, priority=PRIORITY_NORMAL,
+               start_time=None, end_time=None):
+    params = {
         "symbol": symbol.upper(),
         "interval": interval,
         "limit": limit
-    })
+    }
+    if start_time is not None:
+        params["startTime"] = int(start_time)
+    if end_time is not None:
+        params["endTime"] = int(end_time)
+    return cached_api_call("/api/v3/klines", params, priority=priority)
 
 
 def get_24hr_ticker(symbol):
-    return safe_api_call(
+    return cached_api_call(
         "/api/v3/ticker/24hr",
         {
             "symbol": symbol.upper(),
         },
     )
+
+
+def _index_tickers(data, wanted=None):
+    tickers = {}
+    if not isinstance(data, list):
+        return tickers
+    for entry in data:
+        if not isinstance(entry, dict):
+            continue
+        symbol = str(entry.get("symbol", "")).upper()
+        if not symbol or (wanted is not None and symbol not in wanted):
+            continue
+        tickers[symbol] = entry
+    return tickers
+
+
+def get_24hr_tickers(symbols):
+    """Fetch 24h tickers for many symbols, keyed by upper-case symbol.
+
+    Up to TICKER_FULL_MARKET_THRESHOLD symbols are fetched with one
+    ``symbols=`` call; longer lists fetch the full market once. If the
+    ``symbols=`` call is rejected (e.g. one delisted symbol), the full-market
+    form is used so the rest still resolve.
+    """
+    wanted = []
+    for symbol in symbols:
+        upper = symbol.upper()
+        if upper not in wanted:
+            wanted.append(upper)
+    if not wanted:
+        return {}
+    wanted_set = set(wanted)
+
+    if len(wanted) > TICKER_FULL_MARKET_THRESHOLD:
+        return _index_tickers(cached_api_call("/api/v3/ticker/24hr"), wanted_set)
+
+    data = cached_api_call(
+        "/api/v3/ticker/24hr",
+        {"symbols": json.dumps(wanted, separators=(",", ":"))},
+    )
+    if data is None:
+        data = cached_api_call("/api/v3/ticker/24hr")
+    return _index_tickers(data, wanted_set)
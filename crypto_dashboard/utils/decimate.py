@@ -0,0 +1,72 @@
+import numpy as np
+
+# Reduce long series to roughly one point per screen pixel before drawing,
+# keeping the extremes that a viewer would notice missing.
+
+
+def bucket_starts(count, max_points):
+    """Start indices of at most ``max_points`` contiguous, right-aligned buckets.
+
+    Buckets are aligned to the newest item so the last bucket always holds
+    the newest item alone when no decimation is needed.
+    """
+    if count <= max_points or max_points < 1:
+        return np.arange(count)
+    size = -(-count // max_points)
+    first = count - (count // size) * size
+    starts = np.arange(first, count, size)
+    return np.r_[0, starts] if first else starts
+
+
+def merge_candles(rows, max_points):
+    """Merge (N, 6) candles into at most ``max_points`` OHLCV buckets.
+
+    Each bucket keeps the first open, the highest high, the lowest low,
+    the last close and the summed volume, so wicks are never clipped.
+    Returns ``(merged, starts)``.
+    """
+    rows = np.asarray(rows, dtype=float)
+    starts = bucket_starts(len(rows), max_points)
+    if len(starts) == len(rows):
+        return rows, starts
+    ends = np.r_[starts[1:], len(rows)] - 1
+    merged = np.empty((len(starts), rows.shape[1]))
+    merged[:, 0] = rows[starts, 0]
+    merged[:, 1] = rows[starts, 1]
+    merged[:, 2] = np.maximum.reduceat(rows[:, 2], starts)
+    merged[:, 3] = np.minimum.reduceat(rows[:, 3], starts)
+    merged[:, 4] = rows[ends, 4]
+    merged[:, 5] = np.add.reduceat(rows[:, 5], starts)
+    return merged, starts
+
+
+def lttb(x, y, max_points):
+    """Largest-Triangle-Three-Buckets downsampling; returns kept indices.
+
+    NaN values are skipped, so warming-up indicator series are safe to pass.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.flatnonzero(np.isfinite(y))
+    n = len(valid)
+    if n <= max_points or max_points < 3:
+        return valid
+    xs, ys = x[valid], y[valid]
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    kept = np.empty(max_points, dtype=int)
+    kept[0] = 0
+    kept[-1] = n - 1
+    prev = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # Average of the next bucket is the third triangle vertex
+        nlo, nhi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xs[nlo:nhi].mean() if nhi > nlo else xs[-1]
+        avg_y = ys[nlo:nhi].mean() if nhi > nlo else ys[-1]
+        area = np.abs(
+            (xs[prev] - avg_x) * (ys[lo:hi] - ys[prev])
+            - (xs[prev] - xs[lo:hi]) * (avg_y - ys[prev])
+        )
+        prev = lo + int(np.argmax(area))
+        kept[i + 1] = prev
+    return valid[kept]
@@ -1,13 +1,360 @@
+import math
+from collections import deque
+
 import numpy as np
 
+# Batch functions take 1-D sequences and return float arrays of the same
+# length, NaN where the indicator is still warming up. The *State classes
+# compute the same values one closed bar at a time in O(1).
+
+EWM_PRECISION = 1e-6
+DAY_MS = 86_400_000
+
 
 def sma(values, window):
     """Simple Moving Average."""
     if len(values) < window:
         return np.array(values, dtype=float)
-    arr = np.array(values, dtype=float)
-    weights = np.ones(window) / window
-    sma_values = np.convolve(arr, weights, mode="valid")
-    # pad front so length matches
-    pad = [np.nan] * (len(arr) - len(sma_values))
-    return np.concatenate([pad, sma_values])
+    arr = np.asarray(values, dtype=float)
+    # Offset by the first value to keep the running sum well conditioned
+    shifted = np.cumsum(arr - arr[0])
+    sums = shifted[window - 1:].copy()
+    sums[1:] -= shifted[:-window]
+    out = np.full(len(arr), np.nan)
+    out[window - 1:] = sums / window + arr[0]
+    return out
+
+
+def _ewm(values, alpha, initial):
+    """Exponential smoothing y[t] = y[t-1] + alpha * (x[t] - y[t-1]).
+
+    Runs in closed form over blocks short enough that the decay factors
+    stay within EWM_PRECISION, so long series never overflow.
+    """
+    arr = np.asarray(values, dtype=float)
+    out = np.empty(len(arr))
+    beta = 1.0 - alpha
+    if beta <= 0.0:
+        out[:] = arr
+        return out
+    block = int(max(1, min(4096, math.log(EWM_PRECISION) / math.log(beta))))
+    decay = beta ** np.arange(1, block + 1)
+    prev = initial
+    for start in range(0, len(arr), block):
+        chunk = arr[start:start + block]
+        d = decay[:len(chunk)]
+        out[start:start + len(chunk)] = d * (prev + alpha * np.cumsum(chunk / d))
+        prev = out[start + len(chunk) - 1]
+    return out
+
+
+def ema(values, span):
+    """Exponential Moving Average seeded with the first value."""
+    arr = np.asarray(values, dtype=float)
+    if not len(arr):
+        return arr.copy()
+    return _ewm(arr, 2.0 / (span + 1), arr[0])
+
+
+def _wilder(values, period):
+    """Wilder smoothing seeded with the mean of the first ``period`` values."""
+    arr = np.asarray(values, dtype=float)
+    out = np.full(len(arr), np.nan)
+    if len(arr) < period:
+        return out
+    seed = arr[:period].mean()
+    out[period - 1] = seed
+    out[period:] = _ewm(arr[period:], 1.0 / period, seed)
+    return out
+
+
+def rsi(closes, period=14):
+    """Relative Strength Index using Wilder smoothing."""
+    arr = np.asarray(closes, dtype=float)
+    out = np.full(len(arr), np.nan)
+    if len(arr) <= period:
+        return out
+    delta = np.diff(arr)
+    avg_gain = _wilder(np.maximum(delta, 0.0), period)
+    avg_loss = _wilder(np.maximum(-delta, 0.0), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    values = np.where(avg_loss == 0.0, 100.0, values)
+    out[1:] = np.where(np.isnan(avg_gain), np.nan, values)
+    return out
+
+
+def macd(closes, fast=12, slow=26, signal=9):
+    """Return (macd line, signal line, histogram)."""
+    line = ema(closes, fast) - ema(closes, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger(closes, window=20, num_std=2.0):
+    """Return (middle, upper, lower) bands using the population deviation."""
+    arr = np.asarray(closes, dtype=float)
+    mid = np.full(len(arr), np.nan)
+    std = np.full(len(arr), np.nan)
+    if len(arr) >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(arr, window)
+        mid[window - 1:] = windows.mean(axis=1)
+        std[window - 1:] = windows.std(axis=1)
+    return mid, mid + num_std * std, mid - num_std * std
+
+
+def true_range(highs, lows, closes):
+    highs = np.asarray(highs, dtype=float)
+    lows = np.asarray(lows, dtype=float)
+    closes = np.asarray(closes, dtype=float)
+    tr = highs - lows
+    if len(tr) > 1:
+        prev = closes[:-1]
+        tr[1:] = np.maximum.reduce([
+            tr[1:], np.abs(highs[1:] - prev), np.abs(lows[1:] - prev)])
+    return tr
+
+
+def atr(highs, lows, closes, period=14):
+    """Average True Range using Wilder smoothing."""
+    return _wilder(true_range(highs, lows, closes), period)
+
+
+def vwap(highs, lows, closes, volumes, open_times=None, session_ms=DAY_MS):
+    """Volume-weighted average of the typical price.
+
+    With ``open_times`` (ms) the average restarts at every UTC session
+    boundary; otherwise it runs over the whole series.
+    """
+    highs = np.asarray(highs, dtype=float)
+    volumes = np.asarray(volumes, dtype=float)
+    typical = (highs + np.asarray(lows, dtype=float) + np.asarray(closes, dtype=float)) / 3.0
+    pv = np.cumsum(typical * volumes)
+    vol = np.cumsum(volumes)
+    if open_times is not None and len(highs):
+        sessions = np.asarray(open_times, dtype=np.int64) // session_ms
+        starts = np.flatnonzero(np.r_[True, sessions[1:] != sessions[:-1]])
+        base = np.repeat(starts, np.diff(np.r_[starts, len(highs)]))
+        pv = pv - np.r_[0.0, pv][base]
+        vol = vol - np.r_[0.0, vol][base]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(vol > 0, pv / vol, np.nan)
+
+
+class SMAState:
+    def __init__(self, window):
+        self.window = window
+        self._values = deque()
+        self._sum = 0.0
+
+    def update(self, value):
+        self._values.append(value)
+        self._sum += value
+        if len(self._values) > self.window:
+            self._sum -= self._values.popleft()
+        if len(self._values) < self.window:
+            return math.nan
+        return self._sum / self.window
+
+
+class EMAState:
+    def __init__(self, span=None, alpha=None):
+        self.alpha = alpha if alpha is not None else 2.0 / (span + 1)
+        self.value = None
+
+    def update(self, value):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class WilderState:
+    def __init__(self, period):
+        self.period = period
+        self.value = None
+        self._warmup = []
+
+    def update(self, value):
+        if self.value is None:
+            self._warmup.append(value)
+            if len(self._warmup) < self.period:
+                return math.nan
+            self.value = sum(self._warmup) / self.period
+            self._warmup = []
+        else:
+            self.value += (value - self.value) / self.period
+        return self.value
+
+
+class RSIState:
+    def __init__(self, period=14):
+        self._gain = WilderState(period)
+        self._loss = WilderState(period)
+        self._prev = None
+
+    def update(self, close):
+        prev, self._prev = self._prev, close
+        if prev is None:
+            return math.nan
+        delta = close - prev
+        gain = self._gain.update(max(delta, 0.0))
+        loss = self._loss.update(max(-delta, 0.0))
+        if math.isnan(gain):
+            return math.nan
+        if loss == 0.0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+
+class MACDState:
+    def __init__(self, fast=12, slow=26, signal=9):
+        self._fast = EMAState(fast)
+        self._slow = EMAState(slow)
+        self._signal = EMAState(signal)
+
+    def update(self, close):
+        line = self._fast.update(close) - self._slow.update(close)
+        signal = self._signal.update(line)
+        return line, signal, line - signal
+
+
+class BollingerState:
+    def __init__(self, window=20, num_std=2.0):
+        self.window = window
+        self.num_std = num_std
+        self._values = deque()
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._offset = None
+
+    def update(self, close):
+        if self._offset is None:
+            self._offset = close
+        value = close - self._offset
+        self._values.append(value)
+        self._sum += value
+        self._sumsq += value * value
+        if len(self._values) > self.window:
+            old = self._values.popleft()
+            self._sum -= old
+            self._sumsq -= old * old
+        if len(self._values) < self.window:
+            return math.nan, math.nan, math.nan
+        mean = self._sum / self.window
+        std = math.sqrt(max(self._sumsq / self.window - mean * mean, 0.0))
+        mid = mean + self._offset
+        return mid, mid + self.num_std * std, mid - self.num_std * std
+
+
+class ATRState:
+    def __init__(self, period=14):
+        self._smooth = WilderState(period)
+        self._prev_close = None
+
+    def update(self, high, low, close):
+        tr = high - low
+        if self._prev_close is not None:
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        return self._smooth.update(tr)
+
+
+class VWAPState:
+    def __init__(self, session_ms=DAY_MS):
+        self.session_ms = session_ms
+        self._session = None
+        self._pv = 0.0
+        self._volume = 0.0
+
+    def update(self, high, low, close, volume, open_time=None):
+        if open_time is not None:
+            session = int(open_time) // self.session_ms
+            if session != self._session:
+                self._session = session
+                self._pv = 0.0
+                self._volume = 0.0
+        self._pv += (high + low + close) / 3.0 * volume
+        self._volume += volume
+        return self._pv / self._volume if self._volume > 0 else math.nan
+
+
+class IndicatorEngine:
+    """Compute a fixed indicator set over (N, 6) kline columns.
+
+    ``compute`` runs the vectorized batch versions over a whole series;
+    ``seed`` and ``update`` keep incremental state for bar-by-bar feeds.
+    Both return the same keys.
+    """
+
+    def __init__(self, sma_window=20, ema_span=9, bb_window=20, bb_std=2.0,
+                 rsi_period=14, macd_periods=(12, 26, 9), atr_period=14):
+        self.sma_window = sma_window
+        self.ema_span = ema_span
+        self.bb_window = bb_window
+        self.bb_std = bb_std
+        self.rsi_period = rsi_period
+        self.macd_periods = macd_periods
+        self.atr_period = atr_period
+        self._states = None
+
+    def compute(self, columns):
+        open_times = columns[:, 0]
+        highs, lows, closes, volumes = columns[:, 2], columns[:, 3], columns[:, 4], columns[:, 5]
+        bb_mid, bb_upper, bb_lower = bollinger(closes, self.bb_window, self.bb_std)
+        macd_line, macd_signal, macd_hist = macd(closes, *self.macd_periods)
+        sma_values = sma(closes, self.sma_window)
+        if len(closes) < self.sma_window:
+            sma_values = np.full(len(closes), np.nan)
+        return {
+            "sma": sma_values,
+            "ema": ema(closes, self.ema_span),
+            "bb_mid": bb_mid,
+            "bb_upper": bb_upper,
+            "bb_lower": bb_lower,
+            "rsi": rsi(closes, self.rsi_period),
+            "macd": macd_line,
+            "macd_signal": macd_signal,
+            "macd_hist": macd_hist,
+            "atr": atr(highs, lows, closes, self.atr_period),
+            "vwap": vwap(highs, lows, closes, volumes, open_times),
+        }
+
+    def seed(self, columns):
+        """Reset the incremental state and replay ``columns`` through it."""
+        self._states = {
+            "sma": SMAState(self.sma_window),
+            "ema": EMAState(self.ema_span),
+            "bb": BollingerState(self.bb_window, self.bb_std),
+            "rsi": RSIState(self.rsi_period),
+            "macd": MACDState(*self.macd_periods),
+            "atr": ATRState(self.atr_period),
+            "vwap": VWAPState(),
+        }
+        latest = {}
+        for row in np.asarray(columns, dtype=float).tolist():
+            latest = self.update(row)
+        return latest
+
+    def update(self, row):
+        """Feed one closed candle (open time, OHLC, volume); return latest values."""
+        if self._states is None:
+            self.seed(np.empty((0, 6)))
+        open_time, _open, high, low, close, volume = row[:6]
+        states = self._states
+        bb_mid, bb_upper, bb_lower = states["bb"].update(close)
+        macd_line, macd_signal, macd_hist = states["macd"].update(close)
+        return {
+            "sma": states["sma"].update(close),
+            "ema": states["ema"].update(close),
+            "bb_mid": bb_mid,
+            "bb_upper": bb_upper,
+            "bb_lower": bb_lower,
+            "rsi": states["rsi"].update(close),
+            "macd": macd_line,
+            "macd_signal": macd_signal,
+            "macd_hist": macd_hist,
+            "atr": states["atr"].update(high, low, close),
+            "vwap": states["vwap"].update(high, low, close, volume, open_time),
+        }
@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import sqlite3
+import threading
+
+import numpy as np
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from config import KLINE_CACHE_DIR, KLINE_CACHE_MAX_BYTES  # type: ignore
+else:
+    from ..config import KLINE_CACHE_DIR, KLINE_CACHE_MAX_BYTES
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EVICT_INTERVAL = 60.0
+SUFFIX = ".sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS klines (
+    open_time INTEGER PRIMARY KEY,
+    open REAL NOT NULL,
+    high REAL NOT NULL,
+    low REAL NOT NULL,
+    close REAL NOT NULL,
+    volume REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+
+class KlineDiskCache:
+    """Persist kline series across runs, one SQLite file per (symbol, interval).
+
+    Files use WAL journaling and every write is a single transaction, so a
+    crash leaves each file at its last committed state. Whole series files
+    are evicted least-recently-used first once the directory grows past
+    ``max_bytes``.
+    """
+
+    def __init__(self, directory=KLINE_CACHE_DIR, max_bytes=KLINE_CACHE_MAX_BYTES):
+        if directory and not os.path.isabs(directory):
+            directory = os.path.join(APP_DIR, directory)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._initialized = set()
+        self._last_evict = 0.0
+
+    @property
+    def enabled(self):
+        return bool(self.directory)
+
+    def _path(self, symbol, interval):
+        return os.path.join(self.directory, f"{symbol.upper()}_{interval}{SUFFIX}")
+
+    def _connect(self, path):
+        conn = sqlite3.connect(path, timeout=5)
+        if path not in self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            self._initialized.add(path)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def load(self, symbol, interval, limit):
+        """Return up to ``limit`` newest cached rows as an (N, 6) array."""
+        if not self.enabled:
+            return np.empty((0, 6))
+        path = self._path(symbol, interval)
+        if not os.path.exists(path):
+            return np.empty((0, 6))
+        try:
+            with self._lock:
+                conn = self._connect(path)
+                try:
+                    rows = conn.execute(
+                        "SELECT open_time, open, high, low, close, volume FROM klines "
+                        "ORDER BY open_time DESC LIMIT ?",
+                        (int(limit),),
+                    ).fetchall()
+                finally:
+                    conn.close()
+            os.utime(path)
+        except (sqlite3.Error, OSError) as e:
+            print(f"Kline cache read failed for {symbol} {interval}: {e}")
+            return np.empty((0, 6))
+        if not rows:
+            return np.empty((0, 6))
+        return np.array(rows[::-1], dtype=float)
+
+    def save(self, symbol, interval, rows):
+        """Insert or replace ``rows`` (an (N, 6) array) in one transaction."""
+        if not self.enabled or rows is None or not len(rows):
+            return
+        records = [
+            (int(row[0]), row[1], row[2], row[3], row[4], row[5])
+            for row in np.asarray(rows, dtype=float).tolist()
+        ]
+        try:
+            with self._lock:
+                os.makedirs(self.directory, exist_ok=True)
+                conn = self._connect(self._path(symbol, interval))
+                try:
+                    with conn:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO klines VALUES (?, ?, ?, ?, ?, ?)",
+                            records,
+                        )
+                finally:
+                    conn.close()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Kline cache write failed for {symbol} {interval}: {e}")
+            return
+        if time.monotonic() - self._last_evict > EVICT_INTERVAL:
+            self.evict()
+
+    def evict(self):
+        """Delete least recently used series files until under ``max_bytes``."""
+        self._last_evict = time.monotonic()
+        if not self.enabled or not os.path.isdir(self.directory):
+            return
+        series = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                size = sum(
+                    os.path.getsize(path + extra)
+                    for extra in ("", "-wal", "-shm")
+                    if os.path.exists(path + extra)
+                )
+                series.append((os.path.getmtime(path), size, path))
+            except OSError:
+                continue
+            total += size
+        series.sort()
+        with self._lock:
+            for _mtime, size, path in series:
+                if total <= self.max_bytes:
+                    break
+                for extra in ("", "-wal", "-shm"):
+                    try:
+                        os.remove(path + extra)
+                    except OSError:
+                        pass
+                self._initialized.discard(path)
+                total -= size
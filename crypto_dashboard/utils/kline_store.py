@@ -0,0 +1,371 @@
+import os
+import sys
+import time
+import threading
+
+import numpy as np
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from utils.binance_rest import get_klines, PRIORITY_NORMAL  # type: ignore
+    from utils.kline_cache import KlineDiskCache  # type: ignore
+    from config import (  # type: ignore
+        KLINE_STORE_MAX_ROWS,
+        KLINE_FETCH_LIMIT,
+        KLINE_BASE_INTERVAL,
+        KLINE_BASE_MAX_ROWS,
+    )
+else:
+    from .binance_rest import get_klines, PRIORITY_NORMAL
+    from .kline_cache import KlineDiskCache
+    from ..config import (
+        KLINE_STORE_MAX_ROWS,
+        KLINE_FETCH_LIMIT,
+        KLINE_BASE_INTERVAL,
+        KLINE_BASE_MAX_ROWS,
+    )
+
+# Column layout of every stored candle row
+OPEN_TIME, OPEN, HIGH, LOW, CLOSE, VOLUME = range(6)
+COLUMNS = 6
+
+INTERVAL_MS = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "6h": 6 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+    "3d": 3 * 86_400_000,
+    "1w": 7 * 86_400_000,
+}
+
+# Binance weekly candles open on Monday 00:00 UTC; the epoch was a Thursday
+INTERVAL_OFFSET_MS = {
+    "1w": 4 * 86_400_000,
+}
+
+MAX_GAP_FILLS = 4
+
+
+def to_columns(data):
+    """Convert raw Binance kline rows to an (N, 6) float array."""
+    if not data:
+        return np.empty((0, COLUMNS))
+    try:
+        return np.array([row[:COLUMNS] for row in data], dtype=float)
+    except (TypeError, ValueError, IndexError):
+        return np.empty((0, COLUMNS))
+
+
+def resample(rows, step, offset=0):
+    """Aggregate sorted (N, 6) rows into UTC-aligned candles of ``step`` ms.
+
+    A leading bucket that starts before the first row is dropped because it
+    would be missing its open.
+    """
+    if not len(rows):
+        return np.empty((0, COLUMNS))
+    times = rows[:, OPEN_TIME]
+    buckets = (times - offset) // step * step + offset
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(rows)] - 1
+    out = np.empty((len(starts), COLUMNS))
+    out[:, OPEN_TIME] = buckets[starts]
+    out[:, OPEN] = rows[starts, OPEN]
+    out[:, HIGH] = np.maximum.reduceat(rows[:, HIGH], starts)
+    out[:, LOW] = np.minimum.reduceat(rows[:, LOW], starts)
+    out[:, CLOSE] = rows[ends, CLOSE]
+    out[:, VOLUME] = np.add.reduceat(rows[:, VOLUME], starts)
+    if times[0] > out[0, OPEN_TIME]:
+        out = out[1:]
+    return out
+
+
+def missing_ranges(times, start, end, step):
+    """(start, end) open times of the ``step`` slots in [start, end] absent from ``times``."""
+    times = times[(times >= start) & (times <= end)]
+    edges = np.r_[start - step, times, end + step]
+    holes = np.nonzero(np.diff(edges) > step)[0]
+    return [(edges[i] + step, edges[i + 1] - step) for i in holes]
+
+
+class KlineSeries:
+    """Candles for one (symbol, interval), sorted by open time."""
+
+    def __init__(self, symbol, interval, max_rows=KLINE_STORE_MAX_ROWS):
+        self.symbol = symbol.upper()
+        self.interval = interval
+        self.step = INTERVAL_MS.get(interval)
+        self.max_rows = max_rows
+        self.rows = np.empty((0, COLUMNS))
+        self.lock = threading.Lock()
+        # Serializes network fetches so concurrent readers share one request
+        self.fetch_lock = threading.Lock()
+        # (start, end) open times the exchange had no candles for, such as
+        # before the listing or across a trading halt; merged and sorted
+        self.empty = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def merge(self, new_rows):
+        """Insert or replace rows by open time."""
+        new_rows = np.asarray(new_rows, dtype=float).reshape(-1, COLUMNS)
+        if not len(new_rows):
+            return
+        with self.lock:
+            rows = self.rows
+            if len(rows) and new_rows[0, OPEN_TIME] > rows[-1, OPEN_TIME]:
+                merged = np.concatenate([rows, new_rows])
+            elif len(rows) and len(new_rows) == 1 and new_rows[0, OPEN_TIME] == rows[-1, OPEN_TIME]:
+                merged = rows.copy()
+                merged[-1] = new_rows[0]
+            else:
+                keep = ~np.isin(rows[:, OPEN_TIME], new_rows[:, OPEN_TIME])
+                merged = np.concatenate([rows[keep], new_rows])
+                merged = merged[np.argsort(merged[:, OPEN_TIME], kind="stable")]
+            self.rows = merged[-self.max_rows:]
+
+    def tail(self, count):
+        """Return a copy of the newest ``count`` rows."""
+        with self.lock:
+            return self.rows[-count:].copy()
+
+    def last_open_time(self):
+        with self.lock:
+            return self.rows[-1, OPEN_TIME] if len(self.rows) else None
+
+    def window_start(self, count):
+        """Open time of the oldest of the ``count`` slots ending at the last candle."""
+        last_open = self.last_open_time()
+        if last_open is None or not self.step:
+            return None
+        return last_open - (count - 1) * self.step
+
+    def gaps(self, count):
+        """(start, end) open times of candles missing from the newest ``count`` slots.
+
+        Oldest first. Ranges the exchange is known to have no candles for are
+        left out, so a hole it cannot fill is not asked for again.
+        """
+        start = self.window_start(count)
+        if start is None:
+            return []
+        with self.lock:
+            times = self.rows[:, OPEN_TIME]
+            times = times[np.searchsorted(times, start):]
+        gaps = missing_ranges(times, start, times[-1], self.step)
+        for low, high in self.empty:
+            kept = []
+            for gap_start, gap_end in gaps:
+                if gap_end < low or gap_start > high:
+                    kept.append((gap_start, gap_end))
+                    continue
+                if gap_start < low:
+                    kept.append((gap_start, low - self.step))
+                if gap_end > high:
+                    kept.append((high + self.step, gap_end))
+            gaps = kept
+        return gaps
+
+    def mark_empty(self, start, end):
+        """Remember that the exchange has no candles opening in [start, end]."""
+        merged = []
+        for low, high in sorted(self.empty + [(start, end)]):
+            if merged and low <= merged[-1][1] + self.step:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+            else:
+                merged.append((low, high))
+        self.empty = merged
+
+
+class KlineStore:
+    """Shared in-memory kline cache that fetches only what is missing.
+
+    The first request for a series loads the full window; later requests
+    ask Binance for candles from the last stored open time onwards (the
+    forming candle is always refreshed). The full window is reloaded only
+    when the series holds too little older history; holes inside it are
+    filled with ranged requests, and ranges that come back empty are
+    remembered so they are not requested again. With a
+    ``disk`` cache, new series start from the rows saved by earlier runs
+    and every fetched batch is written back.
+    """
+
+    def __init__(self, max_rows=KLINE_STORE_MAX_ROWS, disk=None):
+        self.max_rows = max_rows
+        self.disk = disk
+        self._series = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rows_fetched = 0
+
+    def series(self, symbol, interval):
+        key = (symbol.upper(), interval)
+        max_rows = KLINE_BASE_MAX_ROWS if interval == KLINE_BASE_INTERVAL else self.max_rows
+        with self._lock:
+            series = self._series.get(key)
+            created = series is None
+            if created:
+                series = KlineSeries(symbol, interval, max(max_rows, self.max_rows))
+                self._series[key] = series
+        if created and self.disk is not None:
+            series.merge(self.disk.load(symbol, interval, series.max_rows))
+        return series
+
+    def cached(self, symbol, interval, limit):
+        """Newest ``limit`` rows already held in memory or on disk, no network."""
+        return self.series(symbol, interval).tail(limit)
+
+    # -- intervals derived from the base series ----------------------------
+    def base_rows_needed(self, interval, limit):
+        """Base candles needed to derive ``limit`` candles, or None if not derivable."""
+        step = INTERVAL_MS.get(interval)
+        base_step = INTERVAL_MS[KLINE_BASE_INTERVAL]
+        if not step or step <= base_step or step % base_step:
+            return None
+        factor = step // base_step
+        needed = (limit + 1) * factor
+        return needed if needed <= KLINE_BASE_MAX_ROWS else None
+
+    def derives(self, interval, limit):
+        return interval == KLINE_BASE_INTERVAL or self.base_rows_needed(interval, limit) is not None
+
+    def window(self, symbol, interval, limit, priority=PRIORITY_NORMAL, cached_only=False):
+        """Newest ``limit`` candles of ``interval``, resampled from the base when possible.
+
+        Falls back to the native series when the base cannot cover the window.
+        """
+        needed = self.base_rows_needed(interval, limit)
+        if needed is None:
+            if cached_only:
+                return self.cached(symbol, interval, limit)
+            return self.fetch(symbol, interval, limit, priority)
+        if cached_only:
+            base = self.cached(symbol, KLINE_BASE_INTERVAL, needed)
+        else:
+            base = self.fetch(symbol, KLINE_BASE_INTERVAL, needed, priority)
+        return resample(base, INTERVAL_MS[interval],
+                        INTERVAL_OFFSET_MS.get(interval, 0))[-limit:]
+
+    def partial(self, symbol, interval):
+        """Rebuild only the newest derived candle from the base rows inside it."""
+        step = INTERVAL_MS[interval]
+        offset = INTERVAL_OFFSET_MS.get(interval, 0)
+        tail = self.cached(symbol, KLINE_BASE_INTERVAL, step // INTERVAL_MS[KLINE_BASE_INTERVAL])
+        if not len(tail):
+            return None
+        start = (tail[-1, OPEN_TIME] - offset) // step * step + offset
+        row = resample(tail[tail[:, OPEN_TIME] >= start], step, offset)
+        return row[-1] if len(row) else None
+
+    def update(self, symbol, interval, row):
+        """Merge a single candle, e.g. from the kline WebSocket stream."""
+        self.series(symbol, interval).merge(row)
+
+    def fetch(self, symbol, interval, limit, priority=PRIORITY_NORMAL):
+        """Bring the series up to date and return its newest ``limit`` rows.
+
+        Blocking; call it from a worker thread.
+        """
+        series = self.series(symbol, interval)
+        limit = min(limit, series.max_rows)
+        with series.fetch_lock:
+            last_open = series.last_open_time()
+            if last_open is None or not series.step:
+                self._load_window(series, priority, limit)
+            else:
+                now_ms = time.time() * 1000
+                missing = int((now_ms - last_open) // series.step) + 1
+                if missing > KLINE_FETCH_LIMIT:
+                    self._load_window(series, priority, limit)
+                else:
+                    self._load(series, priority, limit=missing + 1,
+                               start_time=last_open)
+                    gaps = series.gaps(limit)
+                    if gaps and gaps[0][0] <= series.window_start(limit):
+                        self._load_window(series, priority, limit)
+            for start, end in series.gaps(limit)[:MAX_GAP_FILLS]:
+                self._fill(series, priority, start, end)
+        return series.tail(limit)
+
+    def _load(self, series, priority, **params):
+        """Fetch and merge one klines request; None when the request failed."""
+        data = get_klines(series.symbol, interval=series.interval,
+                          priority=priority, **params)
+        self.requests += 1
+        if not isinstance(data, list):
+            return None
+        rows = to_columns(data)
+        self.rows_fetched += len(rows)
+        series.merge(rows)
+        if self.disk is not None:
+            self.disk.save(series.symbol, series.interval, rows)
+        return rows
+
+    def _load_window(self, series, priority, limit):
+        """Load the newest ``limit`` candles, paging backwards past the request cap."""
+        end_time = None
+        remaining = limit
+        while remaining > 0:
+            batch = min(remaining, KLINE_FETCH_LIMIT)
+            params = {"limit": batch}
+            if end_time is not None:
+                params["end_time"] = end_time
+            rows = self._load(series, priority, **params)
+            if rows is None:
+                break
+            if len(rows) < batch:
+                # Paged back past the listing: nothing older exists
+                if series.step and (len(rows) or end_time is not None):
+                    first = rows[0, OPEN_TIME] if len(rows) else end_time + 1
+                    series.mark_empty(0, first - series.step)
+                break
+            remaining -= len(rows)
+            end_time = rows[0, OPEN_TIME] - 1
+
+    def _fill(self, series, priority, start, end):
+        """Load the candles opening in [start, end] and remember the slots left empty."""
+        count = int((end - start) // series.step) + 1
+        if count > KLINE_FETCH_LIMIT:
+            count = KLINE_FETCH_LIMIT
+            end = start + (count - 1) * series.step
+        rows = self._load(series, priority, limit=count, start_time=start, end_time=end)
+        if rows is None:
+            return
+        for low, high in missing_ranges(rows[:, OPEN_TIME], start, end, series.step):
+            series.mark_empty(low, high)
+
+    def stats(self):
+        with self._lock:
+            cached = sum(len(series) for series in self._series.values())
+            count = len(self._series)
+        return {
+            "series": count,
+            "rows": cached,
+            "requests": self.requests,
+            "rows_fetched": self.rows_fetched,
+        }
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_kline_store():
+    """Return the process-wide kline store shared by every chart."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = KlineStore(disk=KlineDiskCache())
+        return _store
@@ -0,0 +1,175 @@
+import os
+import sys
+import time
+import threading
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from config import DEFAULT_SYMBOLS, MARKET_DATA_FLUSH_MS, MARKET_DATA_FRESH_MS  # type: ignore
+else:
+    from ..config import DEFAULT_SYMBOLS, MARKET_DATA_FLUSH_MS, MARKET_DATA_FRESH_MS
+
+
+class MarketDataStore:
+    """Latest price and 24h change per asset, shared by every panel.
+
+    Any thread may feed it: the ticker socket pushes single quotes and REST
+    polls push whole ticker batches. A quote older than the one already held
+    (by exchange event time) is dropped, so whichever source is fastest wins.
+    Subscribers are called on the Tk thread once per ``flush_ms`` with only
+    the quotes that changed since the previous flush.
+    """
+
+    def __init__(self, symbols=None, flush_ms=MARKET_DATA_FLUSH_MS):
+        self.flush_ms = flush_ms
+        self._keys_by_pair = {
+            pair.upper(): key for key, pair in (symbols or DEFAULT_SYMBOLS).items()}
+        self._quotes = {}
+        self._dirty = set()
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._widget = None
+        self._flush_job = None
+        self.updates = 0
+        self.ignored = 0
+        self.flushes = 0
+
+    def attach(self, widget):
+        """Deliver change notifications on ``widget``'s Tk thread."""
+        self._widget = widget
+        if self._flush_job is None:
+            self._flush_job = widget.after(self.flush_ms, self._flush)
+
+    def stop(self):
+        if self._widget is not None and self._flush_job is not None:
+            try:
+                self._widget.after_cancel(self._flush_job)
+            except Exception:
+                pass
+        self._flush_job = None
+        self._widget = None
+
+    def subscribe(self, callback):
+        """``callback(changes)`` gets ``{key: {"price", "change_percent"}}``."""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def key_for(self, pair):
+        """Asset key (e.g. ``BTC``) for a trading pair such as ``btcusdt``."""
+        return self._keys_by_pair.get(str(pair).upper())
+
+    # -- writers (any thread) --------------------------------------------
+    def update(self, key, price, change_percent=None, event_time=None):
+        """Store one quote; returns False if it was stale or invalid."""
+        if not key or not price or price <= 0:
+            return False
+        with self._lock:
+            current = self._quotes.get(key)
+            if current is not None:
+                if event_time is not None and event_time < current["event_time"]:
+                    self.ignored += 1
+                    return False
+                if change_percent is None:
+                    change_percent = current["change_percent"]
+            quote = {
+                "price": price,
+                "change_percent": change_percent or 0.0,
+                "event_time": event_time or 0,
+                "received": time.monotonic(),
+            }
+            self._quotes[key] = quote
+            self.updates += 1
+            if (current is None or current["price"] != price
+                    or current["change_percent"] != quote["change_percent"]):
+                self._dirty.add(key)
+        return True
+
+    def apply_tickers(self, tickers):
+        """Feed a ``{PAIR: 24hr ticker}`` mapping; returns the keys it held.
+
+        Keys whose quote lost to a newer socket update still count, since
+        the caller's fetch did succeed.
+        """
+        found = []
+        for pair, data in (tickers or {}).items():
+            key = self.key_for(pair)
+            if key is None or not data:
+                continue
+            try:
+                price = float(data.get("lastPrice", 0))
+                change_percent = float(data.get("priceChangePercent", 0))
+                event_time = int(data.get("closeTime") or 0) or None
+            except (TypeError, ValueError):
+                continue
+            self.update(key, price, change_percent, event_time)
+            found.append(key)
+        return found
+
+    # -- readers ---------------------------------------------------------
+    def price(self, key, default=0.0):
+        quote = self._quotes.get(key)
+        return quote["price"] if quote is not None else default
+
+    def quote(self, key):
+        quote = self._quotes.get(key)
+        return dict(quote) if quote is not None else None
+
+    def stale(self, keys, max_age_ms=MARKET_DATA_FRESH_MS):
+        """Keys with no quote received in the last ``max_age_ms``."""
+        cutoff = time.monotonic() - max_age_ms / 1000
+        with self._lock:
+            return [key for key in keys
+                    if key not in self._quotes or self._quotes[key]["received"] < cutoff]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "quotes": len(self._quotes),
+                "subscribers": len(self._subscribers),
+                "updates": self.updates,
+                "ignored": self.ignored,
+                "flushes": self.flushes,
+            }
+
+    def _flush(self):
+        self._flush_job = None
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            changes = {
+                key: {"price": self._quotes[key]["price"],
+                      "change_percent": self._quotes[key]["change_percent"]}
+                for key in dirty
+            }
+            subscribers = list(self._subscribers)
+        if changes:
+            self.flushes += 1
+            for callback in subscribers:
+                try:
+                    callback(changes)
+                except Exception as e:
+                    print(f"Error handling market data update: {e}")
+        if self._widget is not None:
+            self._flush_job = self._widget.after(self.flush_ms, self._flush)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_market_data():
+    """Shared MarketDataStore used by every panel."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = MarketDataStore()
+    return _store
@@ -0,0 +1,252 @@
+import heapq
+import os
+import sys
+import threading
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from utils.binance_rest import safe_api_call, PRIORITY_HIGH  # type: ignore
+    from utils.async_rest import get_async_client  # type: ignore
+    from utils.stream_manager import get_stream_manager  # type: ignore
+    from config import ORDERBOOK_SNAPSHOT_LIMIT  # type: ignore
+else:
+    from .binance_rest import safe_api_call, PRIORITY_HIGH
+    from .async_rest import get_async_client
+    from .stream_manager import get_stream_manager
+    from ..config import ORDERBOOK_SNAPSHOT_LIMIT
+
+MAX_BUFFERED_EVENTS = 1000
+SNAPSHOT_RETRY_MIN_S = 1.0   # first retry after a failed depth snapshot
+SNAPSHOT_RETRY_MAX_S = 30.0  # retries back off by doubling up to this
+
+
+class BookSide:
+    """Price levels for one side of the book.
+
+    Quantities live in a dict keyed by price, so applying a diff level is
+    O(1). The best levels are ordered lazily: ``top(n)`` selects them with a
+    heap in O(m log n) over the m levels held and caches the prices until a
+    change could reorder them. Quantity changes and updates behind the
+    cached levels leave the cache alone.
+    """
+
+    def __init__(self, descending):
+        self.descending = descending
+        self._levels = {}
+        self._top = None  # cached best-first prices, or None when stale
+        self._top_n = 0
+
+    def _best(self, n):
+        if self.descending:
+            return heapq.nlargest(n, self._levels)
+        return heapq.nsmallest(n, self._levels)
+
+    def clear(self):
+        self._levels.clear()
+        self._top = None
+
+    def set(self, price, qty):
+        levels = self._levels
+        if qty <= 0:
+            if levels.pop(price, None) is None:
+                return
+        else:
+            known = price in levels
+            levels[price] = qty
+            if known:
+                return
+        top = self._top
+        if top is None:
+            return
+        # A level added or removed at or ahead of the last cached price (or
+        # anywhere, if the cache holds every level) changes the ordering
+        if len(top) < self._top_n or (
+                price >= top[-1] if self.descending else price <= top[-1]):
+            self._top = None
+
+    def top(self, n):
+        if n <= 0:
+            return []
+        top = self._top
+        if top is None or (n > self._top_n and len(top) == self._top_n):
+            top = self._top = self._best(n)
+            self._top_n = n
+        levels = self._levels
+        return [(price, levels[price]) for price in top[:n]]
+
+    def trim(self, depth):
+        """Drop levels beyond ``depth`` from the top of the book.
+
+        Waits until the side has outgrown ``depth`` by a quarter, so the
+        selection is paid once per many inserts rather than on every diff.
+        """
+        levels = self._levels
+        if len(levels) <= depth + depth // 4:
+            return
+        self._levels = {price: levels[price] for price in self._best(depth)}
+        if self._top_n > depth:
+            self._top = None
+
+    def __len__(self):
+        return len(self._levels)
+
+
+class LocalOrderBook:
+    """Order book kept current from a REST snapshot plus @depth diffs.
+
+    Follows Binance's procedure: buffer stream events, fetch a snapshot,
+    discard events already covered by ``lastUpdateId``, then apply events in
+    order. A gap between consecutive update ids triggers a fresh snapshot;
+    a failed snapshot is retried with backoff while events keep buffering.
+    """
+
+    def __init__(self, symbol, snapshot_limit=ORDERBOOK_SNAPSHOT_LIMIT, speed="100ms"):
+        self.symbol = symbol.upper()
+        self.snapshot_limit = snapshot_limit
+        self.stream = f"{symbol.lower()}@depth@{speed}"
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.last_update_id = None
+        self.synced = False
+        self.version = 0
+        self.resyncs = 0
+        self.snapshot_failures = 0
+        self._buffer = []
+        self._snapshot_pending = False
+        self._retry_delay = 0.0
+        self._retry_call = None
+        self._running = False
+        self._lock = threading.Lock()
+        self._client = get_async_client()
+        self._streams = get_stream_manager()
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._streams.subscribe(self.stream, self._on_event)
+        self._request_snapshot()
+
+    def stop(self):
+        self._running = False
+        self._streams.unsubscribe(self.stream, self._on_event)
+        with self._lock:
+            self._buffer.clear()
+            self.synced = False
+            retry, self._retry_call = self._retry_call, None
+            self._retry_delay = 0.0
+        if retry is not None:
+            retry.cancel()
+
+    def top(self, n):
+        """Return ``(bids, asks)`` as lists of (price, qty), best first."""
+        with self._lock:
+            return self.bids.top(n), self.asks.top(n)
+
+    def _request_snapshot(self):
+        with self._lock:
+            if self._snapshot_pending or not self._running:
+                return
+            self._snapshot_pending = True
+        self._client.run(self._load_snapshot)
+
+    def _load_snapshot(self):
+        data = safe_api_call(
+            "/api/v3/depth",
+            {"symbol": self.symbol, "limit": self.snapshot_limit},
+            priority=PRIORITY_HIGH,
+        )
+        retry = failed = False
+        with self._lock:
+            self._snapshot_pending = False
+            if not self._running:
+                return
+            last_id = data.get("lastUpdateId") if isinstance(data, dict) else None
+            if last_id is None:
+                # Failed or unusable snapshot; events keep buffering meanwhile
+                failed = True
+            else:
+                self._retry_delay = 0.0
+                events = [e for e in self._buffer if e["u"] > last_id]
+                if events and events[0]["U"] > last_id + 1:
+                    # Snapshot is older than the first buffered event; try again.
+                    retry = True
+                else:
+                    self._reset(data.get("bids", []), data.get("asks", []), last_id)
+                    self._buffer.clear()
+                    for event in events:
+                        if not self._apply(event):
+                            retry = True
+                            break
+                    self.synced = not retry
+                    self.version += 1
+        if failed:
+            self._schedule_retry()
+        elif retry:
+            self._resync()
+
+    def _schedule_retry(self):
+        """Ask for another snapshot after a growing delay"""
+        with self._lock:
+            if not self._running:
+                return
+            self.snapshot_failures += 1
+            self._retry_delay = min(
+                max(self._retry_delay * 2, SNAPSHOT_RETRY_MIN_S), SNAPSHOT_RETRY_MAX_S)
+            delay = self._retry_delay
+            self._retry_call = self._client.call_later(delay, self._request_snapshot)
+        print(f"Order book snapshot for {self.symbol} failed, retrying in {delay:.0f}s")
+
+    def _reset(self, bids, asks, last_id):
+        self.bids.clear()
+        self.asks.clear()
+        for price, qty, *_ in bids:
+            self.bids.set(float(price), float(qty))
+        for price, qty, *_ in asks:
+            self.asks.set(float(price), float(qty))
+        self.last_update_id = last_id
+
+    def _apply(self, event):
+        """Apply one diff; returns False when the update ids have a gap."""
+        if event["u"] <= self.last_update_id:
+            return True
+        if event["U"] > self.last_update_id + 1:
+            return False
+        for price, qty, *_ in event.get("b", ()):
+            self.bids.set(float(price), float(qty))
+        for price, qty, *_ in event.get("a", ()):
+            self.asks.set(float(price), float(qty))
+        self.last_update_id = event["u"]
+        depth = self.snapshot_limit * 4
+        self.bids.trim(depth)
+        self.asks.trim(depth)
+        return True
+
+    def _on_event(self, data):
+        if not isinstance(data, dict) or "U" not in data or "u" not in data:
+            return
+        gap = False
+        with self._lock:
+            if not self._running:
+                return
+            if not self.synced:
+                self._buffer.append(data)
+                if len(self._buffer) > MAX_BUFFERED_EVENTS:
+                    del self._buffer[0]
+                return
+            if self._apply(data):
+                self.version += 1
+            else:
+                gap = True
+        if gap:
+            self._resync()
+
+    def _resync(self):
+        with self._lock:
+            self.synced = False
+            self._buffer.clear()
+            self.resyncs += 1
+        self._request_snapshot()
@@ -0,0 +1,143 @@
+import threading
+import time
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+DEFAULT_BAN_SECONDS = 60
+
+
+class RateGovernor:
+    """Token bucket over Binance request weight.
+
+    Tokens refill continuously at ``capacity`` per minute. Callers block in
+    ``acquire`` until their endpoint's weight is available; low-priority
+    callers also wait while higher-priority callers are queued or the bucket
+    is below the reserve, so background work yields to visible panels.
+
+    Binance counts weight per fixed wall-clock window, so the weight used in
+    the current window (the larger of our own count and the server's
+    ``X-MBX-USED-WEIGHT-1M``) also caps what the bucket may spend.
+    """
+
+    def __init__(self, capacity, low_priority_reserve=0.5, window=60.0):
+        self.capacity = float(capacity)
+        self.reserve = self.capacity * low_priority_reserve
+        self.window = window
+        self.rate = self.capacity / window
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._blocked_until = 0.0
+        self._server_used = 0
+        self._server_window = self._window_index()
+        self._waiting = {PRIORITY_HIGH: 0, PRIORITY_NORMAL: 0, PRIORITY_LOW: 0}
+        self._cond = threading.Condition()
+        self.delayed = 0
+
+    def _refill(self, now):
+        elapsed = now - self._stamp
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._stamp = now
+
+    def _window_index(self):
+        return int(time.time() // self.window)
+
+    def _available(self):
+        """Tokens usable now: the bucket, capped by the server window's room."""
+        index = self._window_index()
+        if index != self._server_window:
+            self._server_window = index
+            self._server_used = 0
+        return min(self._tokens, max(0.0, self.capacity - self._server_used))
+
+    def _can_proceed(self, weight, priority, now):
+        if now < self._blocked_until:
+            return False
+        if any(count for level, count in self._waiting.items() if level < priority):
+            return False
+        needed = weight + (self.reserve if priority >= PRIORITY_LOW else 0)
+        return self._available() >= min(needed, self.capacity)
+
+    def _take(self, weight):
+        self._tokens -= weight
+        self._server_used += weight
+
+    def _wait_time(self, weight, now):
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens >= weight:
+            # The bucket has tokens; the server window is what is full
+            return max(0.05, (self._server_window + 1) * self.window - time.time())
+        return max(0.05, (weight - self._tokens) / self.rate)
+
+    def acquire(self, weight, priority=PRIORITY_NORMAL):
+        weight = min(float(weight), self.capacity)
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            if self._can_proceed(weight, priority, now):
+                self._take(weight)
+                return
+            self.delayed += 1
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    if self._can_proceed(weight, priority, now):
+                        self._take(weight)
+                        return
+                    self._cond.wait(min(self._wait_time(weight, now), 1.0))
+            finally:
+                self._waiting[priority] -= 1
+                self._cond.notify_all()
+
+    def observe(self, headers):
+        """Sync the bucket with the server's X-MBX-USED-WEIGHT-1M header."""
+        used = None
+        for name in ("X-MBX-USED-WEIGHT-1M", "X-MBX-USED-WEIGHT"):
+            value = headers.get(name)
+            if value is not None:
+                try:
+                    used = int(value)
+                except (TypeError, ValueError):
+                    used = None
+                break
+        if used is None:
+            return
+        with self._cond:
+            self._refill(time.monotonic())
+            self._available()
+            # Our count also covers calls still in flight, so keep the larger
+            self._server_used = max(self._server_used, used)
+
+    def penalize(self, status_code, retry_after=None):
+        """Stop all calls after a 429 (rate limited) or 418 (IP ban)."""
+        try:
+            seconds = float(retry_after)
+        except (TypeError, ValueError):
+            seconds = DEFAULT_BAN_SECONDS
+        with self._cond:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._cond.notify_all()
+        print(f"Binance returned {status_code}, pausing REST calls for {seconds:.0f}s")
+
+    def status(self):
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            available = self._available()
+            used = self.capacity - available
+            return {
+                "capacity": self.capacity,
+                "available": available,
+                "used": used,
+                "used_fraction": used / self.capacity if self.capacity else 0.0,
+                "server_used": self._server_used,
+                "waiting": dict(self._waiting),
+                "delayed": self.delayed,
+                "blocked_for": max(0.0, self._blocked_until - now),
+            }
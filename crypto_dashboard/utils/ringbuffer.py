@@ -0,0 +1,68 @@
+import numpy as np
+
+
+class RingBuffer:
+    """Fixed-capacity float buffer with zero-copy, oldest-first views.
+
+    Every value is written twice, at ``i`` and ``i + capacity``, so the
+    newest ``len(self)`` values are always one contiguous slice of the
+    backing array and ``view()`` never copies or wraps.
+    """
+
+    __slots__ = ("capacity", "_data", "_next", "_size")
+
+    def __init__(self, capacity, values=None):
+        self.capacity = capacity
+        self._data = np.zeros(capacity * 2)
+        self._next = 0
+        self._size = 0
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        i = self._next
+        self._data[i] = self._data[i + self.capacity] = value
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=float)[-self.capacity:]
+        count = len(values)
+        if not count:
+            return
+        cap = self.capacity
+        idx = (self._next + np.arange(count)) % cap
+        self._data[idx] = values
+        self._data[idx + cap] = values
+        self._next = (self._next + count) % cap
+        self._size = min(cap, self._size + count)
+
+    def view(self):
+        """Read-only oldest-first view; valid until the next write."""
+        end = self._next + self.capacity
+        out = self._data[end - self._size:end]
+        out.flags.writeable = False
+        return out
+
+    @property
+    def first(self):
+        return self.view()[0]
+
+    @property
+    def last(self):
+        return self._data[self._next + self.capacity - 1]
+
+
+def resample(values, length):
+    """Linearly stretch a short series to ``length`` points, or keep the newest ``length``."""
+    values = np.asarray(values, dtype=float)
+    if len(values) >= length:
+        return values[-length:]
+    if len(values) < 2:
+        return np.full(length, values[0] if len(values) else np.nan)
+    positions = np.linspace(0, len(values) - 1, length)
+    return np.interp(positions, np.arange(len(values)), values)
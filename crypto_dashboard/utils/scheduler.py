@@ -0,0 +1,241 @@
+import os
+import sys
+import time
+import random
+import threading
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from config import (  # type: ignore
+        SCHEDULER_TICK_MS,
+        SCHEDULER_JITTER,
+        SCHEDULER_MAX_BACKOFF_MS,
+    )
+else:
+    from ..config import SCHEDULER_TICK_MS, SCHEDULER_JITTER, SCHEDULER_MAX_BACKOFF_MS
+
+
+class RefreshJob:
+    """One periodic fetch and its timing statistics."""
+
+    def __init__(self, name, interval_ms, fetch, jitter, hidden_interval_ms=None):
+        self.name = name
+        self.interval_ms = interval_ms
+        self.hidden_interval_ms = hidden_interval_ms
+        self.fetch = fetch
+        self.jitter = jitter
+        self.visible = True
+        self.in_flight = False
+        self.triggered = False
+        self.next_due = time.monotonic()
+        self.started_at = 0.0
+        self.finished_at = None
+        self.consecutive_failures = 0
+        self.runs = 0
+        self.failures = 0
+        self.overruns = 0
+        self.last_ms = 0.0
+        self.avg_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def paused(self):
+        return not self.visible and self.hidden_interval_ms is None
+
+    def current_interval_ms(self):
+        return self.interval_ms if self.visible else self.hidden_interval_ms
+
+    def is_stale(self, now):
+        """True if the data is older than the visible interval allows."""
+        if self.finished_at is None:
+            return True
+        return now - self.finished_at >= self.interval_ms / 1000
+
+    def stats(self):
+        return {
+            "interval_ms": self.interval_ms,
+            "visible": self.visible,
+            "paused": self.paused,
+            "in_flight": self.in_flight,
+            "runs": self.runs,
+            "failures": self.failures,
+            "overruns": self.overruns,
+            "last_ms": round(self.last_ms, 1),
+            "avg_ms": round(self.avg_ms, 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class RefreshScheduler:
+    """Owns every periodic REST refresh in the app.
+
+    A single ``after`` tick on the Tk thread starts jobs that are due. Each
+    job has at most one fetch in flight; a job that comes due while its
+    previous fetch is still running counts an overrun instead of stacking
+    another request. Intervals carry random jitter so panels drift apart,
+    and failures back off exponentially up to SCHEDULER_MAX_BACKOFF_MS.
+
+    Panels report whether they are on screen with ``set_visible``. A hidden
+    job runs every ``hidden_interval_ms`` as a keepalive, or not at all when
+    that is None; when it is shown again with stale data it runs right away
+    to catch up.
+
+    See ``add`` for what a job's ``fetch`` may return.
+    """
+
+    def __init__(self, tick_ms=SCHEDULER_TICK_MS):
+        self.tick_ms = tick_ms
+        self._jobs = {}
+        self._hidden = set()
+        self._lock = threading.Lock()
+        self._widget = None
+        self._tick_job = None
+
+    def attach(self, widget):
+        self._widget = widget
+        if self._tick_job is None:
+            self._tick_job = widget.after(self.tick_ms, self._tick)
+
+    def stop(self):
+        if self._widget is not None and self._tick_job is not None:
+            try:
+                self._widget.after_cancel(self._tick_job)
+            except Exception:
+                pass
+        self._tick_job = None
+        self._widget = None
+        with self._lock:
+            self._jobs.clear()
+
+    def add(self, name, interval_ms, fetch, hidden_interval_ms=None, jitter=SCHEDULER_JITTER):
+        """Register (or replace) a job; a visible job first runs on the next tick.
+
+        ``fetch`` may return a future (as ``AsyncRestClient.run``/``submit``
+        do); the job completes when it resolves. An exception or a None
+        result counts as a failure and backs the job off, so a fetch whose
+        call came back empty (no tickers, no klines) should resolve to None.
+        Any other return completes the job at once.
+        """
+        job = RefreshJob(name, interval_ms, fetch, jitter, hidden_interval_ms)
+        with self._lock:
+            job.visible = name not in self._hidden
+            if not job.visible and hidden_interval_ms is not None:
+                job.next_due += hidden_interval_ms / 1000
+            self._jobs[name] = job
+        return job
+
+    def remove(self, name):
+        with self._lock:
+            self._jobs.pop(name, None)
+
+    def set_visible(self, name, visible):
+        """Record whether ``name`` is on screen; may be called before ``add``."""
+        now = time.monotonic()
+        with self._lock:
+            if visible:
+                self._hidden.discard(name)
+            else:
+                self._hidden.add(name)
+            job = self._jobs.get(name)
+            if job is None or job.visible == visible:
+                return
+            job.visible = visible
+            if visible:
+                if job.is_stale(now):
+                    job.triggered = True
+                    if not job.in_flight:
+                        job.next_due = now
+            elif not job.paused and not job.in_flight:
+                since = job.finished_at if job.finished_at is not None else now
+                job.next_due = since + job.hidden_interval_ms / 1000
+
+    def trigger(self, name):
+        """Run ``name`` on the next tick, or right after its current fetch."""
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None:
+                return
+            job.triggered = True
+            if not job.in_flight:
+                job.next_due = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            return {name: job.stats() for name, job in self._jobs.items()}
+
+    def _tick(self):
+        self._tick_job = None
+        now = time.monotonic()
+        with self._lock:
+            due = []
+            for job in self._jobs.values():
+                if now < job.next_due or (job.paused and not job.triggered):
+                    continue
+                if job.in_flight:
+                    job.overruns += 1
+                    job.next_due = now + job.current_interval_ms() / 1000
+                    continue
+                job.in_flight = True
+                job.triggered = False
+                job.started_at = now
+                due.append(job)
+        for job in due:
+            self._start(job)
+        if self._widget is not None:
+            self._tick_job = self._widget.after(self.tick_ms, self._tick)
+
+    def _start(self, job):
+        try:
+            result = job.fetch()
+        except Exception as e:
+            print(f"Refresh job {job.name} failed: {e}")
+            self._finish(job, False)
+            return
+        if hasattr(result, "add_done_callback"):
+            result.add_done_callback(lambda future: self._finish_future(job, future))
+        else:
+            self._finish(job, True)
+
+    def _finish_future(self, job, future):
+        ok = not future.cancelled() and future.exception() is None
+        self._finish(job, ok and future.result() is not None)
+
+    def _finish(self, job, ok):
+        """Record the outcome and plan the next run; may run on any thread."""
+        now = time.monotonic()
+        elapsed_ms = (now - job.started_at) * 1000
+        with self._lock:
+            job.in_flight = False
+            job.finished_at = now
+            job.runs += 1
+            job.last_ms = elapsed_ms
+            job.max_ms = max(job.max_ms, elapsed_ms)
+            job.avg_ms = elapsed_ms if job.runs == 1 else job.avg_ms * 0.8 + elapsed_ms * 0.2
+            # A paused job keeps its visible interval so it is not stale early
+            interval_ms = job.current_interval_ms() or job.interval_ms
+            if ok:
+                job.consecutive_failures = 0
+                delay_ms = interval_ms * (1 + random.uniform(-job.jitter, job.jitter))
+            else:
+                job.failures += 1
+                job.consecutive_failures += 1
+                delay_ms = min(interval_ms * 2 ** job.consecutive_failures,
+                               max(interval_ms, SCHEDULER_MAX_BACKOFF_MS))
+            job.next_due = now if job.triggered else now + delay_ms / 1000
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Shared RefreshScheduler used by every panel."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RefreshScheduler()
+    return _scheduler
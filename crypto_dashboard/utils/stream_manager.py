@@ -0,0 +1,175 @@
+import os
+import sys
+import json
+import time
+import threading
+
+import websocket
+
+if __package__ is None or __package__ == "":
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    parent_dir = os.path.dirname(current_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+    from config import STREAM_BASE_URL, STREAM_RECONNECT_DELAY  # type: ignore
+else:
+    from ..config import STREAM_BASE_URL, STREAM_RECONNECT_DELAY
+
+
+class StreamManager:
+    """One Binance combined-stream socket shared by every panel.
+
+    Streams such as ``btcusdt@ticker`` (lower-case symbol, case-sensitive
+    stream type) are added and removed on the live
+    connection with SUBSCRIBE/UNSUBSCRIBE; each ``{"stream", "data"}`` frame
+    is routed to the callbacks registered for that stream name. Callbacks run
+    on the socket thread and receive the decoded ``data`` payload.
+    """
+
+    def __init__(self, base_url=STREAM_BASE_URL, reconnect_delay=STREAM_RECONNECT_DELAY):
+        self.base_url = base_url.rstrip("/")
+        self.reconnect_delay = reconnect_delay
+        self._callbacks = {}
+        self._lock = threading.RLock()
+        self._ws = None
+        self._thread = None
+        self._running = False
+        self._connected = False
+        self._socket_streams = set()
+        self._next_id = 1
+        self.messages_received = 0
+
+    def subscribe(self, stream, callback):
+        with self._lock:
+            callbacks = self._callbacks.setdefault(stream, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+            is_new = stream not in self._socket_streams
+            if is_new and self._connected:
+                self._send("SUBSCRIBE", [stream])
+                self._socket_streams.add(stream)
+        self._ensure_running()
+
+    def unsubscribe(self, stream, callback=None):
+        with self._lock:
+            callbacks = self._callbacks.get(stream)
+            if callbacks is None:
+                return
+            if callback is not None and callback in callbacks:
+                callbacks.remove(callback)
+            if callback is None or not callbacks:
+                self._callbacks.pop(stream, None)
+                if stream in self._socket_streams and self._connected:
+                    self._send("UNSUBSCRIBE", [stream])
+                    self._socket_streams.discard(stream)
+
+    def streams(self):
+        with self._lock:
+            return sorted(self._callbacks)
+
+    def stop(self):
+        with self._lock:
+            self._running = False
+            ws, self._ws = self._ws, None
+        if ws is not None:
+            try:
+                ws.close()
+            except Exception:
+                pass
+
+    def _ensure_running(self):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(
+                target=self._run, name="binance-streams", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._running:
+                    return
+                streams = sorted(self._callbacks)
+                url = self.base_url + "/stream"
+                if streams:
+                    url += "?streams=" + "/".join(streams)
+                self._socket_streams = set(streams)
+                self._ws = websocket.WebSocketApp(
+                    url,
+                    on_open=self._on_open,
+                    on_message=self._on_message,
+                    on_error=lambda ws, err: print("stream error:", err),
+                    on_close=self._on_close,
+                )
+                ws = self._ws
+            ws.run_forever(ping_interval=60, ping_timeout=10)
+            with self._lock:
+                self._connected = False
+                if not self._running:
+                    return
+            time.sleep(self.reconnect_delay)
+
+    def _on_open(self, ws):
+        print("combined stream connected")
+        with self._lock:
+            self._connected = True
+            wanted = set(self._callbacks)
+            added = sorted(wanted - self._socket_streams)
+            removed = sorted(self._socket_streams - wanted)
+            if added:
+                self._send("SUBSCRIBE", added)
+            if removed:
+                self._send("UNSUBSCRIBE", removed)
+            self._socket_streams = wanted
+
+    def _on_close(self, ws, status, msg):
+        with self._lock:
+            self._connected = False
+        print("combined stream closed")
+
+    def _send(self, method, params):
+        ws = self._ws
+        if ws is None:
+            return
+        request_id = self._next_id
+        self._next_id += 1
+        try:
+            ws.send(json.dumps({"method": method, "params": params, "id": request_id}))
+        except Exception as e:
+            print(f"stream {method} failed: {e}")
+
+    def _on_message(self, ws, msg):
+        try:
+            frame = json.loads(msg)
+        except ValueError:
+            return
+        stream = frame.get("stream") if isinstance(frame, dict) else None
+        if stream is None:
+            if isinstance(frame, dict) and frame.get("error"):
+                print("stream request error:", frame["error"])
+            return
+        self.messages_received += 1
+        with self._lock:
+            callbacks = list(self._callbacks.get(stream, ()))
+        payload = frame.get("data")
+        for callback in callbacks:
+            try:
+                callback(payload)
+            except Exception as e:
+                print(f"{stream} handler error: {e}")
+
+
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_stream_manager():
+    """Shared StreamManager used by every streaming panel."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = StreamManager()
+    return _manager
@@ -0,0 +1,267 @@
+"""Batch indicators against naive loop references and the *State classes."""
+import math
+
+import numpy as np
+import pytest
+
+from crypto_dashboard.utils import indicators
+from crypto_dashboard.utils.indicators import (
+    ATRState,
+    BollingerState,
+    EMAState,
+    IndicatorEngine,
+    MACDState,
+    RSIState,
+    SMAState,
+    VWAPState,
+    WilderState,
+)
+
+RTOL = 1e-9
+
+
+def assert_series(actual, expected, rtol=RTOL, atol=1e-9):
+    actual = np.asarray(actual, dtype=float)
+    expected = np.asarray(expected, dtype=float)
+    assert actual.shape == expected.shape
+    assert np.array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=rtol, atol=atol, equal_nan=True)
+
+
+def make_klines(n, seed=7, start_price=30000.0, bar_ms=3_600_000):
+    """(n, 6) kline columns from a random walk: open time, OHLC, volume."""
+    rng = np.random.default_rng(seed)
+    closes = start_price * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    opens = np.r_[start_price, closes[:-1]]
+    spread = np.abs(rng.normal(0, 0.005, n)) * closes
+    highs = np.maximum(opens, closes) + spread
+    lows = np.minimum(opens, closes) - spread
+    volumes = rng.uniform(0.5, 50.0, n)
+    # Some zero-volume bars exercise the empty-session branch of VWAP
+    volumes[rng.random(n) < 0.02] = 0.0
+    open_times = 1_700_000_000_000 + np.arange(n) * bar_ms
+    return np.column_stack([open_times, opens, highs, lows, closes, volumes])
+
+
+@pytest.fixture(scope="module")
+def klines():
+    return make_klines(600)
+
+
+# -- naive references ----------------------------------------------------
+def ref_sma(values, window):
+    return [math.nan if i + 1 < window else sum(values[i + 1 - window:i + 1]) / window
+            for i in range(len(values))]
+
+
+def ref_ewm(values, alpha, initial):
+    out, prev = [], initial
+    for value in values:
+        prev = prev + alpha * (value - prev)
+        out.append(prev)
+    return out
+
+
+def ref_wilder(values, period):
+    out, prev = [], None
+    for i, value in enumerate(values):
+        if i + 1 < period:
+            out.append(math.nan)
+            continue
+        if prev is None:
+            prev = sum(values[:period]) / period
+        else:
+            prev = (prev * (period - 1) + value) / period
+        out.append(prev)
+    return out
+
+
+def ref_rsi(closes, period):
+    deltas = [b - a for a, b in zip(closes, closes[1:])]
+    gains = ref_wilder([max(d, 0.0) for d in deltas], period)
+    losses = ref_wilder([max(-d, 0.0) for d in deltas], period)
+    out = [math.nan]
+    for gain, loss in zip(gains, losses):
+        if math.isnan(gain):
+            out.append(math.nan)
+        elif loss == 0.0:
+            out.append(100.0)
+        else:
+            out.append(100.0 - 100.0 / (1.0 + gain / loss))
+    return out
+
+
+def ref_bollinger(closes, window, num_std):
+    mid, upper, lower = [], [], []
+    for i in range(len(closes)):
+        if i + 1 < window:
+            mid.append(math.nan)
+            upper.append(math.nan)
+            lower.append(math.nan)
+            continue
+        chunk = closes[i + 1 - window:i + 1]
+        mean = sum(chunk) / window
+        std = math.sqrt(sum((c - mean) ** 2 for c in chunk) / window)
+        mid.append(mean)
+        upper.append(mean + num_std * std)
+        lower.append(mean - num_std * std)
+    return mid, upper, lower
+
+
+def ref_true_range(highs, lows, closes):
+    out = []
+    for i, (high, low) in enumerate(zip(highs, lows)):
+        tr = high - low
+        if i:
+            tr = max(tr, abs(high - closes[i - 1]), abs(low - closes[i - 1]))
+        out.append(tr)
+    return out
+
+
+def ref_vwap(highs, lows, closes, volumes, open_times=None, session_ms=indicators.DAY_MS):
+    out, pv, vol, session = [], 0.0, 0.0, None
+    for i in range(len(highs)):
+        if open_times is not None and open_times[i] // session_ms != session:
+            session = open_times[i] // session_ms
+            pv = vol = 0.0
+        pv += (highs[i] + lows[i] + closes[i]) / 3.0 * volumes[i]
+        vol += volumes[i]
+        out.append(pv / vol if vol > 0 else math.nan)
+    return out
+
+
+def feed(state, *columns):
+    return [state.update(*row) for row in zip(*(c.tolist() for c in columns))]
+
+
+# -- batch vs reference vs state -----------------------------------------
+@pytest.mark.parametrize("window", [1, 5, 20, 200])
+def test_sma(klines, window):
+    closes = klines[:, 4]
+    expected = ref_sma(closes.tolist(), window)
+    assert_series(indicators.sma(closes, window), expected)
+    assert_series(feed(SMAState(window), closes), expected)
+
+
+def test_sma_short_series_returns_values():
+    assert_series(indicators.sma([1.0, 2.0], 5), [1.0, 2.0])
+
+
+@pytest.mark.parametrize("span", [2, 9, 26, 200])
+def test_ema(klines, span):
+    closes = klines[:, 4]
+    expected = ref_ewm(closes.tolist(), 2.0 / (span + 1), closes[0])
+    assert_series(indicators.ema(closes, span), expected)
+    assert_series(feed(EMAState(span), closes), expected)
+
+
+@pytest.mark.parametrize("alpha", [1.0, 0.9, 0.5, 0.1, 0.01, 1e-3, 1e-5])
+def test_ewm_block_sizes(alpha):
+    # Small alphas hit the 4096 block cap, large ones one-element blocks;
+    # 10k values spans several blocks either way.
+    values = make_klines(10_000, seed=3)[:, 4]
+    expected = ref_ewm(values.tolist(), alpha, 25_000.0)
+    assert_series(indicators._ewm(values, alpha, 25_000.0), expected, rtol=1e-8)
+    assert_series(feed(EMAState(alpha=alpha), np.r_[25_000.0, values])[1:], expected, rtol=1e-8)
+
+
+def test_ewm_block_length_follows_precision(monkeypatch):
+    values = make_klines(2_000, seed=5)[:, 4]
+    expected = indicators._ewm(values, 0.05, values[0])
+    monkeypatch.setattr(indicators, "EWM_PRECISION", 1e-2)
+    assert_series(indicators._ewm(values, 0.05, values[0]), expected)
+
+
+def test_ema_empty():
+    assert indicators.ema([], 9).shape == (0,)
+
+
+@pytest.mark.parametrize("period", [1, 14, 50])
+def test_wilder(klines, period):
+    closes = klines[:, 4]
+    expected = ref_wilder(closes.tolist(), period)
+    assert_series(indicators._wilder(closes, period), expected)
+    assert_series(feed(WilderState(period), closes), expected)
+
+
+@pytest.mark.parametrize("period", [2, 14])
+def test_rsi(klines, period):
+    closes = klines[:, 4]
+    expected = ref_rsi(closes.tolist(), period)
+    assert_series(indicators.rsi(closes, period), expected)
+    assert_series(feed(RSIState(period), closes), expected)
+
+
+def test_rsi_flat_series_is_100():
+    closes = np.r_[np.full(10, 5.0), np.arange(6.0, 26.0)]
+    out = indicators.rsi(closes, 5)
+    assert np.all(out[5:] == 100.0)
+
+
+def test_macd(klines):
+    closes = klines[:, 4].tolist()
+    fast = ref_ewm(closes, 2.0 / 13, closes[0])
+    slow = ref_ewm(closes, 2.0 / 27, closes[0])
+    line = [f - s for f, s in zip(fast, slow)]
+    signal = ref_ewm(line, 2.0 / 10, line[0])
+    hist = [a - b for a, b in zip(line, signal)]
+    batch = indicators.macd(klines[:, 4])
+    state = list(zip(*feed(MACDState(), klines[:, 4])))
+    for got, rolling, expected in zip(batch, state, (line, signal, hist)):
+        assert_series(got, expected, atol=1e-7)
+        assert_series(rolling, expected, atol=1e-7)
+
+
+@pytest.mark.parametrize("window,num_std", [(20, 2.0), (5, 1.5)])
+def test_bollinger(klines, window, num_std):
+    closes = klines[:, 4]
+    expected = ref_bollinger(closes.tolist(), window, num_std)
+    batch = indicators.bollinger(closes, window, num_std)
+    state = list(zip(*feed(BollingerState(window, num_std), closes)))
+    for got, rolling, want in zip(batch, state, expected):
+        assert_series(got, want)
+        # The running sum of squares loses a few digits to cancellation
+        assert_series(rolling, want, rtol=1e-7)
+
+
+def test_atr(klines):
+    highs, lows, closes = klines[:, 2], klines[:, 3], klines[:, 4]
+    tr = ref_true_range(highs.tolist(), lows.tolist(), closes.tolist())
+    assert_series(indicators.true_range(highs, lows, closes), tr)
+    expected = ref_wilder(tr, 14)
+    assert_series(indicators.atr(highs, lows, closes, 14), expected)
+    assert_series(feed(ATRState(14), highs, lows, closes), expected)
+
+
+@pytest.mark.parametrize("sessions", [False, True])
+def test_vwap(klines, sessions):
+    times, highs, lows, closes, volumes = (klines[:, i] for i in (0, 2, 3, 4, 5))
+    open_times = times.astype(np.int64) if sessions else None
+    expected = ref_vwap(highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist(),
+                        open_times.tolist() if sessions else None)
+    assert_series(indicators.vwap(highs, lows, closes, volumes, open_times), expected)
+    state = VWAPState()
+    rolling = [state.update(h, l, c, v, t if sessions else None)
+               for t, h, l, c, v in zip(times.tolist(), highs.tolist(), lows.tolist(),
+                                        closes.tolist(), volumes.tolist())]
+    assert_series(rolling, expected)
+
+
+def test_engine_update_matches_compute(klines):
+    engine = IndicatorEngine()
+    batch = engine.compute(klines[:400])
+    seeded = engine.seed(klines[:300])
+    for key, values in batch.items():
+        assert_series([seeded[key]], [values[299]], rtol=1e-7, atol=1e-7)
+    for i, row in enumerate(klines[300:400].tolist(), start=300):
+        latest = engine.update(row)
+        for key, values in batch.items():
+            assert_series([latest[key]], [values[i]], rtol=1e-7, atol=1e-7)
+
+
+def test_engine_short_series_warms_up():
+    engine = IndicatorEngine()
+    out = engine.compute(make_klines(5))
+    assert np.isnan(out["sma"]).all()
+    assert np.isnan(out["bb_mid"]).all()
+    assert not np.isnan(out["ema"]).any()
@@ -0,0 +1,118 @@
+"""KlineStore incremental loads, hole fills and remembered empty ranges."""
+import time
+
+import numpy as np
+import pytest
+
+from crypto_dashboard.utils import kline_store
+from crypto_dashboard.utils.kline_store import KlineStore
+
+STEP = 60_000
+
+
+class FakeExchange:
+    """Serves 1m klines for the open times it has, newest-last like Binance."""
+
+    def __init__(self, count, missing=()):
+        now = int(time.time() * 1000) // STEP * STEP
+        missing = set(missing)
+        self.times = [now - i * STEP for i in range(count) if i not in missing][::-1]
+        self.calls = []
+
+    def get_klines(self, symbol, interval="1h", limit=50, priority=None,
+                   start_time=None, end_time=None):
+        self.calls.append({"limit": limit, "start_time": start_time, "end_time": end_time})
+        times = [t for t in self.times
+                 if (start_time is None or t >= start_time)
+                 and (end_time is None or t <= end_time)]
+        times = times[:limit] if start_time is not None else times[-limit:]
+        return [[t, 1.0, 2.0, 0.5, 1.5, 10.0] for t in times]
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    def make(count, missing=()):
+        fake = FakeExchange(count, missing)
+        monkeypatch.setattr(kline_store, "get_klines", fake.get_klines)
+        return fake
+    return make
+
+
+def open_times(rows):
+    return [int(t) for t in rows[:, kline_store.OPEN_TIME]]
+
+
+def test_interior_hole_is_filled_with_a_ranged_request(exchange):
+    fake = exchange(200)
+    store = KlineStore()
+    store.fetch("btcusdt", "1m", 100)
+    series = store.series("btcusdt", "1m")
+    hole = series.rows[40:45, kline_store.OPEN_TIME].copy()
+    keep = ~np.isin(series.rows[:, kline_store.OPEN_TIME], hole)
+    series.rows = series.rows[keep]
+    fake.calls.clear()
+
+    rows = store.fetch("btcusdt", "1m", 100)
+
+    assert open_times(rows) == fake.times[-100:]
+    head, fill = fake.calls
+    assert head["start_time"] is not None and head["end_time"] is None
+    assert fill == {"limit": 5, "start_time": hole[0], "end_time": hole[-1]}
+
+
+def test_exchange_empty_range_is_not_requested_again(exchange):
+    # The exchange itself lacks ten candles, e.g. a trading halt
+    fake = exchange(200, missing=range(30, 40))
+    store = KlineStore()
+    store.fetch("btcusdt", "1m", 100)
+    # The window, then one fill for the hole that comes back empty
+    assert [call["end_time"] is not None for call in fake.calls] == [False, True]
+    fake.calls.clear()
+
+    rows = store.fetch("btcusdt", "1m", 100)
+    assert len(fake.calls) == 1
+    assert len(rows) == 100
+    assert open_times(rows) == fake.times[-100:]
+
+
+def test_short_history_is_loaded_once(exchange):
+    # A new listing with fewer candles than the window asks for
+    fake = exchange(30)
+    store = KlineStore()
+    rows = store.fetch("newusdt", "1m", 100)
+    assert len(rows) == 30
+    fake.calls.clear()
+
+    store.fetch("newusdt", "1m", 100)
+    assert len(fake.calls) == 1
+    assert fake.calls[0]["start_time"] == fake.times[-1]
+
+
+def test_missing_older_history_reloads_the_window(exchange):
+    fake = exchange(200)
+    store = KlineStore()
+    store.update("btcusdt", "1m", [[fake.times[-1], 1.0, 2.0, 0.5, 1.5, 10.0]])
+
+    rows = store.fetch("btcusdt", "1m", 100)
+
+    assert open_times(rows) == fake.times[-100:]
+    assert [call["end_time"] for call in fake.calls] == [None, None]
+    assert fake.calls[-1]["limit"] == 100
+
+
+def test_failed_fill_is_retried(monkeypatch, exchange):
+    fake = exchange(200)
+    store = KlineStore()
+    store.fetch("btcusdt", "1m", 100)
+    series = store.series("btcusdt", "1m")
+    series.rows = np.delete(series.rows, [50], axis=0)
+    serve = fake.get_klines
+    monkeypatch.setattr(kline_store, "get_klines",
+                        lambda *args, **kwargs: None if kwargs.get("end_time") else
+                        serve(*args, **kwargs))
+
+    store.fetch("btcusdt", "1m", 100)
+    assert series.empty == []
+    monkeypatch.setattr(kline_store, "get_klines", serve)
+    rows = store.fetch("btcusdt", "1m", 100)
+    assert open_times(rows) == fake.times[-100:]
@@ -0,0 +1,146 @@
+"""LocalOrderBook sync, gap resync and snapshot retry with fake I/O."""
+import random
+import time
+
+import pytest
+
+from crypto_dashboard.utils import order_book
+from crypto_dashboard.utils.async_rest import AsyncRestClient
+from crypto_dashboard.utils.order_book import BookSide, LocalOrderBook
+
+
+class InlineClient:
+    """Runs REST work synchronously; delayed calls use a real client's loop."""
+
+    def __init__(self):
+        self.loop_client = AsyncRestClient(max_workers=1)
+
+    def run(self, fn, *args, callback=None, **kwargs):
+        result = fn(*args, **kwargs)
+        if callback is not None:
+            callback(result)
+
+    def call_later(self, delay, fn, *args, **kwargs):
+        return self.loop_client.call_later(delay, fn, *args, **kwargs)
+
+
+class FakeStreams:
+    def subscribe(self, stream, callback):
+        self.callback = callback
+
+    def unsubscribe(self, stream, callback=None):
+        pass
+
+
+def event(first, last, bids=(), asks=()):
+    return {"U": first, "u": last, "b": list(bids), "a": list(asks)}
+
+
+def snapshot(last_id, bids=(("100", "1"),), asks=(("101", "1"),)):
+    return {"lastUpdateId": last_id, "bids": list(bids), "asks": list(asks)}
+
+
+@pytest.fixture
+def make_book(monkeypatch):
+    monkeypatch.setattr(order_book, "SNAPSHOT_RETRY_MIN_S", 0.01)
+    monkeypatch.setattr(order_book, "SNAPSHOT_RETRY_MAX_S", 0.04)
+    books = []
+
+    def make(responses):
+        calls = []
+
+        def fake_call(path, params=None, **kwargs):
+            calls.append(params)
+            return responses.pop(0) if responses else None
+
+        monkeypatch.setattr(order_book, "safe_api_call", fake_call)
+        book = LocalOrderBook("btcusdt")
+        book._client = InlineClient()
+        book._streams = FakeStreams()
+        books.append(book)
+        return book, calls
+
+    yield make
+    for book in books:
+        book.stop()
+        book._client.loop_client.stop()
+
+
+def test_buffered_events_apply_after_snapshot(make_book):
+    book, _calls = make_book([snapshot(10)])
+    # Events arrive before the snapshot is requested
+    book._running = True
+    for first in (9, 11, 12):
+        book._on_event(event(first, first, bids=[("100", str(first))]))
+    book._request_snapshot()
+    assert book.synced
+    assert book.last_update_id == 12
+    assert book.top(1)[0] == [(100.0, 12.0)]
+
+
+def test_gap_triggers_resync(make_book):
+    book, calls = make_book([snapshot(10), snapshot(20)])
+    book.start()
+    assert book.synced and len(calls) == 1
+    book._on_event(event(11, 11))
+    book._on_event(event(15, 16))  # 12-14 are missing
+    assert book.resyncs == 1
+    assert len(calls) == 2
+
+
+def test_failed_snapshot_is_retried_with_backoff(make_book):
+    book, calls = make_book([None, {"code": -1121}, snapshot(10)])
+    book.start()
+    assert not book.synced
+    for first in range(11, 31):
+        book._on_event(event(first, first))
+    deadline = time.monotonic() + 2
+    while not book.synced and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 3
+    assert book.snapshot_failures == 2
+    assert book.synced
+    assert book.last_update_id == 30
+
+
+def test_stop_cancels_pending_retry(make_book):
+    book, calls = make_book([None])
+    book.start()
+    book.stop()
+    time.sleep(0.05)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("descending", [True, False])
+def test_book_side_matches_sorted_reference(descending):
+    rng = random.Random(4)
+    side = BookSide(descending)
+    reference = {}
+    for step in range(5000):
+        price = round(100 + rng.randint(-300, 300) * 0.01, 2)
+        qty = 0.0 if rng.random() < 0.3 else rng.uniform(0.1, 5)
+        side.set(price, qty)
+        if qty > 0:
+            reference[price] = qty
+        else:
+            reference.pop(price, None)
+        if step % 7 == 0:
+            n = rng.choice((1, 10, 20, 50))
+            best = sorted(reference, reverse=descending)[:n]
+            assert side.top(n) == [(price, reference[price]) for price in best]
+    assert len(side) == len(reference)
+
+
+def test_book_side_trim_keeps_best_levels():
+    side = BookSide(descending=False)
+    for tick in range(100):
+        side.set(100 + tick, 1.0)
+    side.trim(90)
+    assert len(side) == 100  # within the slack, nothing dropped yet
+    for tick in range(100, 120):
+        side.set(100 + tick, 1.0)
+    side.trim(90)
+    assert len(side) == 90
+    assert side.top(90)[-1] == (189, 1.0)
+    side.set(50, 2.0)
+    assert side.top(2) == [(50, 2.0), (100, 1.0)]
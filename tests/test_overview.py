@@ -0,0 +1,120 @@
+"""OverviewPanel behaviour that can be checked without a display."""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from crypto_dashboard.components import overview
+from crypto_dashboard.components.overview import OverviewPanel
+from crypto_dashboard.utils.market_data import MarketDataStore
+
+
+class FakeWidget:
+    """Records the options a Tk widget was given; enough for the favorites grid."""
+
+    def __init__(self, parent=None, **options):
+        self.options = dict(options)
+        self.children = []
+        self.destroyed = False
+        if isinstance(parent, FakeWidget):
+            parent.children.append(self)
+
+    def config(self, **options):
+        self.options.update(options)
+
+    configure = config
+
+    def winfo_children(self):
+        return [child for child in self.children if not child.destroyed]
+
+    def destroy(self):
+        self.destroyed = True
+
+    def pack(self, **kwargs):
+        pass
+
+    def grid(self, **kwargs):
+        pass
+
+    def bind(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def panel(monkeypatch):
+    monkeypatch.setattr(overview, "tk", SimpleNamespace(
+        Frame=FakeWidget, Label=FakeWidget, BOTH="both"))
+    market = MarketDataStore()
+    panel = OverviewPanel.__new__(OverviewPanel)
+    panel.symbols = {"BTC": "btcusdt", "ETH": "ethusdt", "SOL": "solusdt"}
+    panel.market = market
+    panel.surface = "#ffffff"
+    panel.favorites_grid = FakeWidget()
+    panel.favorite_cards = {}
+    panel.market_rows = {}
+    panel.sparklines = {}
+    panel.widget_touches = 0
+    panel.user_favorites = ["BTC"]
+    return panel
+
+
+def test_edited_favorites_show_stored_quotes_without_a_tick(panel):
+    panel.market.update("BTC", 30000.0, 1.5)
+    panel.market.update("ETH", 2000.0, -2.0)
+    panel._refresh_favorites_display()
+    assert panel.favorite_cards["BTC"]["price"].options["text"] == "$ 30,000.00"
+
+    # As the editor's Save does: new favorites, cards rebuilt, no new quote
+    panel.user_favorites = ["ETH", "SOL", "BTC"]
+    panel._refresh_favorites_display()
+
+    eth = panel.favorite_cards["ETH"]
+    assert eth["price"].options["text"] == "$ 2,000.00"
+    assert eth["change"].options["text"] == "-2.00%"
+    assert eth["inner"].options["bg"] == "#fee2e2"
+    assert panel.favorite_cards["BTC"]["change"].options["text"] == "+1.50%"
+    # No quote yet: the card keeps its placeholder
+    assert panel.favorite_cards["SOL"]["price"].options["text"] == "$ --"
+    assert len(panel.favorites_grid.winfo_children()) == 3
+
+
+class Var:
+    def __init__(self):
+        self.value = None
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def test_start_draws_cached_chart_before_the_network():
+    events = []
+    rows = np.column_stack([
+        1_700_000_000_000 + np.arange(60) * 3_600_000,
+        np.full(60, 100.0), np.full(60, 101.0), np.full(60, 99.0), np.full(60, 100.5),
+        np.ones(60)])
+    panel = OverviewPanel.__new__(OverviewPanel)
+    panel.is_running = False
+    panel.symbols = {"BTC": "btcusdt"}
+    panel.chart_symbol = "BTC"
+    panel.chart_candles = []
+    panel._chart_candles_symbol = None
+    panel._chart_fetch_inflight = False
+    panel.price_history = {}
+    panel.market = MarketDataStore()
+    panel.kline_store = SimpleNamespace(cached=lambda symbol, interval, limit: rows[-limit:])
+    panel.client = SimpleNamespace(run=lambda *args, **kwargs: events.append("fetch"))
+    panel.scheduler = SimpleNamespace(add=lambda *args, **kwargs: events.append("schedule"))
+    panel.chart_preview = SimpleNamespace(
+        usable_width=lambda: 284,
+        render=lambda candles, labels: events.append(("render", len(candles))),
+        clear=lambda: events.append("clear"))
+    panel.chart_price_var, panel.chart_change_var, panel.chart_title_var = Var(), Var(), Var()
+
+    panel.start()
+
+    assert events[0] == ("render", 40)
+    assert "fetch" in events
+    assert panel.chart_title_var.get() == "BTC Overview"
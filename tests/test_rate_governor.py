@@ -0,0 +1,195 @@
+"""RateGovernor against a local stand-in for the Binance REST API.
+
+The stand-in charges the same endpoint weights as ``endpoint_weight``,
+reports them in ``X-MBX-USED-WEIGHT-1M`` per fixed window, and answers
+429/418 with ``Retry-After`` when asked to or when the window overflows.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+from crypto_dashboard.utils import binance_rest
+from crypto_dashboard.utils.rate_governor import (
+    RateGovernor,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
+)
+
+
+class WeightServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, limit, window=1.0):
+        super().__init__(("127.0.0.1", 0), WeightHandler)
+        self.limit = limit
+        self.window = window
+        self.lock = threading.Lock()
+        self.window_index = int(time.time() // window)
+        self.used = 0
+        self.preset_used = 0
+        self.peak = 0
+        self.requests = []
+        self.rejections = 0
+        self.forced = []  # queued (status, retry_after) answers
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def charge(self, path, params):
+        """Returns (status, used, retry_after) for one request."""
+        with self.lock:
+            self.requests.append(time.monotonic())
+            # Fixed wall-clock windows, as Binance counts them
+            index = int(time.time() // self.window)
+            if index != self.window_index:
+                self.window_index = index
+                self.used = 0
+            if self.forced:
+                status, retry_after = self.forced.pop(0)
+                return status, self.used, retry_after
+            self.used += binance_rest.endpoint_weight(path, params)
+            used = self.used + self.preset_used
+            self.peak = max(self.peak, used)
+            if used > self.limit:
+                self.rejections += 1
+                return 429, used, self.window
+            return 200, used, None
+
+
+class WeightHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        params = dict(parse_qsl(parts.query))
+        status, used, retry_after = self.server.charge(parts.path, params)
+        body = b"[]" if status == 200 else json.dumps({"code": -1003}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-MBX-USED-WEIGHT-1M", str(used))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server(monkeypatch):
+    srv = WeightServer(limit=50)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(binance_rest, "BASE_URL", srv.url)
+    binance_rest.close_session()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+    binance_rest.close_session()
+
+
+def use_governor(monkeypatch, governor):
+    monkeypatch.setattr(binance_rest, "_governor", governor)
+    return governor
+
+
+def test_observe_syncs_bucket_with_server_weight(server, monkeypatch):
+    governor = use_governor(monkeypatch, RateGovernor(1000, window=60.0))
+    server.limit = 1200
+    server.preset_used = 900
+    assert binance_rest.safe_api_call("/api/v3/klines", {"symbol": "BTCUSDT"}) == []
+    status = governor.status()
+    assert status["server_used"] == 902
+    # The server's count, not the local one, decides what is left
+    assert status["available"] == pytest.approx(1000 - 902, abs=1)
+
+
+def test_observe_reads_legacy_header_and_ignores_garbage():
+    governor = RateGovernor(100, window=60.0)
+    governor.observe({"X-MBX-USED-WEIGHT": "30"})
+    assert governor.status()["available"] == pytest.approx(70, abs=0.1)
+    governor.observe({"X-MBX-USED-WEIGHT-1M": "not a number"})
+    assert governor.status()["server_used"] == 30
+
+
+@pytest.mark.parametrize("status_code", [429, 418])
+def test_rate_limit_response_pauses_every_caller(server, monkeypatch, status_code):
+    governor = use_governor(monkeypatch, RateGovernor(1000, window=60.0))
+    server.forced.append((status_code, 0.5))
+    assert binance_rest.safe_api_call("/api/v3/klines", {"symbol": "BTCUSDT"}) is None
+    assert governor.status()["blocked_for"] > 0.3
+
+    # The bucket is emptied too, so even high priority waits out the pause
+    # and then for tokens; refill here is fast enough to keep the test short
+    governor.rate = governor.capacity
+    first = len(server.requests)
+    started = time.monotonic()
+    binance_rest.safe_api_call(
+        "/api/v3/klines", {"symbol": "BTCUSDT"}, priority=PRIORITY_HIGH)
+    assert time.monotonic() - started >= 0.4
+    assert server.requests[first] - server.requests[first - 1] >= 0.4
+
+
+def test_penalize_without_retry_after_uses_default_ban():
+    governor = RateGovernor(100)
+    governor.penalize(429, None)
+    assert governor.status()["blocked_for"] > 50
+
+
+def test_low_priority_keeps_out_of_the_reserve():
+    governor = RateGovernor(100, low_priority_reserve=0.5, window=1.0)
+    governor.acquire(60, PRIORITY_NORMAL)  # 40 left, below the 50 reserve
+    started = time.monotonic()
+    governor.acquire(10, PRIORITY_HIGH)
+    assert time.monotonic() - started < 0.05
+
+    started = time.monotonic()
+    governor.acquire(10, PRIORITY_LOW)
+    # Needs 10 + 50 reserve from 30 tokens at 100/s: about 0.3 s
+    assert time.monotonic() - started >= 0.2
+    assert governor.status()["delayed"] == 1
+
+
+def test_low_priority_queues_behind_waiting_callers():
+    governor = RateGovernor(10, low_priority_reserve=0.0, window=1.0)
+    governor.acquire(10, PRIORITY_NORMAL)
+    order = []
+
+    def take(priority, label):
+        governor.acquire(5, priority)
+        order.append(label)
+
+    low = threading.Thread(target=take, args=(PRIORITY_LOW, "low"))
+    low.start()
+    time.sleep(0.05)
+    normal = threading.Thread(target=take, args=(PRIORITY_NORMAL, "normal"))
+    normal.start()
+    low.join(2)
+    normal.join(2)
+    # The low caller queued first but yields once a normal caller waits
+    assert order == ["normal", "low"]
+
+
+def test_governor_keeps_concurrent_callers_under_server_limit(server, monkeypatch):
+    # Like the app: budget at 80% of the server's limit, synced via headers
+    use_governor(monkeypatch, RateGovernor(server.limit * 0.8, window=server.window))
+
+    def worker():
+        for _ in range(15):
+            binance_rest.safe_api_call("/api/v3/klines", {"symbol": "BTCUSDT"})
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+    assert len(server.requests) == 60
+    assert server.rejections == 0
+    assert server.peak <= server.limit
@@ -0,0 +1,102 @@
+"""RefreshScheduler failure accounting and the panels' empty-result fetches."""
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from crypto_dashboard.components import wallet
+from crypto_dashboard.components.technical import TechnicalPanel
+from crypto_dashboard.components.transactions import TransactionsPanel
+from crypto_dashboard.components.wallet import WalletPanel
+from crypto_dashboard.utils.market_data import MarketDataStore
+from crypto_dashboard.utils.scheduler import RefreshScheduler
+
+
+def resolved(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def run_once(result):
+    scheduler = RefreshScheduler()
+    job = scheduler.add("job", 1000, lambda: result, jitter=0.0)
+    scheduler._tick()
+    return job
+
+
+@pytest.mark.parametrize("result,ok", [
+    (resolved(["BTC"]), True),
+    (resolved(None), False),
+    (resolved(error=RuntimeError("down")), False),
+    ("done", True),
+])
+def test_future_outcome(result, ok):
+    job = run_once(result)
+    assert job.runs == 1
+    assert job.failures == (0 if ok else 1)
+    assert not job.in_flight
+
+
+def test_failures_back_off():
+    scheduler = RefreshScheduler()
+    job = scheduler.add("job", 1000, lambda: resolved(None), jitter=0.0)
+    delays = []
+    for _ in range(3):
+        job.next_due = 0.0
+        scheduler._tick()
+        delays.append(job.next_due - job.finished_at)
+    assert delays == pytest.approx([2.0, 4.0, 8.0])
+
+
+def test_wallet_outage_fails_the_job(monkeypatch):
+    panel = SimpleNamespace(market=MarketDataStore())
+    monkeypatch.setattr(wallet, "get_24hr_tickers", lambda pairs: {})
+    assert WalletPanel._collect_prices(panel, ["btcusdt"]) is None
+    monkeypatch.setattr(wallet, "get_24hr_tickers", lambda pairs: {
+        "BTCUSDT": {"lastPrice": "30000", "priceChangePercent": "1.5", "closeTime": 1}})
+    assert WalletPanel._collect_prices(panel, ["btcusdt"]) == ["BTC"]
+
+
+def test_technical_empty_window_fails_the_job():
+    empty = SimpleNamespace(store=SimpleNamespace(window=lambda *args: np.empty((0, 6))))
+    assert TechnicalPanel._load_window(empty, "btcusdt", "1h", 100) is None
+    columns = np.ones((3, 6))
+    full = SimpleNamespace(store=SimpleNamespace(window=lambda *args: columns))
+    assert TechnicalPanel._load_window(full, "btcusdt", "1h", 100) is columns
+
+
+def test_symbol_change_waits_for_the_fetch_in_flight():
+    scheduler = RefreshScheduler()
+    fetches = []
+    scheduler.add("transactions", 1000, lambda: fetches.append(Future()) or fetches[-1],
+                  jitter=0.0)
+    scheduler._tick()
+    panel = SimpleNamespace(symbol="BTCUSDT", scheduler=scheduler)
+
+    TransactionsPanel.set_symbol(panel, "ethusdt")
+    scheduler._tick()
+    assert len(fetches) == 1
+
+    fetches[0].set_result([])
+    scheduler._tick()
+    assert len(fetches) == 2
+    assert scheduler.stats()["transactions"]["runs"] == 1
+
+
+def test_technical_symbol_change_triggers_its_job():
+    scheduler = RefreshScheduler()
+    job = scheduler.add("technical", 60000, lambda: "done", jitter=0.0)
+    scheduler._tick()
+    panel = SimpleNamespace(symbol="BTCUSDT", _columns=np.ones((3, 6)), is_running=True,
+                            scheduler=scheduler, _unsubscribe_live=lambda: None,
+                            _subscribe_live=lambda: None)
+
+    TechnicalPanel.set_symbol(panel, "ethusdt")
+    assert job.triggered
+    scheduler._tick()
+    assert job.runs == 2
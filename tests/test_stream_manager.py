@@ -0,0 +1,265 @@
+"""StreamManager against a local stand-in for Binance combined streams.
+
+The stand-in speaks just enough RFC 6455 for websocket-client: it takes
+the initial ``?streams=`` list from the URL, answers SUBSCRIBE and
+UNSUBSCRIBE requests, and pushes ``{"stream", "data"}`` frames only for
+streams the connection is subscribed to.
+"""
+import base64
+import hashlib
+import json
+import socket
+import socketserver
+import struct
+import threading
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from crypto_dashboard.utils.stream_manager import StreamManager
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_TEXT, OP_CLOSE, OP_PING, OP_PONG = 0x1, 0x8, 0x9, 0xA
+
+
+def encode_frame(opcode, data):
+    header = bytes([0x80 | opcode])
+    size = len(data)
+    if size < 126:
+        header += bytes([size])
+    elif size < 65536:
+        header += struct.pack("!BH", 126, size)
+    else:
+        header += struct.pack("!BQ", 127, size)
+    return header + data
+
+
+def read_frame(rfile):
+    head = rfile.read(2)
+    if len(head) < 2:
+        return None, b""
+    size = head[1] & 0x7F
+    if size == 126:
+        size = struct.unpack("!H", rfile.read(2))[0]
+    elif size == 127:
+        size = struct.unpack("!Q", rfile.read(8))[0]
+    mask = rfile.read(4) if head[1] & 0x80 else b"\0\0\0\0"
+    payload = rfile.read(size)
+    return head[0] & 0x0F, bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+
+
+class Connection:
+    def __init__(self, sock, path, streams):
+        self.sock = sock
+        self.path = path
+        self.streams = set(streams)
+        self.send_lock = threading.Lock()
+
+    def send(self, opcode, data):
+        with self.send_lock:
+            self.sock.sendall(encode_frame(opcode, data))
+
+
+class StreamServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StreamHandler)
+        self.lock = threading.Lock()
+        self.connections = []
+        self.requests = []
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"ws://{host}:{port}"
+
+    def live(self):
+        with self.lock:
+            return [conn for conn in self.connections if conn.sock.fileno() != -1]
+
+    def push(self, stream, data):
+        """Send one event to every connection subscribed to ``stream``."""
+        frame = json.dumps({"stream": stream, "data": data}).encode()
+        sent = 0
+        for conn in self.live():
+            if stream in conn.streams:
+                try:
+                    conn.send(OP_TEXT, frame)
+                    sent += 1
+                except OSError:
+                    pass
+        return sent
+
+    def drop(self):
+        """Cut every connection without a close handshake."""
+        for conn in self.live():
+            try:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class StreamHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request_line = self.rfile.readline().decode()
+        headers = {}
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        path = request_line.split()[1]
+        accept = base64.b64encode(hashlib.sha1(
+            (headers["sec-websocket-key"] + WS_GUID).encode()).digest()).decode()
+        self.wfile.write((
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        query = parse_qs(urlsplit(path).query).get("streams", [""])[0]
+        conn = Connection(self.request, path, filter(None, query.split("/")))
+        with self.server.lock:
+            self.server.connections.append(conn)
+        while True:
+            opcode, payload = read_frame(self.rfile)
+            if opcode is None or opcode == OP_CLOSE:
+                try:
+                    conn.send(OP_CLOSE, payload[:2])
+                except OSError:
+                    pass
+                return
+            if opcode == OP_PING:
+                conn.send(OP_PONG, payload)
+            elif opcode == OP_TEXT:
+                self.answer(conn, json.loads(payload))
+
+    def answer(self, conn, request):
+        with self.server.lock:
+            self.server.requests.append(request)
+        method, params = request.get("method"), request.get("params", [])
+        if method == "SUBSCRIBE":
+            conn.streams.update(params)
+        elif method == "UNSUBSCRIBE":
+            conn.streams.difference_update(params)
+        else:
+            reply = {"error": {"code": 2, "msg": "Invalid request"}, "id": request.get("id")}
+            conn.send(OP_TEXT, json.dumps(reply).encode())
+            return
+        conn.send(OP_TEXT, json.dumps({"result": None, "id": request.get("id")}).encode())
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def __call__(self, data):
+        self.events.append(data)
+
+
+@pytest.fixture
+def server():
+    srv = StreamServer()
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def manager(server):
+    mgr = StreamManager(base_url=server.url, reconnect_delay=0.05)
+    yield mgr
+    mgr.stop()
+
+
+def test_initial_streams_share_one_connection(server, manager):
+    ticker, trades = Recorder(), Recorder()
+    manager.subscribe("btcusdt@ticker", ticker)
+    manager.subscribe("ethusdt@aggTrade", trades)
+    assert wait_for(lambda: server.live() and manager._connected)
+
+    (conn,) = server.live()
+    assert conn.streams == {"btcusdt@ticker", "ethusdt@aggTrade"}
+    server.push("btcusdt@ticker", {"c": "30000"})
+    server.push("ethusdt@aggTrade", {"p": "2000"})
+    assert wait_for(lambda: ticker.events and trades.events)
+    assert ticker.events == [{"c": "30000"}]
+    assert trades.events == [{"p": "2000"}]
+    assert len(server.connections) == 1
+
+
+def test_subscribe_and_unsubscribe_on_the_live_socket(server, manager):
+    first = Recorder()
+    manager.subscribe("btcusdt@ticker", first)
+    assert wait_for(lambda: server.live() and manager._connected)
+
+    second = Recorder()
+    manager.subscribe("solusdt@ticker", second)
+    assert wait_for(lambda: "solusdt@ticker" in server.live()[0].streams)
+    server.push("solusdt@ticker", {"c": "100"})
+    assert wait_for(lambda: second.events == [{"c": "100"}])
+
+    manager.unsubscribe("btcusdt@ticker", first)
+    assert wait_for(lambda: "btcusdt@ticker" not in server.live()[0].streams)
+    assert server.push("btcusdt@ticker", {"c": "1"}) == 0
+    assert [r["method"] for r in server.requests] == ["SUBSCRIBE", "UNSUBSCRIBE"]
+    assert len(server.connections) == 1
+    assert manager.streams() == ["solusdt@ticker"]
+
+
+def test_shared_stream_stays_until_last_callback_leaves(server, manager):
+    a, b = Recorder(), Recorder()
+    manager.subscribe("btcusdt@ticker", a)
+    manager.subscribe("btcusdt@ticker", b)
+    assert wait_for(lambda: server.live() and manager._connected)
+
+    manager.unsubscribe("btcusdt@ticker", a)
+    server.push("btcusdt@ticker", {"c": "2"})
+    assert wait_for(lambda: b.events == [{"c": "2"}])
+    assert a.events == []
+    assert server.requests == []
+
+
+def test_reconnects_with_current_streams(server, manager):
+    ticker = Recorder()
+    manager.subscribe("btcusdt@ticker", ticker)
+    assert wait_for(lambda: server.live() and manager._connected)
+
+    server.drop()
+    assert wait_for(lambda: not manager._connected)
+    trades = Recorder()
+    manager.subscribe("ethusdt@aggTrade", trades)
+    assert wait_for(lambda: len(server.connections) == 2 and manager._connected)
+
+    conn = server.connections[-1]
+    assert wait_for(lambda: conn.streams == {"btcusdt@ticker", "ethusdt@aggTrade"})
+    server.push("ethusdt@aggTrade", {"p": "3"})
+    assert wait_for(lambda: trades.events == [{"p": "3"}])
+
+
+def test_ignores_replies_and_unknown_streams(server, manager):
+    ticker = Recorder()
+    manager.subscribe("btcusdt@ticker", ticker)
+    assert wait_for(lambda: server.live() and manager._connected)
+
+    conn = server.live()[0]
+    conn.streams.add("dogeusdt@ticker")
+    conn.send(OP_TEXT, b'{"result": null, "id": 7}')
+    conn.send(OP_TEXT, b"not json")
+    server.push("dogeusdt@ticker", {"c": "0.1"})
+    server.push("btcusdt@ticker", {"c": "4"})
+    assert wait_for(lambda: ticker.events == [{"c": "4"}])
+    assert manager.messages_received == 2